@@ -1,5 +1,6 @@
 # ruff: noqa: SLF001
 import re
+from copy import deepcopy
 from fnmatch import fnmatch
 from functools import lru_cache
 from typing import NamedTuple
@@ -25,6 +26,29 @@ def seperate_hashable_dict(d: dict):
     return hashable, non_hashable
 
 
+def copy_values(d: dict) -> dict:
+    """
+    Copies the mutable values of a dict, so that changes made to them in place
+    later on are not reflected in the copy.
+    """
+    return {k: deepcopy(v) if instance_finder(v) else v for k, v in d.items()}
+
+
+def take_snapshot(instance):
+    """
+    Keeps a copy of the field values of the instance, later saves are diffed
+    against it instead of against a re-fetched copy of the row. Mutable values
+    are copied so that changes made in place are picked up too.
+    """
+    instance._audit_log_snapshot = copy_values(
+        remove_non_member_fields(instance.__dict__)
+    )
+
+
+def get_snapshot(instance) -> dict | None:
+    return getattr(instance, "_audit_log_snapshot", None)
+
+
 def get_or_create_meta(instance):
     if not hasattr(instance._meta, "dal"):
         instance._meta.dal = MetaDataContainer()
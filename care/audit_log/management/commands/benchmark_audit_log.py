@@ -0,0 +1,71 @@
+import logging
+import statistics
+import time
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import RequestFactory, override_settings
+
+from care.audit_log.middleware import AuditLogMiddleware
+from care.users.models import State
+
+
+class Rollback(Exception):  # noqa: N818
+    pass
+
+
+class Command(BaseCommand):
+    """
+    Measures the overhead the audit log adds to loading and updating a model
+    instance during a request, with AUDIT_LOG_ENABLED on and off. Nothing is
+    written, the updates are rolled back.
+    Usage: python manage.py benchmark_audit_log --iterations 1000
+    """
+
+    help = "Benchmarks the per-save overhead of the audit log"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=1000,
+            help="Number of load and save cycles per run",
+        )
+
+    def run(self, iterations):
+        timings = []
+        try:
+            with transaction.atomic():
+                pk = State.objects.create(name="Audit Log Benchmark").pk
+                for i in range(iterations):
+                    started_at = time.perf_counter()
+                    state = State.objects.get(pk=pk)
+                    state.name = f"Audit Log Benchmark {i}"
+                    state.save()
+                    timings.append((time.perf_counter() - started_at) * 1000)
+                raise Rollback
+        except Rollback:
+            pass
+        return timings
+
+    def handle(self, *args, **options):
+        request = RequestFactory().post("/")
+        request.user = AnonymousUser()
+        # the log lines are not what is being measured
+        logging.getLogger("care.audit_log").disabled = True
+        try:
+            for enabled in (False, True):
+                with override_settings(AUDIT_LOG_ENABLED=enabled):
+                    AuditLogMiddleware.save(request)
+                    timings = self.run(options["iterations"])
+                    AuditLogMiddleware.cleanup()
+
+                percentiles = statistics.quantiles(timings, n=100)
+                self.stdout.write(
+                    f"AUDIT_LOG_ENABLED={enabled}: {len(timings)} saves, "
+                    f"mean {statistics.mean(timings):.3f}ms, "
+                    f"p50 {percentiles[49]:.3f}ms, p99 {percentiles[98]:.3f}ms"
+                )
+        finally:
+            logging.getLogger("care.audit_log").disabled = False
@@ -8,6 +8,8 @@ from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
 from django.http import HttpRequest, HttpResponse
 
+from care.audit_log.sinks import AuditRecord, audit_log_queue
+
 
 class RequestInformation(NamedTuple):
     request_id: str
@@ -77,13 +79,37 @@ class AuditLogMiddleware:
         environ = RequestInformation(*AuditLogMiddleware.thread.__dal__)
         return environ.request
 
+    @staticmethod
+    def add_record(record: AuditRecord):
+        """
+        Buffers an audit record of the current request, to be written in a
+        single batch once the response is ready.
+        """
+        if not hasattr(AuditLogMiddleware.thread, "__records__"):
+            AuditLogMiddleware.thread.__records__ = []
+        AuditLogMiddleware.thread.__records__.append(record)
+
+    @staticmethod
+    def flush():
+        records = getattr(AuditLogMiddleware.thread, "__records__", None)
+        AuditLogMiddleware.thread.__records__ = []
+        if records:
+            audit_log_queue.put(records)
+
     def __call__(self, request: HttpRequest):
-        if request.method.lower() == "get":
+        # reads are not audited, instances loaded by them are not snapshot
+        if request.method.lower() in {"get", "head"}:
             return self.get_response(request)
 
         self.save(request)
-        response: HttpResponse = self.get_response(request)
-        self.save(request, response)
+        try:
+            response: HttpResponse = self.get_response(request)
+            self.save(request, response)
+        finally:
+            # written even when the view raises, the thread serves other
+            # requests next
+            self.flush()
+            self.cleanup()
 
         current_user_str = f"{request.user.id}|{request.user}" if request.user else None
 
@@ -103,9 +129,10 @@ class AuditLogMiddleware:
     def cleanup():
         """
         Cleanup function, that should be called last. Overwrites the
-        custom __dal__ object with None, to make sure the next request
-        does not use the same object.
+        custom __dal__ object with None and drops the buffered records, to
+        make sure the next request does not use the same objects.
 
         :return: -
         """
         AuditLogMiddleware.thread.__dal__ = None
+        AuditLogMiddleware.thread.__records__ = []
@@ -1,5 +1,4 @@
 # ruff: noqa: SLF001
-import json
 import logging
 from typing import NamedTuple
 
@@ -7,19 +6,29 @@ from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
-from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.db.models.signals import (
+    post_delete,
+    post_init,
+    post_save,
+    pre_delete,
+    pre_save,
+)
 from django.dispatch import receiver
+from django.utils.timezone import now
 
 from care.audit_log.enums import Operation
 from care.audit_log.helpers import (
-    LogJsonEncoder,
+    copy_values,
     exclude_model,
     get_model_name,
     get_or_create_meta,
+    get_snapshot,
     remove_non_member_fields,
     seperate_hashable_dict,
+    take_snapshot,
 )
 from care.audit_log.middleware import AuditLogMiddleware
+from care.audit_log.sinks import AuditRecord, get_sink
 
 logger = logging.getLogger(__name__)
 
@@ -31,9 +40,57 @@ class Event(NamedTuple):
     changes: dict
 
 
+@receiver(post_init, weak=False)
+def post_init_signal(sender, instance, **kwargs) -> None:
+    if not settings.AUDIT_LOG_ENABLED:
+        return
+
+    if not AuditLogMiddleware.is_request():
+        return
+
+    if exclude_model(get_model_name(instance)):
+        return
+
+    take_snapshot(instance)
+
+
+def get_previous_values(sender, instance) -> dict | None:
+    """
+    Returns the field values of the instance as of when it was loaded or last
+    saved, None if it is not in the database yet.
+    """
+    if instance._state.adding:
+        return None
+
+    snapshot = get_snapshot(instance)
+    if snapshot is None:
+        # loaded before the request started
+        try:
+            return sender.objects.get(pk=instance.pk).__dict__
+        except ObjectDoesNotExist:
+            return None
+
+    # fields deferred when the instance was loaded
+    deferred_fields = [
+        field.attname
+        for field in sender._meta.concrete_fields
+        if field.attname in instance.__dict__ and field.attname not in snapshot
+    ]
+    if deferred_fields:
+        snapshot = {
+            **snapshot,
+            **(
+                sender._base_manager.filter(pk=instance.pk)
+                .values(*deferred_fields)
+                .first()
+                or {}
+            ),
+        }
+    return snapshot
+
+
 @receiver(pre_delete, weak=False)
 @receiver(pre_save, weak=False)
-@transaction.atomic
 def pre_save_signal(sender, instance, **kwargs) -> None:
     if not settings.AUDIT_LOG_ENABLED:
         return
@@ -51,20 +108,15 @@ def pre_save_signal(sender, instance, **kwargs) -> None:
     instance._meta.dal.event = None
 
     operation = Operation.UPDATE
-    try:
-        pre = sender.objects.get(pk=instance.pk)
-    except ObjectDoesNotExist:
-        # __dict__ is used on pre, therefore we need to create a function
-        # that uses __dict__ too, but returns nothing.
-
-        pre = lambda _: None  # noqa: E731
+    previous_values = get_previous_values(sender, instance)
+    if previous_values is None:
         operation = Operation.INSERT
 
     changes = {}
 
     if operation not in {Operation.INSERT, Operation.DELETE}:
         old, new = (
-            remove_non_member_fields(pre.__dict__),
+            remove_non_member_fields(previous_values),
             remove_non_member_fields(instance.__dict__),
         )
 
@@ -113,26 +165,27 @@ def _post_processor(instance, event: Event | None, operation: Operation):
         logger.debug("Event not received for %s. Ignoring.", operation)
         return
 
-    try:
-        if operation == Operation.DELETE:
-            changes = instance.__dict__
-            if "_state" in changes:
-                del changes["_state"]
-        else:
-            changes = json.dumps(event.changes if event else {}, cls=LogJsonEncoder)
-    except Exception:
-        logger.warning("Failed to log %s", event, exc_info=True)
-        return
-
-    logger.info(
-        "AUDIT_LOG::%s|%s|%s|%s|ID:%s|%s",
-        request_id,
-        actor,
-        operation.value,
-        model_name,
-        instance.pk,
-        changes,
+    if operation == Operation.DELETE:
+        changes = remove_non_member_fields(instance.__dict__)
+    else:
+        changes = event.changes if event else {}
+    # the record is encoded later in the sink, the instance may change by then
+    changes = copy_values(changes)
+
+    record = AuditRecord(
+        timestamp=now().isoformat(),
+        request_id=request_id,
+        actor=str(actor) if actor else None,
+        operation=operation.value,
+        model=model_name,
+        entity_id=instance.pk,
+        changes=changes,
     )
+    if not settings.AUDIT_LOG_ASYNC:
+        get_sink().emit([record])
+        return
+    # written after the response, unless the transaction is rolled back
+    transaction.on_commit(lambda: AuditLogMiddleware.add_record(record))
 
 
 @receiver(post_save, weak=False)
@@ -154,6 +207,8 @@ def post_save_signal(sender, instance, created, update_fields: frozenset, **kwar
 
     event = instance._meta.dal.event
     _post_processor(instance, event, operation)
+    # the next save is diffed against what was just saved
+    take_snapshot(instance)
 
 
 @receiver(post_delete, weak=False)
@@ -0,0 +1,146 @@
+import json
+import logging
+import os
+from functools import cache
+from pathlib import Path
+from queue import Full, Queue
+from threading import Lock, Thread
+from typing import NamedTuple
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from care.audit_log.enums import Operation
+from care.audit_log.helpers import LogJsonEncoder
+from care.utils.metrics import record_metric
+
+logger = logging.getLogger(__name__)
+
+
+class AuditRecord(NamedTuple):
+    timestamp: str
+    request_id: str
+    actor: str | None
+    operation: str
+    model: str
+    entity_id: int | str
+    changes: dict
+
+
+class AuditLogSink:
+    """
+    Writes batches of audit records, set the sink with AUDIT_LOG_SINK.
+    """
+
+    def emit(self, records: list[AuditRecord]) -> None:
+        raise NotImplementedError
+
+
+class LoggerSink(AuditLogSink):
+    """
+    Logs every record as an AUDIT_LOG:: line.
+    """
+
+    # the lines keep coming from the logger they were always logged with
+    logger = logging.getLogger("care.audit_log.receivers")
+
+    def emit(self, records):
+        for record in records:
+            try:
+                if record.operation == Operation.DELETE.value:
+                    changes = record.changes
+                else:
+                    changes = json.dumps(record.changes, cls=LogJsonEncoder)
+            except Exception:
+                logger.warning("Failed to log %s", record, exc_info=True)
+                continue
+
+            self.logger.info(
+                "AUDIT_LOG::%s|%s|%s|%s|ID:%s|%s",
+                record.request_id,
+                record.actor,
+                record.operation,
+                record.model,
+                record.entity_id,
+                changes,
+            )
+
+
+class FileSink(AuditLogSink):
+    """
+    Appends the records as JSON lines to AUDIT_LOG_FILE, a batch at a time.
+    """
+
+    def emit(self, records):
+        lines = []
+        for record in records:
+            try:
+                lines.append(json.dumps(record._asdict(), cls=LogJsonEncoder))
+            except Exception:
+                logger.warning("Failed to log %s", record, exc_info=True)
+        with Path(settings.AUDIT_LOG_FILE).open("a") as f:
+            f.write("".join(f"{line}\n" for line in lines))
+
+
+@cache
+def get_sink() -> AuditLogSink:
+    return import_string(settings.AUDIT_LOG_SINK)()
+
+
+class AuditLogQueue:
+    """
+    Hands batches of records over to the sink in a background thread, so that
+    encoding and writing them is kept out of the request. Batches are dropped
+    while the queue is full.
+    """
+
+    def __init__(self):
+        self.queue = None
+        self.pid = None
+        self.dropped = 0
+        self.lock = Lock()
+
+    def _start_worker(self):
+        # a worker is needed per process, threads do not survive a fork
+        if self.pid == os.getpid():
+            return
+        with self.lock:
+            if self.pid != os.getpid():
+                self.queue = Queue(maxsize=settings.AUDIT_LOG_QUEUE_SIZE)
+                Thread(
+                    target=self._work,
+                    args=(self.queue,),
+                    name="audit-log-sink",
+                    daemon=True,
+                ).start()
+                self.pid = os.getpid()
+
+    def _work(self, queue):
+        while True:
+            records = queue.get()
+            try:
+                get_sink().emit(records)
+            except Exception:
+                logger.exception("Failed to write %s audit log records", len(records))
+            finally:
+                queue.task_done()
+
+    def put(self, records: list[AuditRecord]):
+        self._start_worker()
+        try:
+            self.queue.put_nowait(records)
+        except Full:
+            self.dropped += len(records)
+            logger.warning("Audit log queue is full, dropped %s records", len(records))
+            record_metric("AuditLog/Dropped", len(records))
+        record_metric("AuditLog/QueueDepth", self.queue.qsize())
+
+    def join(self):
+        """
+        Waits until every queued batch has been written.
+        """
+        if self.queue is not None and self.pid == os.getpid():
+            self.queue.join()
+
+
+audit_log_queue = AuditLogQueue()
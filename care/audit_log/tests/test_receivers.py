@@ -0,0 +1,124 @@
+from unittest.mock import patch
+
+from django.contrib.auth.models import AnonymousUser
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from care.audit_log.helpers import get_snapshot
+from care.audit_log.middleware import AuditLogMiddleware
+from care.audit_log.sinks import AuditRecord, audit_log_queue
+from care.users.models import PlugConfig, State
+
+
+@override_settings(AUDIT_LOG_ENABLED=True, AUDIT_LOG_ASYNC=False)
+class AuditLogReceiversTestCase(TestCase):
+    def setUp(self) -> None:
+        request = RequestFactory().post("/")
+        request.user = AnonymousUser()
+        AuditLogMiddleware.save(request)
+        self.addCleanup(AuditLogMiddleware.cleanup)
+
+    def test_update_is_diffed_against_the_loaded_values(self):
+        state = State.objects.create(name="Kerala")
+        state = State.objects.get(pk=state.pk)
+        state.name = "Karnataka"
+
+        with (
+            self.assertLogs("care.audit_log.receivers", "INFO") as logs,
+            CaptureQueriesContext(connection) as context,
+        ):
+            state.save()
+
+        # only the UPDATE, the previous values come from the snapshot
+        self.assertEqual(len(context.captured_queries), 1)
+        self.assertIn("|update|users.State|", logs.output[0])
+        self.assertIn('"name": "Karnataka"', logs.output[0])
+
+    def test_unchanged_save_is_not_logged(self):
+        state = State.objects.create(name="Kerala")
+        state.name = "Karnataka"
+        state.save()
+
+        with self.assertNoLogs("care.audit_log.receivers", "INFO"):
+            # diffed against what was last saved
+            state.save()
+
+    @override_settings(AUDIT_LOG_ASYNC=True)
+    def test_records_are_written_in_a_batch_after_commit(self):
+        with self.assertLogs("care.audit_log.receivers", "INFO") as logs:
+            with self.captureOnCommitCallbacks(execute=True):
+                State.objects.create(name="Kerala")
+                State.objects.create(name="Karnataka")
+            AuditLogMiddleware.flush()
+            audit_log_queue.join()
+
+        self.assertEqual(len(logs.output), 2)
+        self.assertIn("|insert|users.State|", logs.output[0])
+
+    @override_settings(AUDIT_LOG_ASYNC=True)
+    def test_queued_records_keep_the_values_as_of_the_save(self):
+        config = PlugConfig.objects.create(slug="plug", meta={"version": 1})
+        config.meta = {"version": 2}
+
+        with self.assertLogs("care.audit_log.receivers", "INFO") as logs:
+            with self.captureOnCommitCallbacks(execute=True):
+                config.save()
+            # changed in place before the record is written
+            config.meta["version"] = 3
+            AuditLogMiddleware.flush()
+            audit_log_queue.join()
+
+        self.assertIn('"meta": {"version": 2}', logs.output[0])
+
+
+@override_settings(AUDIT_LOG_ENABLED=True, AUDIT_LOG_ASYNC=False)
+class AuditLogMiddlewareTestCase(TestCase):
+    def get_request(self, method):
+        request = getattr(RequestFactory(), method)("/")
+        request.user = AnonymousUser()
+        return request
+
+    def test_get_after_a_post_takes_no_snapshots(self):
+        state = State.objects.create(name="Kerala")
+        loaded = []
+
+        def get_response(request):
+            loaded.append(State.objects.get(pk=state.pk))
+            return HttpResponse()
+
+        middleware = AuditLogMiddleware(get_response)
+        middleware(self.get_request("post"))
+        middleware(self.get_request("get"))
+        middleware(self.get_request("head"))
+
+        self.assertIsNotNone(get_snapshot(loaded[0]))
+        self.assertIsNone(get_snapshot(loaded[1]))
+        self.assertIsNone(get_snapshot(loaded[2]))
+        self.assertFalse(AuditLogMiddleware.is_request())
+
+    def test_records_are_flushed_when_the_view_raises(self):
+        def get_response(request):
+            AuditLogMiddleware.add_record(record)
+            raise ValueError
+
+        record = AuditRecord(
+            timestamp="",
+            request_id="",
+            actor=None,
+            operation="insert",
+            model="users.State",
+            entity_id=1,
+            changes={},
+        )
+        middleware = AuditLogMiddleware(get_response)
+        with (
+            patch.object(audit_log_queue, "put") as put,
+            self.assertRaises(ValueError),
+        ):
+            middleware(self.get_request("post"))
+
+        put.assert_called_once_with([record])
+        self.assertFalse(AuditLogMiddleware.is_request())
+        self.assertEqual(AuditLogMiddleware.thread.__records__, [])
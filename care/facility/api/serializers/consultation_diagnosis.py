@@ -1,5 +1,7 @@
+from collections.abc import Iterable
 from typing import Any
 
+from django.db import models
 from rest_framework import serializers
 
 from care.facility.models import (
@@ -7,9 +9,25 @@ from care.facility.models import (
     ConsultationDiagnosis,
 )
 from care.facility.models.icd11_diagnosis import ICD11Diagnosis
-from care.facility.static_data.icd11 import get_icd11_diagnosis_object_by_id
+from care.facility.static_data.icd11 import get_icd11_diagnoses_objects_map
 from care.users.api.serializers.user import UserBaseMinimumSerializer
 
+ICD11_DIAGNOSES_CONTEXT_KEY = "icd11_diagnoses"
+
+
+def prefetch_icd11_diagnoses(context: dict, diagnosis_ids: Iterable[int]):
+    """
+    Resolves the ICD11 objects of the given diagnosis ids in a single lookup
+    and keeps them in the serializer context, so that diagnoses serialized
+    with this context do not look them up one by one.
+    """
+    prefetched = context.setdefault(ICD11_DIAGNOSES_CONTEXT_KEY, {})
+    missing_ids = set(diagnosis_ids) - prefetched.keys()
+    if missing_ids:
+        objects = get_icd11_diagnoses_objects_map(missing_ids)
+        for diagnosis_id in missing_ids:
+            prefetched[diagnosis_id] = objects.get(diagnosis_id)
+
 
 class ConsultationCreateDiagnosisSerializer(serializers.ModelSerializer):
     def validate_verification_status(self, value):
@@ -23,6 +41,15 @@ class ConsultationCreateDiagnosisSerializer(serializers.ModelSerializer):
         fields = ("diagnosis", "verification_status", "is_principal")
 
 
+class ConsultationDiagnosisListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        if isinstance(data, models.manager.BaseManager):
+            data = data.all()
+        data = list(data)
+        prefetch_icd11_diagnoses(self.context, (obj.diagnosis_id for obj in data))
+        return super().to_representation(data)
+
+
 class ConsultationDiagnosisSerializer(serializers.ModelSerializer):
     id = serializers.UUIDField(source="external_id", read_only=True)
     diagnosis = serializers.PrimaryKeyRelatedField(
@@ -32,10 +59,12 @@ class ConsultationDiagnosisSerializer(serializers.ModelSerializer):
     created_by = UserBaseMinimumSerializer(read_only=True)
 
     def get_diagnosis_object(self, obj):
-        return get_icd11_diagnosis_object_by_id(obj.diagnosis_id, as_dict=True)
+        prefetch_icd11_diagnoses(self.context, [obj.diagnosis_id])
+        return self.context[ICD11_DIAGNOSES_CONTEXT_KEY][obj.diagnosis_id]
 
     class Meta:
         model = ConsultationDiagnosis
+        list_serializer_class = ConsultationDiagnosisListSerializer
         exclude = (
             "consultation",
             "external_id",
@@ -7,7 +7,10 @@ from django.utils.timezone import localtime, now
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 
-from care.facility.events.handler import create_consultation_events
+from care.facility.events.handler import (
+    create_consultation_events,
+    create_consultation_events_for_new_objects,
+)
 from care.facility.models import (
     CATEGORY_CHOICES,
     COVID_CATEGORY_CHOICES,
@@ -330,3 +333,74 @@ class DailyRoundSerializer(serializers.ModelSerializer):
             msg = "Cannot create an update in the future"
             raise serializers.ValidationError(msg)
         return value
+
+
+class AutomatedDailyRoundsSerializer(serializers.Serializer):
+    """
+    Creates a batch of automated log updates of a consultation, posted by the
+    monitors at its bed. The readings are validated together and written with
+    a single insert, followed by a single insert for their events.
+    """
+
+    MAX_READINGS = 100
+
+    readings = DailyRoundSerializer(many=True, allow_empty=False)
+
+    def validate_readings(self, value):
+        if len(value) > self.MAX_READINGS:
+            msg = f"Cannot create more than {self.MAX_READINGS} readings at once"
+            raise ValidationError(msg)
+        for reading in value:
+            if reading["rounds_type"] != DailyRound.RoundsType.AUTOMATED.value:
+                msg = "Only automated readings can be created in bulk"
+                raise ValidationError(msg)
+            if "action" in reading or "consultation__review_interval" in reading:
+                msg = "Readings cannot update the action or review interval"
+                raise ValidationError(msg)
+        return value
+
+    def create(self, validated_data):
+        consultation: PatientConsultation = self.context["consultation"]
+        user = self.context["request"].user
+        # Authorisation Checks
+        if (
+            not get_home_facility_queryset(user)
+            .filter(id=consultation.facility_id)
+            .exists()
+        ):
+            raise ValidationError(
+                {"facility": "Daily Round creates are only allowed in home facility"}
+            )
+        # Authorisation Checks End
+
+        if (
+            not consultation.current_bed
+            and consultation.suggestion == SuggestionChoices.A
+        ):
+            raise ValidationError(
+                {
+                    "bed": "Patient does not have a bed assigned. Please assign a bed first"
+                }
+            )
+
+        daily_rounds = []
+        for reading in validated_data["readings"]:
+            daily_round = DailyRound(
+                **reading,
+                created_by=user,
+                last_edited_by=user,
+                created_by_telemedicine=False,
+                last_updated_by_telemedicine=False,
+            )
+            daily_round.calculate_fields()
+            daily_rounds.append(daily_round)
+
+        with transaction.atomic():
+            DailyRound.objects.bulk_create(daily_rounds)
+            if consultation.last_updated_by_telemedicine:
+                consultation.last_updated_by_telemedicine = False
+                consultation.save(update_fields=["last_updated_by_telemedicine"])
+            create_consultation_events_for_new_objects(
+                consultation.id, daily_rounds, user.id
+            )
+        return daily_rounds
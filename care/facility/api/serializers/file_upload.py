@@ -1,4 +1,5 @@
 from django.conf import settings
+from django.db.models.manager import BaseManager
 from django.utils.timezone import localtime, now
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
@@ -15,6 +16,7 @@ from care.facility.models.patient_consultation import (
 from care.facility.models.patient_sample import PatientSample
 from care.users.api.serializers.user import UserBaseMinimumSerializer
 from care.users.models import User
+from care.utils.csp.signing import get_read_signed_urls
 from care.utils.notification_handler import NotificationGenerator
 from care.utils.serializers.fields import ChoiceField
 
@@ -191,11 +193,32 @@ class FileUploadCreateSerializer(serializers.ModelSerializer):
         return file_upload
 
 
+class FileUploadSignedListSerializer(serializers.ListSerializer):
+    """
+    Signs the download urls of all the files of the list in one pass.
+    """
+
+    def to_representation(self, data):
+        files = list(data.all() if isinstance(data, BaseManager) else data)
+        self.child.read_signed_urls = get_read_signed_urls(
+            file.get_object_key() for file in files
+        )
+        return super().to_representation(files)
+
+
 class FileUploadListSerializer(serializers.ModelSerializer):
     id = serializers.UUIDField(source="external_id", read_only=True)
     uploaded_by = UserBaseMinimumSerializer(read_only=True)
     archived_by = UserBaseMinimumSerializer(read_only=True)
     extension = serializers.CharField(source="get_extension", read_only=True)
+    read_signed_url = serializers.SerializerMethodField()
+
+    read_signed_urls: dict[str, str] | None = None
+
+    def get_read_signed_url(self, obj) -> str:
+        if self.read_signed_urls is not None:
+            return self.read_signed_urls[obj.get_object_key()]
+        return obj.read_signed_url()
 
     class Meta:
         model = FileUpload
@@ -212,8 +235,10 @@ class FileUploadListSerializer(serializers.ModelSerializer):
             "created_date",
             "file_category",
             "extension",
+            "read_signed_url",
         )
         read_only_fields = ("associating_id", "name", "created_date")
+        list_serializer_class = FileUploadSignedListSerializer
 
 
 class FileUploadUpdateSerializer(serializers.ModelSerializer):
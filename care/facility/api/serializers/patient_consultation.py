@@ -2,7 +2,7 @@ from copy import copy
 from datetime import timedelta
 
 from django.conf import settings
-from django.db import transaction
+from django.db import models, transaction
 from django.utils import timezone
 from django.utils.timezone import localtime, make_aware, now
 from rest_framework import serializers
@@ -17,6 +17,7 @@ from care.facility.api.serializers.bed import (
 from care.facility.api.serializers.consultation_diagnosis import (
     ConsultationCreateDiagnosisSerializer,
     ConsultationDiagnosisSerializer,
+    prefetch_icd11_diagnoses,
 )
 from care.facility.api.serializers.daily_round import DailyRoundSerializer
 from care.facility.api.serializers.encounter_symptom import (
@@ -71,6 +72,23 @@ from care.utils.serializers.fields import ChoiceField, ExternalIdSerializerField
 MIN_ENCOUNTER_DATE = make_aware(settings.MIN_ENCOUNTER_DATE)
 
 
+class PatientConsultationListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        if isinstance(data, models.manager.BaseManager):
+            data = data.all()
+        data = list(data)
+        # looks up the diagnoses of the whole page at once
+        prefetch_icd11_diagnoses(
+            self.context,
+            (
+                diagnosis.diagnosis_id
+                for consultation in data
+                for diagnosis in consultation.diagnoses.all()
+            ),
+        )
+        return super().to_representation(data)
+
+
 class PatientConsultationSerializer(serializers.ModelSerializer):
     id = serializers.CharField(source="external_id", read_only=True)
     facility_name = serializers.CharField(source="facility.name", read_only=True)
@@ -195,6 +213,7 @@ class PatientConsultationSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = PatientConsultation
+        list_serializer_class = PatientConsultationListSerializer
         read_only_fields = (
             *TIMESTAMP_FIELDS,
             "last_updated_by_telemedicine",
@@ -1,22 +1,67 @@
+import hashlib
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db.models import Count, Max
+from django.utils.dateparse import parse_datetime
+from django.utils.http import parse_etags, quote_etag
 from django_filters import rest_framework as filters
 from drf_spectacular.utils import extend_schema
 from dry_rest_permissions.generics import DRYPermissions
-from rest_framework import mixins
+from rest_framework import mixins, status
 from rest_framework.decorators import action
-from rest_framework.exceptions import ValidationError
+from rest_framework.exceptions import PermissionDenied, ValidationError
 from rest_framework.generics import get_object_or_404
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
-from care.facility.api.serializers.daily_round import DailyRoundSerializer
+from care.facility.api.serializers.daily_round import (
+    AutomatedDailyRoundsSerializer,
+    DailyRoundSerializer,
+)
 from care.facility.api.viewsets.mixins.access import AssetUserAccessMixin
+from care.facility.models.bed import AssetBed
 from care.facility.models.daily_round import DailyRound
 from care.utils.queryset.consultation import get_consultation_queryset
 
 DailyRoundAttributes = [f.name for f in DailyRound._meta.get_fields()]  # noqa: SLF001
 
 
+def get_field_value(row, field):
+    """
+    Returns the value of a field, following dotted paths into JSON fields.
+    """
+    base_field, *path = field.split(".")
+    value = row[base_field]
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def downsample(timestamps, values, start, bucket_size):
+    """
+    Groups the values into buckets of bucket_size starting at start, and
+    returns the start of the buckets with the min, max and avg of the numeric
+    values in each of them.
+    """
+    buckets = {}
+    for timestamp, value in zip(timestamps, values, strict=True):
+        bucket = buckets.setdefault((timestamp - start) // bucket_size, [])
+        if isinstance(value, int | float | Decimal) and not isinstance(value, bool):
+            bucket.append(float(value))
+    bucket_indices = sorted(buckets)
+    aggregates = {"min": [], "max": [], "avg": []}
+    for index in bucket_indices:
+        bucket = buckets[index]
+        aggregates["min"].append(min(bucket) if bucket else None)
+        aggregates["max"].append(max(bucket) if bucket else None)
+        aggregates["avg"].append(sum(bucket) / len(bucket) if bucket else None)
+    return [start + index * bucket_size for index in bucket_indices], aggregates
+
+
 class DailyRoundFilterSet(filters.FilterSet):
     rounds_type = filters.CharFilter(method="filter_rounds_type")
     taken_at = filters.DateTimeFromToRangeFilter()
@@ -51,6 +96,8 @@ class DailyRoundsViewSet(
     FIELDS_KEY = "fields"
     MAX_FIELDS = 20
     PAGE_SIZE = 36  # One Round Per Hour
+    TIMESERIES_MAX_ROWS = 5000
+    TIMESERIES_MIN_BUCKET_SIZE = 60  # seconds
 
     def get_queryset(self):
         consultation = get_object_or_404(
@@ -69,6 +116,39 @@ class DailyRoundsViewSet(
         )
         return context
 
+    @extend_schema(
+        tags=["daily_rounds"],
+        request=AutomatedDailyRoundsSerializer,
+        responses={201: None},
+    )
+    @action(methods=["POST"], detail=False)
+    def automated(self, request, **kwargs):
+        """
+        Creates a batch of automated log updates, for monitors and ventilators
+        authenticated as the asset at the consultation's bed.
+        """
+        if not request.user.asset:
+            raise PermissionDenied
+        context = self.get_serializer_context()
+        current_bed_id = context["consultation"].current_bed_id
+        if not (
+            current_bed_id
+            and AssetBed.objects.filter(
+                asset=request.user.asset, bed__consultationbed__id=current_bed_id
+            ).exists()
+        ):
+            raise PermissionDenied
+        serializer = AutomatedDailyRoundsSerializer(data=request.data, context=context)
+        serializer.is_valid(raise_exception=True)
+        daily_rounds = serializer.save()
+        return Response(
+            {
+                "count": len(daily_rounds),
+                "ids": [daily_round.external_id for daily_round in daily_rounds],
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
     @extend_schema(tags=["daily_rounds"])
     @action(methods=["POST"], detail=False)
     def analyse(self, request, **kwargs):
@@ -128,3 +208,113 @@ class DailyRoundsViewSet(
             "page_size": self.PAGE_SIZE,
         }
         return Response(final_data)
+
+    def get_timeseries_params(self, request):
+        fields = [
+            field
+            for field in request.query_params.get("fields", "").split(",")
+            if field
+        ]
+        if not fields:
+            raise ValidationError({"fields": "Field not present"})
+        if len(fields) >= self.MAX_FIELDS:
+            raise ValidationError({"fields": f"Must be smaller than {self.MAX_FIELDS}"})
+        errors = {
+            field: "Not a valid field"
+            for field in fields
+            if field.split(".")[0] not in DailyRoundAttributes
+        }
+        if errors:
+            raise ValidationError(errors)
+
+        params = {"fields": fields}
+        for param in ("taken_at_after", "taken_at_before"):
+            value = request.query_params.get(param)
+            params[param] = value and parse_datetime(value)
+            if value and params[param] is None:
+                raise ValidationError({param: "Not a valid datetime"})
+
+        params["bucket_size"] = None
+        if bucket_size := request.query_params.get("bucket_size"):
+            try:
+                params["bucket_size"] = int(bucket_size)
+            except ValueError:
+                raise ValidationError(
+                    {"bucket_size": "Must be a number of seconds"}
+                ) from None
+            if params["bucket_size"] < self.TIMESERIES_MIN_BUCKET_SIZE:
+                raise ValidationError(
+                    {
+                        "bucket_size": f"Must be at least {self.TIMESERIES_MIN_BUCKET_SIZE} seconds"
+                    }
+                )
+        return params
+
+    @extend_schema(tags=["daily_rounds"])
+    @action(methods=["GET"], detail=False)
+    def timeseries(self, request, **kwargs):
+        """
+        Returns the requested fields of the log updates taken in a time range
+        as columns, one array per field aligned with the array of timestamps.
+        Fields can be dotted paths into JSON fields, eg. bp.systolic.
+
+        With bucket_size (in seconds), the numeric values are downsampled to
+        the min, max and avg of each bucket.
+
+        The response carries an ETag that changes whenever a log update of the
+        consultation changes, for conditional requests with If-None-Match.
+        """
+        params = self.get_timeseries_params(request)
+        queryset = self.get_queryset().filter(taken_at__isnull=False)
+
+        last_change = queryset.aggregate(
+            count=Count("id"), last_modified=Max("modified_date")
+        )
+        etag = quote_etag(
+            hashlib.md5(  # noqa: S324
+                f"{last_change['count']}:{last_change['last_modified']}:"
+                f"{request.query_params.urlencode()}".encode()
+            ).hexdigest()
+        )
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        if params["taken_at_after"]:
+            queryset = queryset.filter(taken_at__gte=params["taken_at_after"])
+        if params["taken_at_before"]:
+            queryset = queryset.filter(taken_at__lte=params["taken_at_before"])
+        base_fields = {field.split(".")[0] for field in params["fields"]}
+        rows = queryset.order_by("taken_at").values("taken_at", *base_fields)
+        if not params["bucket_size"]:
+            rows = rows[: self.TIMESERIES_MAX_ROWS + 1]
+        rows = list(rows)
+        if len(rows) > self.TIMESERIES_MAX_ROWS and not params["bucket_size"]:
+            raise ValidationError(
+                {
+                    "bucket_size": "Required for more than "
+                    f"{self.TIMESERIES_MAX_ROWS} log updates, narrow the range or downsample"
+                }
+            )
+
+        timestamps = [row["taken_at"] for row in rows]
+        columns = {
+            field: [get_field_value(row, field) for row in rows]
+            for field in params["fields"]
+        }
+        if params["bucket_size"] and timestamps:
+            bucket_size = timedelta(seconds=params["bucket_size"])
+            start = params["taken_at_after"] or timestamps[0]
+            for field, values in columns.items():
+                bucket_timestamps, columns[field] = downsample(
+                    timestamps, values, start, bucket_size
+                )
+            timestamps = bucket_timestamps
+
+        return Response(
+            {
+                "timestamps": timestamps,
+                "fields": columns,
+                "bucket_size": params["bucket_size"],
+            },
+            headers={"ETag": etag},
+        )
@@ -13,7 +13,11 @@ from care.facility.api.serializers.events import (
     NestedEventTypeSerializer,
     PatientConsultationEventDetailSerializer,
 )
-from care.facility.models.events import EventType, PatientConsultationEvent
+from care.facility.models.events import (
+    EventType,
+    PatientConsultationEvent,
+    PatientConsultationLatestEvent,
+)
 from care.utils.queryset.consultation import get_consultation_queryset
 
 
@@ -79,3 +83,20 @@ class PatientConsultationEventViewSet(ReadOnlyModelViewSet):
     def get_queryset(self):
         consultation = self.get_consultation_obj()
         return self.queryset.filter(consultation_id=consultation.id)
+
+    @extend_schema(tags=("consultation_events",))
+    @action(detail=False, methods=["GET"])
+    def latest(self, request, *args, **kwargs):
+        """
+        Returns the latest event of each type in the consultation's timeline.
+        """
+        consultation = self.get_consultation_obj()
+        queryset = self.filter_queryset(
+            self.queryset.filter(
+                id__in=PatientConsultationLatestEvent.objects.filter(
+                    consultation_id=consultation.id
+                ).values("event_id")
+            )
+        )
+        serializer = self.get_serializer(queryset, many=True)
+        return Response(serializer.data)
@@ -0,0 +1,29 @@
+from drf_spectacular.utils import extend_schema
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.viewsets import GenericViewSet
+
+from care.facility.models.file_upload import FileUpload
+from care.facility.utils.reports.exports import get_export_job_status
+
+
+class ExportJobViewSet(GenericViewSet):
+    """
+    Progress of the csv exports generated in the background, the download url
+    is returned once the export has been uploaded.
+    """
+
+    queryset = FileUpload.objects.filter(file_type=FileUpload.FileType.EXPORT.value)
+    permission_classes = (IsAuthenticated,)
+    lookup_field = "external_id"
+
+    def get_queryset(self):
+        return self.queryset.filter(uploaded_by=self.request.user)
+
+    @extend_schema(
+        description="Get the progress of an export",
+        responses={200: "Success"},
+        tags=["export"],
+    )
+    def retrieve(self, request, *args, **kwargs):
+        return Response(get_export_job_status(self.get_object()))
@@ -2,7 +2,6 @@ from django.conf import settings
 from django.shortcuts import get_object_or_404
 from django.utils.decorators import method_decorator
 from django_filters import rest_framework as filters
-from djqscsv import render_to_csv_response
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from dry_rest_permissions.generics import DRYPermissionFiltersBase, DRYPermissions
 from rest_framework import filters as drf_filters
@@ -18,13 +17,10 @@ from care.facility.api.serializers.facility import (
     FacilitySerializer,
     FacilitySpokeSerializer,
 )
-from care.facility.models import (
-    Facility,
-    FacilityCapacity,
-    FacilityPatientStatsHistory,
-    HospitalDoctors,
-)
+from care.facility.api.viewsets.mixins.export import CSVExportMixin
+from care.facility.models import Facility
 from care.facility.models.facility import FacilityHubSpoke, FacilityUser
+from care.facility.utils.reports.exports import EXPORTS, CSVExport
 from care.users.models import User
 from care.utils.file_uploads.cover_image import delete_cover_image
 from care.utils.queryset.facility import get_facility_queryset
@@ -66,7 +62,9 @@ class FacilityQSPermissions(DRYPermissionFiltersBase):
         return queryset
 
 
+@extend_schema_view(export=extend_schema(tags=["facility"]))
 class FacilityViewSet(
+    CSVExportMixin,
     mixins.CreateModelMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
@@ -124,25 +122,18 @@ class FacilityViewSet(
         self.perform_destroy(instance)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
+    def get_csv_export(self) -> CSVExport:
+        if self.FACILITY_CAPACITY_CSV_KEY in self.request.GET:
+            return EXPORTS["facility_capacity"]
+        if self.FACILITY_DOCTORS_CSV_KEY in self.request.GET:
+            return EXPORTS["facility_doctors"]
+        if self.FACILITY_TRIAGE_CSV_KEY in self.request.GET:
+            return EXPORTS["facility_triage"]
+        return EXPORTS["facility"]
+
     def list(self, request, *args, **kwargs):
         if settings.CSV_REQUEST_PARAMETER in request.GET:
-            mapping = Facility.CSV_MAPPING.copy()
-            pretty_mapping = Facility.CSV_MAKE_PRETTY.copy()
-            if self.FACILITY_CAPACITY_CSV_KEY in request.GET:
-                mapping.update(FacilityCapacity.CSV_RELATED_MAPPING.copy())
-                pretty_mapping.update(FacilityCapacity.CSV_MAKE_PRETTY.copy())
-            elif self.FACILITY_DOCTORS_CSV_KEY in request.GET:
-                mapping.update(HospitalDoctors.CSV_RELATED_MAPPING.copy())
-                pretty_mapping.update(HospitalDoctors.CSV_MAKE_PRETTY.copy())
-            elif self.FACILITY_TRIAGE_CSV_KEY in request.GET:
-                mapping.update(FacilityPatientStatsHistory.CSV_RELATED_MAPPING.copy())
-                pretty_mapping.update(
-                    FacilityPatientStatsHistory.CSV_MAKE_PRETTY.copy()
-                )
-            queryset = self.filter_queryset(self.get_queryset()).values(*mapping.keys())
-            return render_to_csv_response(
-                queryset, field_header_map=mapping, field_serializer_map=pretty_mapping
-            )
+            return self.render_csv()
 
         return super().list(request, *args, **kwargs)
 
@@ -0,0 +1,51 @@
+from django.db.models import QuerySet
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from care.facility.utils.reports.exports import CSVExport, create_export_job
+from care.utils.csv_export import render_csv_response
+
+
+class CSVExportMixin:
+    """
+    Exports the filtered list as csv, streamed in the response of the list
+    request or generated in the background by the export action.
+    """
+
+    def get_csv_export(self) -> CSVExport:
+        raise NotImplementedError
+
+    def get_csv_queryset(self) -> QuerySet:
+        return self.get_csv_export().get_queryset(
+            self.filter_queryset(self.get_queryset())
+        )
+
+    def render_csv(self):
+        export = self.get_csv_export()
+        return render_csv_response(
+            self.get_csv_queryset(),
+            field_header_map=export.field_header_map,
+            field_serializer_map=export.field_serializer_map,
+        )
+
+    @extend_schema(
+        description="Generate a csv export of the filtered list in the background",
+        responses={202: "Accepted"},
+    )
+    @action(detail=False, methods=["POST"])
+    def export(self, request, *args, **kwargs):
+        # the filters are validated before the job is queued, the worker
+        # rebuilds the queryset from the same query params
+        self.get_csv_queryset()
+        export_file = create_export_job(
+            request.user, self.get_csv_export(), request.query_params.urlencode()
+        )
+        return Response(
+            {
+                "id": export_file.external_id,
+                "detail": "Export will be generated shortly",
+            },
+            status=status.HTTP_202_ACCEPTED,
+        )
@@ -19,7 +19,6 @@ from django.db.models.functions import Coalesce, ExtractDay, Now
 from django.db.models.query import QuerySet
 from django.utils import timezone
 from django_filters import rest_framework as filters
-from djqscsv import render_to_csv_response
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from dry_rest_permissions.generics import DRYPermissionFiltersBase, DRYPermissions
 from rest_framework import filters as rest_framework_filters
@@ -49,6 +48,7 @@ from care.facility.api.serializers.patient import (
     PatientTransferSerializer,
 )
 from care.facility.api.serializers.patient_icmr import PatientICMRSerializer
+from care.facility.api.viewsets.mixins.export import CSVExportMixin
 from care.facility.api.viewsets.mixins.history import HistoryMixin
 from care.facility.events.handler import create_consultation_events
 from care.facility.models import (
@@ -78,6 +78,7 @@ from care.facility.models.patient_base import (
     NewDischargeReasonEnum,
 )
 from care.facility.models.patient_consultation import PatientConsultation
+from care.facility.utils.reports.exports import EXPORTS, CSVExport
 from care.users.models import User
 from care.utils.cache.cache_allowed_facilities import get_accessible_facilities
 from care.utils.filters.choicefilter import CareChoiceFilter
@@ -374,9 +375,12 @@ class PatientCustomOrderingFilter(BaseFilterBackend):
         return queryset
 
 
-@extend_schema_view(history=extend_schema(tags=["patient"]))
+@extend_schema_view(
+    history=extend_schema(tags=["patient"]), export=extend_schema(tags=["patient"])
+)
 class PatientViewSet(
     HistoryMixin,
+    CSVExportMixin,
     mixins.CreateModelMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
@@ -511,8 +515,13 @@ class PatientViewSet(
             return PatientTransferSerializer
         return self.serializer_class
 
+    def get_csv_export(self) -> CSVExport:
+        return EXPORTS["patient"]
+
     def filter_queryset(self, queryset: QuerySet) -> QuerySet:
-        if self.action == "list" and settings.CSV_REQUEST_PARAMETER in self.request.GET:
+        if self.action == "export" or (
+            self.action == "list" and settings.CSV_REQUEST_PARAMETER in self.request.GET
+        ):
             for backend in (PatientDRYFilter, filters.DjangoFilterBackend):
                 queryset = backend().filter_queryset(self.request, queryset, self)
             is_active = self.request.GET.get("is_active", "False") == "True"
@@ -572,16 +581,7 @@ class PatientViewSet(
                     }
                 )
             # End Date Limiting Validation
-            queryset = (
-                self.filter_queryset(self.get_queryset())
-                .annotate(**PatientRegistration.CSV_ANNOTATE_FIELDS)
-                .values(*PatientRegistration.CSV_MAPPING.keys())
-            )
-            return render_to_csv_response(
-                queryset,
-                field_header_map=PatientRegistration.CSV_MAPPING,
-                field_serializer_map=PatientRegistration.CSV_MAKE_PRETTY,
-            )
+            return self.render_csv()
 
         return super().list(request, *args, **kwargs)
 
@@ -94,6 +94,8 @@ class PatientConsultationViewSet(
                 "current_bed__bed",
                 "current_bed__assets",
                 "current_bed__assets__current_location",
+                "diagnoses",
+                "diagnoses__created_by",
             )
         if self.request.user.is_superuser:
             return queryset
@@ -3,8 +3,7 @@ from django.db.models.query import QuerySet
 from django.db.models.query_utils import Q
 from django.utils.timezone import localtime, now
 from django_filters import rest_framework as filters
-from djqscsv import render_to_csv_response
-from drf_spectacular.utils import extend_schema
+from drf_spectacular.utils import extend_schema, extend_schema_view
 from dry_rest_permissions.generics import DRYPermissionFiltersBase, DRYPermissions
 from rest_framework import filters as rest_framework_filters
 from rest_framework import mixins, status
@@ -23,6 +22,7 @@ from care.facility.api.serializers.shifting import (
     ShiftingSerializer,
     has_facility_permission,
 )
+from care.facility.api.viewsets.mixins.export import CSVExportMixin
 from care.facility.models import (
     BREATHLESSNESS_CHOICES,
     SHIFTING_STATUS_CHOICES,
@@ -36,6 +36,7 @@ from care.facility.models.patient_base import (
     DISEASE_STATUS_DICT,
     NewDischargeReasonEnum,
 )
+from care.facility.utils.reports.exports import EXPORTS, CSVExport
 from care.utils.cache.cache_allowed_facilities import get_accessible_facilities
 from care.utils.filters.choicefilter import CareChoiceFilter
 from care.utils.queryset.shifting import get_shifting_queryset
@@ -88,7 +89,9 @@ class ShiftingFilterSet(filters.FilterSet):
     is_antenatal = filters.BooleanFilter(field_name="patient__is_antenatal")
 
 
+@extend_schema_view(export=extend_schema(tags=["shift"]))
 class ShiftingViewSet(
+    CSVExportMixin,
     mixins.CreateModelMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
@@ -199,18 +202,12 @@ class ShiftingViewSet(
             {"error": "Invalid Request"}, status=status.HTTP_400_BAD_REQUEST
         )
 
+    def get_csv_export(self) -> CSVExport:
+        return EXPORTS["shifting"]
+
     def list(self, request, *args, **kwargs):
         if settings.CSV_REQUEST_PARAMETER in request.GET:
-            queryset = (
-                self.filter_queryset(self.get_queryset())
-                .annotate(**ShiftingRequest.CSV_ANNOTATE_FIELDS)
-                .values(*ShiftingRequest.CSV_MAPPING.keys())
-            )
-            return render_to_csv_response(
-                queryset,
-                field_header_map=ShiftingRequest.CSV_MAPPING,
-                field_serializer_map=ShiftingRequest.CSV_MAKE_PRETTY,
-            )
+            return self.render_csv()
         return super().list(request, *args, **kwargs)
 
 
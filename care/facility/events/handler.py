@@ -1,17 +1,74 @@
 from contextlib import suppress
 from datetime import datetime
 
+from django.core.cache import cache
 from django.core.exceptions import FieldDoesNotExist
 from django.db import transaction
-from django.db.models import Model
+from django.db.models import Model, Q
 from django.db.models.query import QuerySet
 from django.utils.timezone import now
 
-from care.facility.models.events import ChangeType, EventType, PatientConsultationEvent
+from care.facility.models.events import (
+    ChangeType,
+    EventType,
+    PatientConsultationEvent,
+    PatientConsultationLatestEvent,
+)
+from care.facility.models.patient_consultation import PatientConsultation
 from care.utils.event_utils import get_changed_fields, serialize_field
 
+# bumped whenever the event types change, so that every process reloads them
+EVENT_TYPES_VERSION_CACHE_KEY = "event_types:version"
 
-def create_consultation_event_entry(
+# model name -> (version, [(event type id, fields)])
+_event_groups: dict[str, tuple[int, list[tuple[int, list[str]]]]] = {}
+
+
+def get_event_groups(model_name: str) -> list[tuple[int, list[str]]]:
+    """
+    Returns the active event types of a model with their fields, cached in
+    process until the event types change. Only committed reads are cached, so
+    event types that are rolled back are never served.
+    """
+    version = cache.get(EVENT_TYPES_VERSION_CACHE_KEY, 0)
+    cached = _event_groups.get(model_name)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    groups = list(
+        EventType.objects.filter(
+            model=model_name, fields__len__gt=0, is_active=True
+        ).values_list("id", "fields")
+    )
+
+    def cache_groups():
+        _event_groups[model_name] = (version, groups)
+
+    transaction.on_commit(cache_groups)
+    return groups
+
+
+def invalidate_event_groups():
+    _event_groups.clear()
+    try:
+        cache.incr(EVENT_TYPES_VERSION_CACHE_KEY)
+    except ValueError:
+        cache.set(EVENT_TYPES_VERSION_CACHE_KEY, 1, timeout=None)
+
+
+def serialize_event_group(object_instance: Model, group_fields: list[str]):
+    """
+    Returns the value of an event of the group, None when all its fields are empty.
+    """
+    value = {}
+    for field in group_fields:
+        with suppress(FieldDoesNotExist):
+            value[field] = serialize_field(object_instance, field)
+    if all(not v for v in value.values()):
+        return None
+    return value
+
+
+def build_consultation_events(
     consultation_id: int,
     object_instance: Model,
     caused_by: int,
@@ -19,7 +76,12 @@ def create_consultation_event_entry(
     taken_at: datetime,
     old_instance: Model | None = None,
     fields_to_store: set[str] | None = None,
-):
+    event_groups: dict[str, list[tuple[int, list[str]]]] | None = None,
+) -> list[PatientConsultationEvent]:
+    """
+    Builds the events of an object without saving them. Pass the same
+    event_groups dict for every object of a call to read the event types once.
+    """
     change_type = ChangeType.UPDATED if old_instance else ChangeType.CREATED
 
     fields: set[str] = (
@@ -30,29 +92,20 @@ def create_consultation_event_entry(
 
     fields_to_store = fields_to_store & fields if fields_to_store else fields
 
-    batch = []
-    groups = EventType.objects.filter(
-        model=object_instance.__class__.__name__, fields__len__gt=0, is_active=True
-    ).values_list("id", "fields")
-    for group_id, group_fields in groups:
-        if fields_to_store & {field.split("__", 1)[0] for field in group_fields}:
-            value = {}
-            for field in group_fields:
-                with suppress(FieldDoesNotExist):
-                    value[field] = serialize_field(object_instance, field)
+    model_name = object_instance.__class__.__name__
+    if event_groups is None:
+        event_groups = {}
+    if model_name not in event_groups:
+        event_groups[model_name] = get_event_groups(model_name)
 
-            if all(not v for v in value.values()):
+    events = []
+    for group_id, group_fields in event_groups[model_name]:
+        if fields_to_store & {field.split("__", 1)[0] for field in group_fields}:
+            value = serialize_event_group(object_instance, group_fields)
+            if value is None:
                 continue
 
-            PatientConsultationEvent.objects.select_for_update().filter(
-                consultation_id=consultation_id,
-                event_type=group_id,
-                is_latest=True,
-                object_model=object_instance.__class__.__name__,
-                object_id=object_instance.id,
-                taken_at__lt=taken_at,
-            ).update(is_latest=False)
-            batch.append(
+            events.append(
                 PatientConsultationEvent(
                     consultation_id=consultation_id,
                     caused_by_id=caused_by,
@@ -70,9 +123,108 @@ def create_consultation_event_entry(
                     },
                 )
             )
+    return events
+
+
+def write_consultation_events(
+    consultation_id: int,
+    events: list[PatientConsultationEvent],
+    taken_at: datetime | None = None,
+):
+    """
+    Inserts the events, marking the earlier events of the same objects and
+    event types as no longer latest with a single update. Pass taken_at=None
+    for events of new objects, which have no earlier events.
+    """
+    if not events:
+        return 0
+
+    if taken_at is not None:
+        event_types = {}
+        for event in events:
+            event_types.setdefault((event.object_model, event.object_id), set()).add(
+                event.event_type_id
+            )
+        superseded = Q()
+        for (object_model, object_id), event_type_ids in event_types.items():
+            superseded |= Q(
+                object_model=object_model,
+                object_id=object_id,
+                event_type__in=event_type_ids,
+            )
+        PatientConsultationEvent.objects.filter(
+            superseded,
+            consultation_id=consultation_id,
+            is_latest=True,
+            taken_at__lt=taken_at,
+        ).update(is_latest=False)
+
+    PatientConsultationEvent.objects.bulk_create(events)
+    update_latest_events(consultation_id, events)
+    return len(events)
+
 
-    PatientConsultationEvent.objects.bulk_create(batch)
-    return len(batch)
+def update_latest_events(consultation_id: int, events: list[PatientConsultationEvent]):
+    """
+    Points the latest events of the consultation to the given events that
+    were taken after them. Writers of the same consultation are serialized on
+    the consultation row, as the upsert itself overwrites unconditionally when
+    two writers insert the first latest event of a type at the same time.
+    """
+    candidates: dict[int, PatientConsultationEvent] = {}
+    for event in events:
+        candidate = candidates.get(event.event_type_id)
+        if candidate is None or event.taken_at >= candidate.taken_at:
+            candidates[event.event_type_id] = event
+
+    with transaction.atomic():
+        list(
+            PatientConsultation.objects.select_for_update()
+            .filter(id=consultation_id)
+            .values_list("id", flat=True)
+        )
+        current = dict(
+            PatientConsultationLatestEvent.objects.filter(
+                consultation_id=consultation_id, event_type__in=candidates
+            ).values_list("event_type_id", "taken_at")
+        )
+        PatientConsultationLatestEvent.objects.bulk_create(
+            [
+                PatientConsultationLatestEvent(
+                    consultation_id=consultation_id,
+                    event_type_id=event_type_id,
+                    event_id=event.id,
+                    taken_at=event.taken_at,
+                )
+                for event_type_id, event in candidates.items()
+                if event_type_id not in current
+                or event.taken_at >= current[event_type_id]
+            ],
+            update_conflicts=True,
+            unique_fields=["consultation", "event_type"],
+            update_fields=["event", "taken_at"],
+        )
+
+
+def create_consultation_event_entry(
+    consultation_id: int,
+    object_instance: Model,
+    caused_by: int,
+    created_date: datetime,
+    taken_at: datetime,
+    old_instance: Model | None = None,
+    fields_to_store: set[str] | None = None,
+):
+    events = build_consultation_events(
+        consultation_id,
+        object_instance,
+        caused_by,
+        created_date,
+        taken_at,
+        old_instance,
+        fields_to_store,
+    )
+    return write_consultation_events(consultation_id, events, taken_at)
 
 
 def create_consultation_events(
@@ -90,27 +242,66 @@ def create_consultation_events(
     if taken_at is None:
         taken_at = created_date
 
-    with transaction.atomic():
-        if isinstance(objects, QuerySet | list | tuple):
-            if old is not None:
-                msg = "diff is not available when objects is a list or queryset"
-                raise ValueError(msg)
-            for obj in objects:
-                create_consultation_event_entry(
+    fields_to_store = set(fields_to_store) if fields_to_store else None
+
+    if isinstance(objects, QuerySet | list | tuple):
+        if old is not None:
+            msg = "diff is not available when objects is a list or queryset"
+            raise ValueError(msg)
+        events = []
+        event_groups = {}
+        for obj in objects:
+            events.extend(
+                build_consultation_events(
                     consultation_id,
                     obj,
                     caused_by,
                     created_date,
                     taken_at,
-                    fields_to_store=set(fields_to_store) if fields_to_store else None,
+                    fields_to_store=fields_to_store,
+                    event_groups=event_groups,
                 )
-        else:
-            create_consultation_event_entry(
+            )
+    else:
+        events = build_consultation_events(
+            consultation_id,
+            objects,
+            caused_by,
+            created_date,
+            taken_at,
+            old,
+            fields_to_store=fields_to_store,
+        )
+
+    with transaction.atomic():
+        write_consultation_events(consultation_id, events, taken_at)
+
+
+def create_consultation_events_for_new_objects(
+    consultation_id: int,
+    objects: list[Model],
+    caused_by: int,
+    created_date: datetime | None = None,
+):
+    """
+    Creates the events of objects that have just been created, each taken at
+    its own taken_at, with a single insert for the whole batch. The objects
+    are new, so there are no earlier events of theirs to mark as not latest.
+    """
+    if created_date is None:
+        created_date = now()
+
+    events = []
+    event_groups = {}
+    for obj in objects:
+        events.extend(
+            build_consultation_events(
                 consultation_id,
-                objects,
+                obj,
                 caused_by,
                 created_date,
-                taken_at,
-                old,
-                fields_to_store=set(fields_to_store) if fields_to_store else None,
+                getattr(obj, "taken_at", None) or created_date,
+                event_groups=event_groups,
             )
+        )
+    return write_consultation_events(consultation_id, events)
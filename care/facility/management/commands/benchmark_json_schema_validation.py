@@ -0,0 +1,97 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+
+from care.facility.models import DailyRound
+from care.utils.models.validators import JSONFieldSchemaValidator
+
+# a log update of a patient in the icu, with every schema validated field filled
+DAILY_ROUND_PAYLOAD = {
+    "bp": {"systolic": 128, "diastolic": 84},
+    "pain_scale_enhanced": [
+        {"region": "AnteriorAbdomen", "scale": 6, "description": "Post operative"},
+        {"region": "PosteriorLeftLeg", "scale": 3, "description": ""},
+    ],
+    "infusions": [
+        {"name": "Noradrenalin", "quantity": 12.5},
+        {"name": "Vasopressin", "quantity": 2},
+    ],
+    "iv_fluids": [{"name": "RL", "quantity": 500}, {"name": "NS", "quantity": 250}],
+    "feeds": [{"name": "Ryles Tube", "quantity": 200}],
+    "output": [
+        {"name": "Urine", "quantity": 450},
+        {"name": "Abdominal Drain", "quantity": 60},
+    ],
+    "pressure_sore": [
+        {
+            "region": "PosteriorAbdomen",
+            "length": 2.5,
+            "width": 1.5,
+            "exudate_amount": "Light",
+            "tissue_type": "Granulation",
+            "description": "Healing",
+            "push_score": 7,
+            "scale": 2,
+        }
+    ],
+    "nursing": [
+        {"procedure": "oral_care", "description": "Done"},
+        {"procedure": "positioning", "description": "Every two hours"},
+        {"procedure": "catheter_care", "description": ""},
+    ],
+    "meta": {"dialysis": False},
+}
+
+
+class Command(BaseCommand):
+    """
+    Measures the time spent validating the json fields of a log update against
+    their schemas, with a validator built for every call and with the cached
+    validators of the fields.
+    Usage: python manage.py benchmark_json_schema_validation --iterations 1000
+    """
+
+    help = "Benchmarks the json schema validation of a daily round save"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=1000,
+            help="Number of log updates validated per run",
+        )
+
+    def get_validators(self):
+        validators = []
+        for field_name, value in DAILY_ROUND_PAYLOAD.items():
+            for validator in DailyRound._meta.get_field(field_name).validators:  # noqa: SLF001
+                if isinstance(validator, JSONFieldSchemaValidator):
+                    validators.append((validator, value))
+        return validators
+
+    def run(self, iterations, validate):
+        validators = self.get_validators()
+        timings = []
+        for _ in range(iterations):
+            started_at = time.perf_counter()
+            for validator, value in validators:
+                validate(validator, value)
+            timings.append((time.perf_counter() - started_at) * 1000)
+        return timings
+
+    def handle(self, *args, **options):
+        runs = {
+            "uncached": lambda validator, value: list(
+                validator.schema_validator_class(validator.schema).iter_errors(value)
+            ),
+            "cached": lambda validator, value: validator(value),
+        }
+        for name, validate in runs.items():
+            timings = self.run(options["iterations"], validate)
+            percentiles = statistics.quantiles(timings, n=100)
+            self.stdout.write(
+                f"{name}: {len(timings)} saves, "
+                f"mean {statistics.mean(timings):.3f}ms, "
+                f"p50 {percentiles[49]:.3f}ms, p99 {percentiles[98]:.3f}ms"
+            )
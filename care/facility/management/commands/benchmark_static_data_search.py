@@ -0,0 +1,74 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+from care.facility.static_data.icd11 import search_icd11_diagnoses
+from care.facility.static_data.medibase import search_medibase_medicines
+
+ICD11_QUERIES = [
+    "Cholera",
+    "Haemorrhage rectum",
+    "acute radiodermatitis",
+    "CA22.Z",
+    "chronic obstructive pulmonary",
+]
+MEDIBASE_QUERIES = ["paracetamol", "dolo", "panadol paracetamol", "amoxicillin"]
+BACKENDS = ["redis", "memory"]
+
+
+def keystrokes(query):
+    return [query[:i] for i in range(1, len(query) + 1) if not query[i - 1].isspace()]
+
+
+class Command(BaseCommand):
+    """
+    Compares the search latency of the static data search backends, replaying
+    the queries sent while typing a few common searches.
+    Usage: python manage.py benchmark_static_data_search --iterations 20
+    """
+
+    help = "Benchmarks ICD11 and Medibase search with the redis and memory backends"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=10,
+            help="Times every keystroke query is replayed per backend",
+        )
+
+    def handle(self, *args, **options):
+        searches = {
+            "ICD11": (
+                lambda query: search_icd11_diagnoses(query, 20),
+                ICD11_QUERIES,
+            ),
+            "Medibase": (
+                lambda query: search_medibase_medicines(query, None, 30),
+                MEDIBASE_QUERIES,
+            ),
+        }
+        for name, (search, typed_queries) in searches.items():
+            queries = [
+                query
+                for typed_query in typed_queries
+                for query in keystrokes(typed_query)
+            ]
+            for backend in BACKENDS:
+                with override_settings(STATIC_DATA_SEARCH_BACKEND=backend):
+                    # the first search builds the in-memory index
+                    search(queries[0])
+                    timings = []
+                    for _ in range(options["iterations"]):
+                        for query in queries:
+                            started_at = time.perf_counter()
+                            search(query)
+                            timings.append((time.perf_counter() - started_at) * 1000)
+
+                percentiles = statistics.quantiles(timings, n=100)
+                self.stdout.write(
+                    f"{name} {backend}: {len(timings)} searches, "
+                    f"p50 {percentiles[49]:.2f}ms, p99 {percentiles[98]:.2f}ms"
+                )
@@ -2,6 +2,7 @@ from typing import TypedDict
 
 from django.core.management import BaseCommand
 
+from care.facility.events.handler import invalidate_event_groups
 from care.facility.models.events import EventType
 
 
@@ -298,5 +299,7 @@ class Command(BaseCommand):
         )
 
         self.create_objects(self.consultation_event_types)
+        # the deactivated event types are updated without signals
+        invalidate_event_groups()
 
         self.stdout.write(self.style.SUCCESS("OK"))
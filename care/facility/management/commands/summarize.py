@@ -1,12 +1,6 @@
 from django.core.management.base import BaseCommand
 
-from care.facility.utils.summarization.district.patient_summary import (
-    district_patient_summary,
-)
-from care.facility.utils.summarization.facility_capacity import (
-    facility_capacity_summary,
-)
-from care.facility.utils.summarization.patient_summary import patient_summary
+from care.facility.utils.summarization.incremental import SUMMARIES, run_summary
 
 
 class Command(BaseCommand):
@@ -16,10 +10,21 @@ class Command(BaseCommand):
 
     help = "Force Create Summary Objects"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--summary",
+            action="append",
+            dest="summaries",
+            choices=SUMMARIES.keys(),
+            help="Summary to rebuild, can be repeated; defaults to all of them",
+        )
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Only recompute what changed since the last run",
+        )
+
     def handle(self, *args, **options):
-        patient_summary()
-        self.stdout.write("Patients Summarised")
-        facility_capacity_summary()
-        self.stdout.write("Capacity Summarised")
-        district_patient_summary()
-        self.stdout.write("District Wise Patient Summarised")
+        for summary in options["summaries"] or SUMMARIES:
+            run_summary(summary, incremental=options["incremental"])
+            self.stdout.write(f"{summary} Summarised")
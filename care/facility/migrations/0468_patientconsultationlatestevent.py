@@ -0,0 +1,95 @@
+# Generated by Django 5.1.1 on 2026-10-18 10:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+BATCH_SIZE = 2000
+
+
+def populate_latest_events(apps, schema_editor):
+    PatientConsultationEvent = apps.get_model("facility", "PatientConsultationEvent")
+    PatientConsultationLatestEvent = apps.get_model(
+        "facility", "PatientConsultationLatestEvent"
+    )
+
+    latest_events = (
+        PatientConsultationEvent.objects.order_by(
+            "consultation_id", "event_type_id", "-taken_at", "-id"
+        )
+        .distinct("consultation_id", "event_type_id")
+        .values_list("consultation_id", "event_type_id", "id", "taken_at")
+    )
+    batch = []
+    for consultation_id, event_type_id, event_id, taken_at in latest_events.iterator(
+        chunk_size=BATCH_SIZE
+    ):
+        batch.append(
+            PatientConsultationLatestEvent(
+                consultation_id=consultation_id,
+                event_type_id=event_type_id,
+                event_id=event_id,
+                taken_at=taken_at,
+            )
+        )
+        if len(batch) >= BATCH_SIZE:
+            PatientConsultationLatestEvent.objects.bulk_create(batch)
+            batch = []
+    PatientConsultationLatestEvent.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("facility", "0467_alter_hospitaldoctors_area"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PatientConsultationLatestEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("taken_at", models.DateTimeField()),
+                (
+                    "consultation",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name="latest_events",
+                        to="facility.patientconsultation",
+                    ),
+                ),
+                (
+                    "event",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="facility.patientconsultationevent",
+                    ),
+                ),
+                (
+                    "event_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.PROTECT,
+                        to="facility.eventtype",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("consultation", "event_type"),
+                        name="unique_consultation_latest_event",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(
+            populate_latest_events, reverse_code=migrations.RunPython.noop
+        ),
+    ]
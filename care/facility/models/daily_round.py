@@ -22,6 +22,9 @@ from care.facility.models.json_schema.daily_round import (
     PAIN_SCALE_ENHANCED,
     PRESSURE_SORE,
 )
+from care.facility.models.mixins.permissions.consultation import (
+    has_consultation_read_access,
+)
 from care.facility.models.patient_consultation import PatientConsultation
 from care.users.models import User
 from care.utils.models.validators import JSONFieldSchemaValidator
@@ -547,8 +550,10 @@ class DailyRound(PatientBaseModel):
 
         return list(map(set_push_score, self.pressure_sore))
 
-    def save(self, *args, **kwargs):
-        # Calculate all automated columns and populate them
+    def calculate_fields(self):
+        """
+        Calculates all automated columns and populates them.
+        """
         if (
             self.glasgow_eye_open is not None
             and self.glasgow_motor_response is not None
@@ -571,6 +576,8 @@ class DailyRound(PatientBaseModel):
         if self.output is not None:
             self.total_output_calculated = sum([x["quantity"] for x in self.output])
 
+    def save(self, *args, **kwargs):
+        self.calculate_fields()
         super().save(*args, **kwargs)
 
     @staticmethod
@@ -578,25 +585,11 @@ class DailyRound(PatientBaseModel):
         if request.user.user_type < User.TYPE_VALUE_MAP["NurseReadOnly"]:
             return False
 
-        consultation = get_object_or_404(
-            PatientConsultation,
+        consultation_id = get_object_or_404(
+            PatientConsultation.objects.values_list("id", flat=True),
             external_id=request.parser_context["kwargs"]["consultation_external_id"],
         )
-        return request.user.is_superuser or (
-            (request.user in consultation.patient.facility.users.all())
-            or (
-                request.user
-                in (consultation.assigned_to, consultation.patient.assigned_to)
-            )
-            or (
-                request.user.user_type >= User.TYPE_VALUE_MAP["DistrictLabAdmin"]
-                and (request.user.district == consultation.patient.facility.district)
-            )
-            or (
-                request.user.user_type >= User.TYPE_VALUE_MAP["StateLabAdmin"]
-                and (request.user.state == consultation.patient.facility.state)
-            )
-        )
+        return has_consultation_read_access(request.user, consultation_id)
 
     @staticmethod
     def has_write_permission(request):
@@ -609,39 +602,15 @@ class DailyRound(PatientBaseModel):
     def has_analyse_permission(request):
         return DailyRound.has_read_permission(request)
 
+    @staticmethod
+    def has_timeseries_permission(request):
+        return DailyRound.has_read_permission(request)
+
     def has_object_read_permission(self, request):
         if request.user.user_type < User.TYPE_VALUE_MAP["NurseReadOnly"]:
             return False
 
-        return (
-            request.user.is_superuser
-            or (
-                self.consultation.patient.facility
-                and request.user in self.consultation.patient.facility.users.all()
-            )
-            or (
-                request.user
-                in (
-                    self.consultation.assigned_to,
-                    self.consultation.patient.assigned_to,
-                )
-            )
-            or (
-                request.user.user_type >= User.TYPE_VALUE_MAP["DistrictLabAdmin"]
-                and (
-                    self.consultation.patient.facility
-                    and request.user.district
-                    == self.consultation.patient.facility.district
-                )
-            )
-            or (
-                request.user.user_type >= User.TYPE_VALUE_MAP["StateLabAdmin"]
-                and (
-                    self.consultation.patient.facility
-                    and request.user.state == self.consultation.patient.facility.state
-                )
-            )
-        )
+        return has_consultation_read_access(request.user, self.consultation_id)
 
     def has_object_write_permission(self, request):
         return (
@@ -74,3 +74,33 @@ class PatientConsultationEvent(models.Model):
 
     def __str__(self) -> str:
         return f"{self.id} - {self.consultation_id} - {self.event_type} - {self.change_type}"
+
+
+class PatientConsultationLatestEvent(models.Model):
+    """
+    The latest event of each type in a consultation's timeline, kept up to
+    date by the event handler so that the current state of a consultation is
+    read without going through its full history.
+    """
+
+    consultation = models.ForeignKey(
+        "PatientConsultation",
+        on_delete=models.PROTECT,
+        related_name="latest_events",
+    )
+    event_type = models.ForeignKey(EventType, on_delete=models.PROTECT)
+    event = models.ForeignKey(
+        PatientConsultationEvent, on_delete=models.CASCADE, related_name="+"
+    )
+    taken_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=("consultation", "event_type"),
+                name="unique_consultation_latest_event",
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.consultation_id} - {self.event_type_id} - {self.event_id}"
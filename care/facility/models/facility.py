@@ -16,6 +16,7 @@ from care.facility.models.mixins.permissions.facility import (
     FacilityRelatedPermissionMixin,
 )
 from care.users.models import District, LocalBody, State, Ward
+from care.utils.csv_export import ChoiceLookup
 from care.utils.models.base import BaseModel
 from care.utils.models.validators import mobile_or_landline_number_validator
 
@@ -333,7 +334,7 @@ class Facility(FacilityBaseModel, FacilityPermissionMixin):
         "phone_number": "Phone Number",
     }
 
-    CSV_MAKE_PRETTY = {"facility_type": (lambda x: REVERSE_FACILITY_TYPES[x])}
+    CSV_MAKE_PRETTY = {"facility_type": ChoiceLookup(REVERSE_FACILITY_TYPES)}
 
 
 class FacilityHubSpoke(BaseModel, FacilityRelatedPermissionMixin):
@@ -441,7 +442,7 @@ class HospitalDoctors(FacilityBaseModel, FacilityRelatedPermissionMixin):
         "hospitaldoctors__count": "Doctors Count",
     }
 
-    CSV_MAKE_PRETTY = {"hospitaldoctors__area": (lambda x: REVERSE_DOCTOR_TYPES[x])}
+    CSV_MAKE_PRETTY = {"hospitaldoctors__area": ChoiceLookup(REVERSE_DOCTOR_TYPES)}
 
 
 class FacilityCapacity(FacilityBaseModel, FacilityRelatedPermissionMixin):
@@ -476,7 +477,7 @@ class FacilityCapacity(FacilityBaseModel, FacilityRelatedPermissionMixin):
     }
 
     CSV_MAKE_PRETTY = {
-        "facilitycapacity__room_type": (lambda x: REVERSE_ROOM_TYPES[x]),
+        "facilitycapacity__room_type": ChoiceLookup(REVERSE_ROOM_TYPES),
         "facilitycapacity__modified_date": (lambda x: x.strftime("%d-%m-%Y")),
     }
 
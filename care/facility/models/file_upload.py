@@ -2,11 +2,11 @@ import time
 import uuid
 from uuid import uuid4
 
-import boto3
 from django.contrib.auth import get_user_model
 from django.db import models
 
-from care.utils.csp.config import BucketType, get_client_config
+from care.utils.csp.config import BucketType, get_client
+from care.utils.csp.signing import get_read_signed_url
 from care.utils.models.base import BaseManager
 
 User = get_user_model()
@@ -64,15 +64,14 @@ class BaseFileUpload(models.Model):
         parts = self.internal_name.split(".")
         return f".{parts[-1]}" if len(parts) > 1 else ""
 
+    def get_object_key(self):
+        return f"{self.FileType(self.file_type).name}/{self.internal_name}"
+
     def signed_url(
         self, duration=60 * 60, mime_type=None, bucket_type=BucketType.PATIENT
     ):
-        config, bucket_name = get_client_config(bucket_type, external=True)
-        s3 = boto3.client("s3", **config)
-        params = {
-            "Bucket": bucket_name,
-            "Key": f"{self.FileType(self.file_type).name}/{self.internal_name}",
-        }
+        s3, bucket_name = get_client(bucket_type, external=True)
+        params = {"Bucket": bucket_name, "Key": self.get_object_key()}
         if mime_type:
             params["ContentType"] = mime_type
         return s3.generate_presigned_url(
@@ -82,33 +81,22 @@ class BaseFileUpload(models.Model):
         )
 
     def read_signed_url(self, duration=60 * 60, bucket_type=BucketType.PATIENT):
-        config, bucket_name = get_client_config(bucket_type, external=True)
-        s3 = boto3.client("s3", **config)
-        return s3.generate_presigned_url(
-            "get_object",
-            Params={
-                "Bucket": bucket_name,
-                "Key": f"{self.FileType(self.file_type).name}/{self.internal_name}",
-            },
-            ExpiresIn=duration,  # seconds
-        )
+        return get_read_signed_url(self.get_object_key(), duration, bucket_type)
 
     def put_object(self, file, bucket_type=BucketType.PATIENT, **kwargs):
-        config, bucket_name = get_client_config(bucket_type)
-        s3 = boto3.client("s3", **config)
+        s3, bucket_name = get_client(bucket_type)
         return s3.put_object(
             Body=file,
             Bucket=bucket_name,
-            Key=f"{self.FileType(self.file_type).name}/{self.internal_name}",
+            Key=self.get_object_key(),
             **kwargs,
         )
 
     def get_object(self, bucket_type=BucketType.PATIENT, **kwargs):
-        config, bucket_name = get_client_config(bucket_type)
-        s3 = boto3.client("s3", **config)
+        s3, bucket_name = get_client(bucket_type)
         return s3.get_object(
             Bucket=bucket_name,
-            Key=f"{self.FileType(self.file_type).name}/{self.internal_name}",
+            Key=self.get_object_key(),
             **kwargs,
         )
 
@@ -138,6 +126,7 @@ class FileUpload(BaseFileUpload):
         COMMUNICATION = 6, "COMMUNICATION"
         CONSENT_RECORD = 7, "CONSENT_RECORD"
         ABDM_HEALTH_INFORMATION = 8, "ABDM_HEALTH_INFORMATION"
+        EXPORT = 9, "EXPORT"
 
     file_type = models.IntegerField(choices=FileType, default=FileType.PATIENT)
     is_archived = models.BooleanField(default=False)
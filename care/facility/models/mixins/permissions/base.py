@@ -6,6 +6,10 @@ class BasePermissionMixin:
     def has_read_permission(request):
         return request.user.is_superuser or request.user.verified
 
+    @classmethod
+    def has_export_permission(cls, request):
+        return cls.has_read_permission(request)
+
     @staticmethod
     def has_write_permission(request):
         if request.user.user_type in User.READ_ONLY_TYPES:
@@ -0,0 +1,91 @@
+from care.users.models import User
+from care.utils.cache.request_cache import get_request_cache
+
+CONSULTATION_ACCESS_FIELDS = (
+    "id",
+    "assigned_to_id",
+    "patient__assigned_to_id",
+    "patient__facility_id",
+    "patient__facility__district_id",
+    "patient__facility__state_id",
+)
+
+
+def _get_access_row(consultation):
+    """
+    Returns the fields read access is decided on from a consultation whose
+    patient and facility have already been loaded, None otherwise.
+    """
+    from care.facility.models.patient import PatientRegistration
+    from care.facility.models.patient_consultation import PatientConsultation
+
+    if not PatientConsultation.patient.is_cached(consultation):
+        return None
+    patient = consultation.patient
+    facility = None
+    if patient.facility_id:
+        if not PatientRegistration.facility.is_cached(patient):
+            return None
+        facility = patient.facility
+    return {
+        "id": consultation.id,
+        "assigned_to_id": consultation.assigned_to_id,
+        "patient__assigned_to_id": patient.assigned_to_id,
+        "patient__facility_id": patient.facility_id,
+        "patient__facility__district_id": facility and facility.district_id,
+        "patient__facility__state_id": facility and facility.state_id,
+    }
+
+
+def _has_read_access(user, row, facility_ids):
+    facility_id = row["patient__facility_id"]
+    return (
+        (facility_id is not None and facility_id in facility_ids)
+        or user.id in (row["assigned_to_id"], row["patient__assigned_to_id"])
+        or (
+            facility_id is not None
+            and user.user_type >= User.TYPE_VALUE_MAP["DistrictLabAdmin"]
+            and user.district_id == row["patient__facility__district_id"]
+        )
+        or (
+            facility_id is not None
+            and user.user_type >= User.TYPE_VALUE_MAP["StateLabAdmin"]
+            and user.state_id == row["patient__facility__state_id"]
+        )
+    )
+
+
+def has_consultation_read_access(user, consultation) -> bool:
+    """
+    Returns whether the user can read the consultation, given as an instance
+    or an id. A consultation that is not loaded with its patient and facility
+    is fetched with a single values query, and the result is memoized for the
+    rest of the request.
+    """
+    from care.facility.models.patient_consultation import PatientConsultation
+    from care.utils.cache.cache_allowed_facilities import get_accessible_facilities
+
+    if user.is_superuser:
+        return True
+
+    consultation_id = getattr(consultation, "id", consultation)
+    memo = get_request_cache("consultation_read_access")
+    if (user.id, consultation_id) in memo:
+        return memo[(user.id, consultation_id)]
+
+    row = None
+    if isinstance(consultation, PatientConsultation):
+        row = _get_access_row(consultation)
+    if row is None:
+        row = (
+            PatientConsultation.objects.filter(id=consultation_id)
+            .values(*CONSULTATION_ACCESS_FIELDS)
+            .first()
+        )
+    if row is None:
+        return False
+
+    access = memo[(user.id, consultation_id)] = _has_read_access(
+        user, row, set(get_accessible_facilities(user))
+    )
+    return access
@@ -1,5 +1,6 @@
 import enum
 from datetime import date
+from itertools import chain
 
 from dateutil.relativedelta import relativedelta
 from django.contrib.postgres.aggregates import ArrayAgg
@@ -39,8 +40,9 @@ from care.facility.models.patient_base import (
     REVERSE_ROUTE_TO_FACILITY_CHOICES,
 )
 from care.facility.models.patient_consultation import PatientConsultation
-from care.facility.static_data.icd11 import get_icd11_diagnoses_objects_by_ids
+from care.facility.static_data.icd11 import get_icd11_diagnoses_objects_map
 from care.users.models import GENDER_CHOICES, REVERSE_GENDER_CHOICES, User
+from care.utils.csv_export import ChoiceLookup
 from care.utils.models.base import BaseManager, BaseModel
 from care.utils.models.validators import mobile_or_landline_number_validator
 
@@ -51,6 +53,27 @@ class RationCardCategory(models.TextChoices):
     APL = "APL", _("APL")
 
 
+class DiagnosesLabels:
+    """
+    Formats lists of diagnosis ids as their comma separated labels, resolving
+    the ids of a whole column of an export with a single lookup.
+    """
+
+    def __call__(self, diagnoses_ids):
+        return self.serialize_column([diagnoses_ids])[0]
+
+    def serialize_column(self, values: list) -> list[str]:
+        diagnoses = get_icd11_diagnoses_objects_map(chain.from_iterable(values))
+        return [
+            ", ".join(
+                diagnoses[diagnosis_id]["label"]
+                for diagnosis_id in diagnoses_ids
+                if diagnosis_id in diagnoses
+            )
+            for diagnoses_ids in values
+        ]
+
+
 class PatientRegistration(PatientBaseModel, PatientPermissionMixin):
     # fields in the PatientSearch model
     PATIENT_SEARCH_KEYS = [
@@ -553,30 +576,30 @@ class PatientRegistration(PatientBaseModel, PatientPermissionMixin):
     def format_as_time(self):
         return self.strftime("%H:%M")
 
-    def format_diagnoses(self):
-        diagnoses = get_icd11_diagnoses_objects_by_ids(self)
-        return ", ".join([diagnosis["label"] for diagnosis in diagnoses])
+    format_diagnoses = DiagnosesLabels()
 
     CSV_MAKE_PRETTY = {
-        "gender": (lambda x: REVERSE_GENDER_CHOICES[x]),
+        "gender": ChoiceLookup(REVERSE_GENDER_CHOICES),
         "created_date": format_as_date,
         "created_date__time": format_as_time,
         "last_consultation__created_date": format_as_date,
         "last_consultation__created_date__time": format_as_time,
-        "last_consultation__suggestion": (
-            lambda x: PatientConsultation.REVERSE_SUGGESTION_CHOICES.get(x, "-")
+        "last_consultation__suggestion": ChoiceLookup(
+            PatientConsultation.REVERSE_SUGGESTION_CHOICES, default="-"
         ),
         "principal_diagnoses": format_diagnoses,
         "unconfirmed_diagnoses": format_diagnoses,
         "provisional_diagnoses": format_diagnoses,
         "differential_diagnoses": format_diagnoses,
         "confirmed_diagnoses": format_diagnoses,
-        "last_consultation__route_to_facility": (
-            lambda x: REVERSE_ROUTE_TO_FACILITY_CHOICES.get(x, "-")
+        "last_consultation__route_to_facility": ChoiceLookup(
+            REVERSE_ROUTE_TO_FACILITY_CHOICES, default="-"
+        ),
+        "last_consultation__category": ChoiceLookup(
+            REVERSE_CATEGORY_CHOICES, default="-"
         ),
-        "last_consultation__category": lambda x: REVERSE_CATEGORY_CHOICES.get(x, "-"),
-        "last_consultation__new_discharge_reason": (
-            lambda x: REVERSE_NEW_DISCHARGE_REASON_CHOICES.get(x, "-")
+        "last_consultation__new_discharge_reason": ChoiceLookup(
+            REVERSE_NEW_DISCHARGE_REASON_CHOICES, default="-"
         ),
         "last_consultation__discharge_date": format_as_date,
         "last_consultation__discharge_date__time": format_as_time,
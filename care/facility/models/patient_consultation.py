@@ -10,6 +10,9 @@ from care.facility.models import (
     PatientBaseModel,
 )
 from care.facility.models.file_upload import FileUpload
+from care.facility.models.mixins.permissions.consultation import (
+    has_consultation_read_access,
+)
 from care.facility.models.mixins.permissions.patient import (
     ConsultationRelatedPermissionMixin,
 )
@@ -284,28 +287,7 @@ class PatientConsultation(PatientBaseModel, ConsultationRelatedPermissionMixin):
     def has_object_read_permission(self, request):
         if not super().has_object_read_permission(request):
             return False
-        return (
-            request.user.is_superuser
-            or (
-                self.patient.facility
-                and request.user in self.patient.facility.users.all()
-            )
-            or (request.user in (self.assigned_to, self.patient.assigned_to))
-            or (
-                request.user.user_type >= User.TYPE_VALUE_MAP["DistrictLabAdmin"]
-                and (
-                    self.patient.facility
-                    and request.user.district == self.patient.facility.district
-                )
-            )
-            or (
-                request.user.user_type >= User.TYPE_VALUE_MAP["StateLabAdmin"]
-                and (
-                    self.patient.facility
-                    and request.user.state == self.patient.facility.state
-                )
-            )
-        )
+        return has_consultation_read_access(request.user, self)
 
     def has_object_update_permission(self, request):
         return super().has_object_update_permission(
@@ -417,35 +399,7 @@ class PatientConsent(BaseModel, ConsultationRelatedPermissionMixin):
     def has_object_read_permission(self, request):
         if not super().has_object_read_permission(request):
             return False
-        return (
-            request.user.is_superuser
-            or (
-                self.consultation.patient.facility
-                and request.user in self.consultation.patient.facility.users.all()
-            )
-            or (
-                request.user
-                in (
-                    self.consultation.assigned_to,
-                    self.consultation.patient.assigned_to,
-                )
-            )
-            or (
-                request.user.user_type >= User.TYPE_VALUE_MAP["DistrictLabAdmin"]
-                and (
-                    self.consultation.patient.facility
-                    and request.user.district
-                    == self.consultation.patient.facility.district
-                )
-            )
-            or (
-                request.user.user_type >= User.TYPE_VALUE_MAP["StateLabAdmin"]
-                and (
-                    self.consultation.patient.facility
-                    and request.user.state == self.consultation.patient.facility.state
-                )
-            )
-        )
+        return has_consultation_read_access(request.user, self.consultation_id)
 
     def has_object_update_permission(self, request):
         return super().has_object_update_permission(
@@ -8,6 +8,7 @@ from care.facility.models import (
     reverse_choices,
 )
 from care.users.models import User
+from care.utils.csv_export import ChoiceLookup
 from care.utils.models.validators import mobile_or_landline_number_validator
 
 SHIFTING_STATUS_CHOICES = (
@@ -145,7 +146,7 @@ class ShiftingRequest(FacilityBaseModel):
     }
 
     CSV_MAKE_PRETTY = {
-        "status": (lambda x: REVERSE_SHIFTING_STATUS_CHOICES.get(x, "-")),
+        "status": ChoiceLookup(REVERSE_SHIFTING_STATUS_CHOICES, default="-"),
         "is_up_shift": pretty_boolean,
         "emergency": pretty_boolean,
         "patient__is_antenatal": pretty_boolean,
@@ -167,6 +168,10 @@ class ShiftingRequest(FacilityBaseModel):
     def has_read_permission(request):
         return request.user.user_type >= User.TYPE_VALUE_MAP["NurseReadOnly"]
 
+    @staticmethod
+    def has_export_permission(request):
+        return ShiftingRequest.has_read_permission(request)
+
     def has_object_read_permission(self, request):
         return request.user.user_type >= User.TYPE_VALUE_MAP["NurseReadOnly"]
 
@@ -1 +1,3 @@
 from .asset_updates import *  # noqa
+from .event_types import *  # noqa
+from .facility_user import *  # noqa
@@ -0,0 +1,10 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from care.facility.events.handler import invalidate_event_groups
+from care.facility.models.events import EventType
+
+
+@receiver([post_save, post_delete], sender=EventType)
+def invalidate_event_types_cache(sender, instance, **kwargs):
+    invalidate_event_groups()
@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from care.facility.models.facility import FacilityUser
+from care.utils.cache.cache_allowed_facilities import (
+    invalidate_accessible_facilities,
+)
+
+
+@receiver([post_save, post_delete], sender=FacilityUser)
+def invalidate_facility_user_cache(sender, instance, **kwargs):
+    invalidate_accessible_facilities(instance.user_id)
@@ -1,17 +1,25 @@
 import logging
 import re
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from threading import Lock
 from typing import TypedDict
 
-from django.core.paginator import Paginator
-from redis_om import Field, Migrator
+from django.conf import settings
+from django.db.models import Count, Max
+from redis_om import Field, FindQuery
 
 from care.facility.models.icd11_diagnosis import ICD11Diagnosis
-from care.utils.static_data.models.base import BaseRedisModel
+from care.utils.static_data.helpers import query_builder
+from care.utils.static_data.loader import bulk_load
+from care.utils.static_data.models.base import VersionedRedisModel
+from care.utils.static_data.search import Document, get_search_index
 
 logger = logging.getLogger(__name__)
 
 
 DISEASE_CODE_PATTERN = r"^(?:[A-Z]+\d|\d+[A-Z])[A-Z\d.]*\s"
+ICD11_LRU_SIZE = 4096
 
 
 class ICD11Object(TypedDict):
@@ -20,7 +28,12 @@ class ICD11Object(TypedDict):
     chapter: str
 
 
-class ICD11(BaseRedisModel):
+# (active version, id) -> object of the most recently looked up ids
+_icd11_lru: OrderedDict[tuple[str | None, int], ICD11Object] = OrderedDict()
+_icd11_lru_lock = Lock()
+
+
+class ICD11(VersionedRedisModel):
     id: int = Field(primary_key=True)
     label: str
     chapter: str = Field(index=True)
@@ -36,46 +49,148 @@ class ICD11(BaseRedisModel):
         }
 
 
-def load_icd11_diagnosis():
-    logger.info("Loading ICD11 Diagnosis into the redis cache...")
+def get_icd11_diagnosis_fingerprint() -> str:
+    """
+    Fingerprint of the ICD11 source data, rows are only ever added or
+    replaced wholesale so the row count and the max id identify a dataset.
+    """
+    stats = ICD11Diagnosis.objects.aggregate(count=Count("id"), max_id=Max("id"))
+    return f"{stats['count']}:{stats['max_id']}"
 
-    icd_objs = ICD11Diagnosis.objects.order_by("id").values_list(
-        "id", "label", "meta_chapter_short"
+
+def get_icd11_diagnosis_rows(batch_size: int | None = None) -> Iterator[dict]:
+    batch_size = batch_size or settings.STATIC_DATA_LOAD_BATCH_SIZE
+    icd_objs = (
+        ICD11Diagnosis.objects.order_by("id")
+        .values_list("id", "label", "meta_chapter_short")
+        .iterator(chunk_size=batch_size)
     )
-    paginator = Paginator(icd_objs, 5000)
-    for page_number in paginator.page_range:
-        for diagnosis in paginator.page(page_number).object_list:
-            ICD11(
-                id=diagnosis[0],
-                label=diagnosis[1],
-                chapter=diagnosis[2] or "null",
-                has_code=1 if re.match(DISEASE_CODE_PATTERN, diagnosis[1]) else 0,
-                vec=diagnosis[1].replace(".", "\\.", 1),
-            ).save()
-    Migrator().run()
+    for diagnosis in icd_objs:
+        yield {
+            "id": diagnosis[0],
+            "label": diagnosis[1],
+            "chapter": diagnosis[2] or "null",
+            "has_code": 1 if re.match(DISEASE_CODE_PATTERN, diagnosis[1]) else 0,
+            "vec": diagnosis[1].replace(".", "\\.", 1),
+        }
+
+
+def load_icd11_diagnosis(version: str, batch_size: int | None = None):
+    logger.info("Loading ICD11 Diagnosis into the redis cache...")
+
+    ICD11.create_versioned_index(version)
+    bulk_load(ICD11, get_icd11_diagnosis_rows(batch_size), version, batch_size)
     logger.info("ICD11 Diagnosis Loaded")
 
 
+def _to_diagnosis_id(value) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_icd11_object(document: dict) -> ICD11Object:
+    return {
+        "id": int(document["id"]),
+        "label": document["label"],
+        "chapter": document["chapter"] if document["chapter"] != "null" else "",
+    }
+
+
+def get_icd11_diagnoses_objects_map(
+    diagnoses_ids: Iterable[int],
+) -> dict[int, ICD11Object]:
+    """
+    Resolves the given ids to ICD11 objects, looking up the ids that are not
+    in the in-process LRU with a single pipelined round trip to redis.
+
+    Returns a dict of id -> object, ids that do not exist are left out.
+    """
+    version = ICD11.get_active_version()
+    ids = {
+        diagnosis_id
+        for diagnosis_id in map(_to_diagnosis_id, diagnoses_ids)
+        if diagnosis_id is not None
+    }
+
+    objects = {}
+    with _icd11_lru_lock:
+        for diagnosis_id in ids:
+            obj = _icd11_lru.get((version, diagnosis_id))
+            if obj is not None:
+                _icd11_lru.move_to_end((version, diagnosis_id))
+                objects[diagnosis_id] = obj
+    missing_ids = sorted(ids - objects.keys())
+    if not missing_ids:
+        return {diagnosis_id: dict(obj) for diagnosis_id, obj in objects.items()}
+
+    pipeline = ICD11.db().pipeline(transaction=False)
+    for diagnosis_id in missing_ids:
+        pipeline.hgetall(ICD11.make_versioned_primary_key(version, diagnosis_id))
+    fetched = {
+        diagnosis_id: _to_icd11_object(document)
+        for diagnosis_id, document in zip(missing_ids, pipeline.execute(), strict=True)
+        if document
+    }
+
+    with _icd11_lru_lock:
+        for diagnosis_id, obj in fetched.items():
+            _icd11_lru[(version, diagnosis_id)] = obj
+        while len(_icd11_lru) > ICD11_LRU_SIZE:
+            _icd11_lru.popitem(last=False)
+    objects.update(fetched)
+    # copies, so that callers can not modify the cached objects
+    return {diagnosis_id: dict(obj) for diagnosis_id, obj in objects.items()}
+
+
 def get_icd11_diagnosis_object_by_id(
     diagnosis_id: int, as_dict=False
 ) -> ICD11 | ICD11Object | None:
+    if as_dict:
+        return get_icd11_diagnoses_objects_map([diagnosis_id]).get(
+            _to_diagnosis_id(diagnosis_id)
+        )
     try:
-        diagnosis = ICD11.get(diagnosis_id)
-        return diagnosis.get_representation() if as_dict else diagnosis
+        return ICD11.get(diagnosis_id)
     except Exception:
         return None
 
 
 def get_icd11_diagnoses_objects_by_ids(diagnoses_ids: list[int]) -> list[ICD11Object]:
+    """
+    Returns the ICD11 objects of the given ids in the same order, ids that do
+    not exist are skipped.
+    """
     if not diagnoses_ids:
         return []
 
-    query = None
-    for diagnosis_id in diagnoses_ids:
-        if query is None:
-            query = ICD11.id == diagnosis_id
-        else:
-            query |= ICD11.id == diagnosis_id
-
-    diagnosis_objects: list[ICD11] = list(ICD11.find(query))
-    return [diagnosis.get_representation() for diagnosis in diagnosis_objects]
+    objects = get_icd11_diagnoses_objects_map(diagnoses_ids)
+    return [
+        objects[diagnosis_id]
+        for diagnosis_id in map(_to_diagnosis_id, diagnoses_ids)
+        if diagnosis_id in objects
+    ]
+
+
+def get_icd11_search_documents() -> Iterator[Document]:
+    for row in get_icd11_diagnosis_rows():
+        yield row["vec"], {"has_code": row["has_code"]}, _to_icd11_object(row)
+
+
+def search_icd11_diagnoses(query: str | None, limit: int) -> list[ICD11Object]:
+    """
+    Searches the diagnoses with a disease code, through RediSearch or the
+    in-memory index depending on STATIC_DATA_SEARCH_BACKEND.
+    """
+    if settings.STATIC_DATA_SEARCH_BACKEND == "memory":
+        index = get_search_index(ICD11, get_icd11_search_documents)
+        return index.search(query, filters={"has_code": 1}, limit=limit)
+
+    expressions = [ICD11.has_code == 1]
+    if query:
+        expressions.append(ICD11.vec % query_builder(query))
+    result = FindQuery(expressions=expressions, model=ICD11, limit=limit).execute(
+        exhaust_results=False
+    )
+    return [diagnosis.get_representation() for diagnosis in result]
@@ -1,13 +1,17 @@
 import logging
+from collections.abc import Iterator
 from typing import TypedDict
 
-from django.core.paginator import Paginator
-from django.db.models import CharField, TextField, Value
+from django.conf import settings
+from django.db.models import CharField, Count, Max, TextField, Value
 from django.db.models.functions import Coalesce
-from redis_om import Field, Migrator
+from redis_om import Field, FindQuery
 
 from care.facility.models.prescription import MedibaseMedicine as MedibaseMedicineModel
-from care.utils.static_data.models.base import BaseRedisModel
+from care.utils.static_data.helpers import query_builder, token_escaper
+from care.utils.static_data.loader import bulk_load
+from care.utils.static_data.models.base import VersionedRedisModel
+from care.utils.static_data.search import Document, get_search_index
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +27,7 @@ class MedibaseMedicineObject(TypedDict):
     atc_classification: str
 
 
-class MedibaseMedicine(BaseRedisModel):
+class MedibaseMedicine(VersionedRedisModel):
     id: str = Field(primary_key=True)
     name: str = Field(index=True)
     type: str = Field(index=True)
@@ -48,9 +52,20 @@ class MedibaseMedicine(BaseRedisModel):
         }
 
 
-def load_medibase_medicines():
-    logger.info("Loading Medibase Medicines into the redis cache...")
+def get_medibase_medicines_fingerprint() -> str:
+    """
+    Fingerprint of the Medibase source data, any insert, update or delete
+    changes either the row count or the latest modified date.
+    """
+    stats = MedibaseMedicineModel.objects.aggregate(
+        count=Count("id"), last_modified=Max("modified_date")
+    )
+    last_modified = stats["last_modified"]
+    return f"{stats['count']}:{last_modified.isoformat() if last_modified else None}"
 
+
+def get_medibase_medicine_rows(batch_size: int | None = None) -> Iterator[dict]:
+    batch_size = batch_size or settings.STATIC_DATA_LOAD_BATCH_SIZE
     medibase_objects = (
         MedibaseMedicineModel.objects.order_by("external_id")
         .annotate(
@@ -74,20 +89,63 @@ def load_medibase_medicines():
             "cims_class_pretty",
             "atc_classification_pretty",
         )
+        .iterator(chunk_size=batch_size)
+    )
+    for medicine in medibase_objects:
+        yield {
+            "id": str(medicine[0]),
+            "name": medicine[1],
+            "type": medicine[2],
+            "generic": medicine[3],
+            "company": medicine[4],
+            "contents": medicine[5],
+            "cims_class": medicine[6],
+            "atc_classification": medicine[7],
+            "vec": f"{medicine[1]} {medicine[3]} {medicine[4]}",
+        }
+
+
+def load_medibase_medicines(version: str, batch_size: int | None = None):
+    logger.info("Loading Medibase Medicines into the redis cache...")
+
+    MedibaseMedicine.create_versioned_index(version)
+    bulk_load(
+        MedibaseMedicine, get_medibase_medicine_rows(batch_size), version, batch_size
     )
-    paginator = Paginator(medibase_objects, 5000)
-    for page_number in paginator.page_range:
-        for medicine in paginator.page(page_number).object_list:
-            MedibaseMedicine(
-                id=str(medicine[0]),
-                name=medicine[1],
-                type=medicine[2],
-                generic=medicine[3],
-                company=medicine[4],
-                contents=medicine[5],
-                cims_class=medicine[6],
-                atc_classification=medicine[7],
-                vec=f"{medicine[1]} {medicine[3]} {medicine[4]}",
-            ).save()
-    Migrator().run()
     logger.info("Medibase Medicines Loaded")
+
+
+def get_medibase_search_documents() -> Iterator[Document]:
+    for row in get_medibase_medicine_rows():
+        vec = row.pop("vec")
+        yield vec, {"name": row["name"], "type": row["type"]}, row
+
+
+def search_medibase_medicines(
+    query: str | None, medicine_type: str | None, limit: int
+) -> list[MedibaseMedicineObject]:
+    """
+    Searches the medicines by name, generic and company, through RediSearch
+    or the in-memory index depending on STATIC_DATA_SEARCH_BACKEND.
+    """
+    if settings.STATIC_DATA_SEARCH_BACKEND == "memory":
+        index = get_search_index(MedibaseMedicine, get_medibase_search_documents)
+        return index.search(
+            query,
+            filters={"type": medicine_type} if medicine_type else None,
+            tag_matches={"name": query} if query else None,
+            limit=limit,
+        )
+
+    expressions = []
+    if medicine_type:
+        expressions.append(MedibaseMedicine.type == medicine_type)
+    if query:
+        expressions.append(
+            (MedibaseMedicine.name == token_escaper.escape(query))
+            | (MedibaseMedicine.vec % query_builder(query))
+        )
+    result = FindQuery(
+        expressions=expressions, model=MedibaseMedicine, limit=limit
+    ).execute(exhaust_results=False)
+    return [medicine.get_representation() for medicine in result]
@@ -0,0 +1,53 @@
+from logging import Logger
+
+from botocore.exceptions import ClientError
+from celery import shared_task
+from celery.utils.log import get_task_logger
+
+from care.facility.models.file_upload import FileUpload
+from care.facility.utils.reports.exports import (
+    EXPORTS,
+    fail_export_job,
+    generate_and_upload_export,
+    get_export_queryset,
+)
+from care.users.models import User
+from care.utils.exceptions import CeleryTaskError
+
+logger: Logger = get_task_logger(__name__)
+
+EXPORT_MAX_RETRIES = 3
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(ClientError,),
+    retry_kwargs={"max_retries": EXPORT_MAX_RETRIES},
+)
+def export_csv_task(
+    self, file_id: int, export_name: str, user_id: int, query_params: str
+):
+    """
+    Generate and Upload a CSV Export
+    """
+    logger.info("Generating %s export for file %s", export_name, file_id)
+    try:
+        export_file = FileUpload.objects.get(
+            id=file_id, file_type=FileUpload.FileType.EXPORT.value
+        )
+    except FileUpload.DoesNotExist as e:
+        msg = f"Export file {file_id} does not exist"
+        raise CeleryTaskError(msg) from e
+
+    try:
+        export = EXPORTS[export_name]
+        queryset = get_export_queryset(
+            export, User.objects.get(id=user_id), query_params
+        )
+        generate_and_upload_export(export_file, export, queryset)
+    except Exception as e:
+        # the job is still running while the upload is being retried
+        if not isinstance(e, ClientError) or self.request.retries >= EXPORT_MAX_RETRIES:
+            fail_export_job(export_file.external_id)
+        raise
+    return export_file.id
@@ -5,48 +5,93 @@ from celery import shared_task
 from celery.utils.log import get_task_logger
 from django.core.cache import cache
 
-from care.facility.static_data.icd11 import load_icd11_diagnosis
-from care.facility.static_data.medibase import load_medibase_medicines
-from care.utils.static_data.models.base import index_exists
+from care.facility.static_data.icd11 import (
+    ICD11,
+    get_icd11_diagnosis_fingerprint,
+    load_icd11_diagnosis,
+)
+from care.facility.static_data.medibase import (
+    MedibaseMedicine,
+    get_medibase_medicines_fingerprint,
+    load_medibase_medicines,
+)
+from care.utils.metrics import record_metric
+from care.utils.static_data.loader import reload_dataset
+from care.utils.static_data.models.base import BaseRedisModel
 from plug_config import manager
 
 logger: Logger = get_task_logger(__name__)
 
+STATIC_DATASETS = [
+    (ICD11, load_icd11_diagnosis, get_icd11_diagnosis_fingerprint),
+    (MedibaseMedicine, load_medibase_medicines, get_medibase_medicines_fingerprint),
+]
+PLUG_FINGERPRINT_KEY = "care_static_data:fingerprint:plug:{plug}"
 
-@shared_task
-def load_redis_index():
+
+def load_plug_static_data(plug, force: bool = False):
+    """
+    Runs the plug's `static_data.load_static_data`. Plugs that also define
+    `get_static_data_fingerprint` are skipped while the fingerprint does not
+    change.
+    """
+    module_path = f"{plug.name}.static_data"
     try:
-        deleted_count = cache.delete_pattern("care_static_data*", itersize=25_000)
-        logger.info("Deleted %s keys with prefix 'care_static_data'", deleted_count)
-    except Exception as e:
-        logger.error("Failed to delete keys with prefix 'care_static_data': %s", e)
+        module = import_module(module_path)
+    except ModuleNotFoundError:
+        logger.debug("Module %s not found", module_path)
         return
 
-    if cache.get("redis_index_loading"):
-        logger.info("Redis Index already loading, skipping")
+    load_static_data = getattr(module, "load_static_data", None)
+    if not load_static_data:
         return
 
-    cache.set("redis_index_loading", value=True, timeout=60 * 2)
-    logger.info("Loading Redis Index")
-    if index_exists():
-        logger.info("Index already exists, skipping")
+    get_fingerprint = getattr(module, "get_static_data_fingerprint", None)
+    fingerprint = get_fingerprint() if get_fingerprint else None
+    fingerprint_key = PLUG_FINGERPRINT_KEY.format(plug=plug.name)
+    conn = BaseRedisModel.db()
+    if (
+        not force
+        and fingerprint is not None
+        and conn.get(fingerprint_key) == fingerprint
+    ):
+        logger.info("Static data of %s is unchanged, skipping reload", plug.name)
+        record_metric(f"StaticData/{plug.name}/Skipped")
         return
 
-    load_icd11_diagnosis()
-    load_medibase_medicines()
+    load_static_data()
+    if fingerprint is not None:
+        conn.set(fingerprint_key, fingerprint)
+    record_metric(f"StaticData/{plug.name}/Reloaded")
+
+
+def reload_static_data(batch_size: int | None = None, force: bool = False):
+    """
+    Reloads every static dataset whose source data changed since it was last
+    loaded (or all of them with `force`). Each dataset is loaded into a new
+    version of its index and searches are switched over to it once complete,
+    if loading fails the previous version keeps serving.
+    """
+    for model, load, get_fingerprint in STATIC_DATASETS:
+        reload_dataset(model, load, get_fingerprint(), batch_size, force)
 
     for plug in manager.plugs:
         try:
-            module_path = f"{plug.name}.static_data"
-            module = import_module(module_path)
-
-            load_static_data = getattr(module, "load_static_data", None)
-            if load_static_data:
-                load_static_data()
-        except ModuleNotFoundError:
-            logger.debug("Module %s not found", module_path)
+            load_plug_static_data(plug, force)
         except Exception as e:
             logger.error("Error loading static data for %s: %s", plug.name, e)
 
-    cache.delete("redis_index_loading")
+
+@shared_task
+def load_redis_index():
+    if cache.get("redis_index_loading"):
+        logger.info("Redis Index already loading, skipping")
+        return
+
+    cache.set("redis_index_loading", value=True, timeout=60 * 5)
+    logger.info("Loading Redis Index")
+    try:
+        reload_static_data()
+    finally:
+        cache.delete("redis_index_loading")
     logger.info("Redis Index Loaded")
@@ -1,44 +1,37 @@
 from celery import shared_task
 from celery.utils.log import get_task_logger
+from django.conf import settings
 
-from care.facility.utils.summarization.district.patient_summary import (
-    district_patient_summary,
-)
-from care.facility.utils.summarization.facility_capacity import (
-    facility_capacity_summary,
-)
-from care.facility.utils.summarization.patient_summary import patient_summary
-from care.facility.utils.summarization.tests_summary import tests_summary
-from care.facility.utils.summarization.triage_summary import triage_summary
+from care.facility.utils.summarization.incremental import run_summary
 
 logger = get_task_logger(__name__)
 
 
 @shared_task
 def summarize_triage():
-    triage_summary()
+    run_summary("TriageSummary", settings.TASK_SUMMARIZE_INCREMENTAL)
     logger.info("Summarized Triages")
 
 
 @shared_task
 def summarize_tests():
-    tests_summary()
+    run_summary("TestSummary", settings.TASK_SUMMARIZE_INCREMENTAL)
     logger.info("Summarized Tests")
 
 
 @shared_task
 def summarize_facility_capacity():
-    facility_capacity_summary()
+    run_summary("FacilityCapacity", settings.TASK_SUMMARIZE_INCREMENTAL)
     logger.info("Summarized Facility Capacities")
 
 
 @shared_task
 def summarize_patient():
-    patient_summary()
+    run_summary("PatientSummary", settings.TASK_SUMMARIZE_INCREMENTAL)
     logger.info("Summarized Patients")
 
 
 @shared_task
 def summarize_district_patient():
-    district_patient_summary()
+    run_summary("DistrictPatientSummary", settings.TASK_SUMMARIZE_INCREMENTAL)
     logger.info("Summarized District Patients")
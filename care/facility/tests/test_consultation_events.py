@@ -0,0 +1,125 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils.timezone import now
+
+from care.facility.events.handler import create_consultation_events
+from care.facility.models.events import (
+    PatientConsultationEvent,
+    PatientConsultationLatestEvent,
+)
+from care.utils.tests.test_utils import TestUtils
+
+
+class ConsultationEventsTestCase(TestUtils, TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        call_command("load_event_types", stdout=StringIO())
+        cls.state = cls.create_state()
+        cls.district = cls.create_district(cls.state)
+        cls.local_body = cls.create_local_body(cls.district)
+        cls.super_user = cls.create_super_user("su", cls.district)
+        cls.facility = cls.create_facility(cls.super_user, cls.district, cls.local_body)
+        cls.patient = cls.create_patient(cls.district, cls.facility)
+        cls.consultation = cls.create_consultation(cls.patient, cls.facility)
+
+    def create_symptom_events(self, count):
+        symptoms = [
+            self.create_encounter_symptom(self.consultation, self.super_user)
+            for _ in range(count)
+        ]
+        with CaptureQueriesContext(connection) as context:
+            create_consultation_events(
+                self.consultation.id, symptoms, self.super_user.id
+            )
+        return symptoms, len(context.captured_queries)
+
+    def test_query_count_does_not_depend_on_object_count(self):
+        _, few_symptoms_queries = self.create_symptom_events(2)
+        _, many_symptoms_queries = self.create_symptom_events(10)
+        self.assertEqual(few_symptoms_queries, many_symptoms_queries)
+
+    def test_earlier_events_are_no_longer_latest(self):
+        symptoms, _ = self.create_symptom_events(2)
+        create_consultation_events(
+            self.consultation.id, symptoms[0], self.super_user.id, now()
+        )
+
+        events = PatientConsultationEvent.objects.filter(
+            consultation=self.consultation, object_model="EncounterSymptom"
+        )
+        self.assertEqual(events.filter(object_id=symptoms[0].id).count(), 2)
+        self.assertEqual(
+            events.filter(object_id=symptoms[0].id, is_latest=True).count(), 1
+        )
+        self.assertEqual(
+            events.filter(object_id=symptoms[1].id, is_latest=True).count(), 1
+        )
+
+    def test_latest_events_follow_taken_at(self):
+        symptom = self.create_encounter_symptom(self.consultation, self.super_user)
+        taken_at = now()
+        create_consultation_events(
+            self.consultation.id, symptom, self.super_user.id, taken_at=taken_at
+        )
+        latest_event = PatientConsultationLatestEvent.objects.get(
+            consultation=self.consultation
+        )
+
+        # an event taken earlier does not replace the latest one
+        create_consultation_events(
+            self.consultation.id,
+            symptom,
+            self.super_user.id,
+            taken_at=taken_at - timedelta(hours=1),
+        )
+        self.assertEqual(
+            PatientConsultationLatestEvent.objects.get(
+                consultation=self.consultation
+            ).event_id,
+            latest_event.event_id,
+        )
+
+        create_consultation_events(
+            self.consultation.id,
+            symptom,
+            self.super_user.id,
+            taken_at=taken_at + timedelta(hours=1),
+        )
+        latest_event.refresh_from_db()
+        self.assertEqual(latest_event.taken_at, taken_at + timedelta(hours=1))
+
+    def test_latest_event_writers_are_serialized_on_the_consultation(self):
+        symptom = self.create_encounter_symptom(self.consultation, self.super_user)
+        with CaptureQueriesContext(connection) as context:
+            create_consultation_events(
+                self.consultation.id, symptom, self.super_user.id
+            )
+
+        queries = [query["sql"] for query in context.captured_queries]
+        lock = next(
+            index
+            for index, sql in enumerate(queries)
+            if 'FROM "facility_patientconsultation"' in sql and "FOR UPDATE" in sql
+        )
+        upsert = next(
+            index for index, sql in enumerate(queries) if "ON CONFLICT" in sql
+        )
+        self.assertLess(lock, upsert)
+
+    def test_latest_events_api(self):
+        symptoms, _ = self.create_symptom_events(2)
+        self.client.force_login(self.super_user)
+        response = self.client.get(
+            f"/api/v1/consultation/{self.consultation.external_id}/events/latest/"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 1)
+        self.assertEqual(
+            response.json()[0]["object_id"],
+            max(symptom.id for symptom in symptoms),
+        )
@@ -0,0 +1,123 @@
+import csv
+import gzip
+import io
+import json
+from unittest.mock import patch
+
+from botocore.exceptions import ClientError
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from care.facility.models import Facility
+from care.facility.models.file_upload import FileUpload
+from care.utils.csv_export import CSV_BOM
+from care.utils.tests.test_utils import TestUtils
+
+
+class ExportJobTestCase(TestUtils, APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.state = cls.create_state()
+        cls.district = cls.create_district(cls.state)
+        cls.local_body = cls.create_local_body(cls.district)
+        cls.super_user = cls.create_super_user("su", cls.district)
+        cls.facility = cls.create_facility(cls.super_user, cls.district, cls.local_body)
+        cls.other_facility = cls.create_facility(
+            cls.super_user, cls.district, cls.local_body, name="Bar"
+        )
+        cls.user = cls.create_user("staff", cls.district, home_facility=cls.facility)
+
+    def export_facilities(self, query="", failures=0):
+        uploaded = {}
+
+        def put_object(file, **kwargs):
+            if len(uploaded.setdefault("attempts", [])) < failures:
+                uploaded["attempts"].append(False)
+                raise ClientError({"Error": {"Code": "SlowDown"}}, "PutObject")
+            uploaded["attempts"].append(True)
+            uploaded["content"] = gzip.decompress(file.read()).decode()
+            uploaded["kwargs"] = kwargs
+
+        with (
+            patch.object(FileUpload, "put_object", side_effect=put_object),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            response = self.client.post(f"/api/v1/facility/export/{query}")
+        return response, uploaded
+
+    def read_rows(self, uploaded):
+        return list(csv.reader(io.StringIO(uploaded["content"].removeprefix(CSV_BOM))))
+
+    def test_export_job(self):
+        self.client.force_authenticate(self.user)
+        response, uploaded = self.export_facilities()
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+
+        export_file = FileUpload.objects.get(external_id=response.data["id"])
+        self.assertTrue(export_file.upload_completed)
+        self.assertEqual(export_file.uploaded_by, self.user)
+        self.assertEqual(uploaded["kwargs"]["ContentEncoding"], "gzip")
+
+        # only the facilities the user can see are exported
+        rows = self.read_rows(uploaded)
+        self.assertEqual(rows[0], list(Facility.CSV_MAPPING.values()))
+        self.assertEqual([row[0] for row in rows[1:]], [self.facility.name])
+
+        with patch.object(FileUpload, "read_signed_url", return_value="signed-url"):
+            response = self.client.get(
+                f"/api/v1/export_jobs/{export_file.external_id}/"
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data, {"status": "completed", "progress": 100, "url": "signed-url"}
+        )
+
+    def test_export_job_applies_the_filters_of_the_request(self):
+        self.client.force_authenticate(self.super_user)
+        with (
+            patch("care.facility.tasks.exports.export_csv_task.delay") as delay,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            self.client.post("/api/v1/facility/export/?name=Bar")
+        # the task gets the filters, not the query
+        self.assertEqual(json.loads(json.dumps(delay.call_args.args))[3], "name=Bar")
+
+        _, uploaded = self.export_facilities("?name=Bar")
+        rows = self.read_rows(uploaded)
+        self.assertEqual([row[0] for row in rows[1:]], [self.other_facility.name])
+
+    def test_export_job_is_running_while_retried(self):
+        self.client.force_authenticate(self.user)
+        with patch("care.facility.tasks.exports.fail_export_job") as fail_export_job:
+            response, uploaded = self.export_facilities(failures=2)
+        self.assertEqual(uploaded["attempts"], [False, False, True])
+        fail_export_job.assert_not_called()
+        self.assertTrue(
+            FileUpload.objects.get(external_id=response.data["id"]).upload_completed
+        )
+
+    def test_export_job_fails_after_the_last_retry(self):
+        self.client.force_authenticate(self.user)
+        response, uploaded = self.export_facilities(failures=10)
+        self.assertEqual(len(uploaded["attempts"]), 4)
+
+        response = self.client.get(f"/api/v1/export_jobs/{response.data['id']}/")
+        self.assertEqual(response.data, {"status": "failed", "progress": None})
+
+    def test_export_job_of_another_user(self):
+        self.client.force_authenticate(self.super_user)
+        response, _ = self.export_facilities()
+
+        self.client.force_authenticate(self.user)
+        response = self.client.get(f"/api/v1/export_jobs/{response.data['id']}/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_export_files_are_not_listed_with_uploads(self):
+        self.client.force_authenticate(self.user)
+        self.export_facilities()
+
+        response = self.client.get(
+            "/api/v1/files/",
+            {"file_type": "EXPORT", "associating_id": str(self.user.external_id)},
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
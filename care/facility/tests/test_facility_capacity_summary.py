@@ -0,0 +1,122 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils.timezone import now
+
+from care.facility.models import FacilityRelatedSummary
+from care.facility.models.inventory import (
+    FacilityInventoryBurnRate,
+    FacilityInventoryItem,
+    FacilityInventoryLog,
+    FacilityInventorySummary,
+    FacilityInventoryUnit,
+)
+from care.facility.utils.summarization.facility_capacity import (
+    facility_capacity_summary,
+)
+from care.facility.utils.summarization.incremental import (
+    facilities_touched_by_capacity_summary,
+)
+from care.utils.tests.test_utils import TestUtils
+
+
+class FacilityCapacitySummaryTestCase(TestUtils, TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.state = cls.create_state()
+        cls.district = cls.create_district(cls.state)
+        cls.local_body = cls.create_local_body(cls.district)
+        cls.super_user = cls.create_super_user("su", cls.district)
+        cls.unit = FacilityInventoryUnit.objects.create(name="Litre")
+        cls.item = FacilityInventoryItem.objects.create(
+            name="Oxygen", default_unit=cls.unit, min_quantity=10
+        )
+
+    def setUp(self) -> None:
+        pass
+
+    def create_facility_with_data(self):
+        facility = self.create_facility(self.super_user, self.district, self.local_body)
+        self.create_patient(self.district, facility)
+        self.create_patient(self.district, facility, is_active=False)
+        FacilityInventorySummary.objects.create(
+            facility=facility, item=self.item, quantity=80
+        )
+        FacilityInventoryLog.objects.create(
+            facility=facility,
+            item=self.item,
+            unit=self.unit,
+            is_incoming=True,
+            quantity=100,
+            quantity_in_default_unit=100,
+            current_stock=100,
+        )
+        FacilityInventoryLog.objects.create(
+            facility=facility,
+            item=self.item,
+            unit=self.unit,
+            is_incoming=False,
+            quantity=20,
+            quantity_in_default_unit=20,
+            current_stock=80,
+        )
+        return facility
+
+    def test_summary_data(self):
+        facility = self.create_facility_with_data()
+        facility_capacity_summary()
+
+        summary = FacilityRelatedSummary.objects.get(
+            s_type="FacilityCapacity", facility=facility
+        )
+        self.assertEqual(summary.data["actual_live_patients"], 1)
+        self.assertEqual(summary.data["actual_discharged_patients"], 1)
+        self.assertEqual(summary.data["patient_count"], 1)
+        inventory = summary.data["inventory"][str(self.item.id)]
+        self.assertEqual(inventory["start_stock"], 0)
+        self.assertEqual(inventory["end_stock"], 80)
+        self.assertEqual(inventory["total_added"], 100)
+        self.assertEqual(inventory["total_consumed"], 20)
+
+        # a second run on the same day updates the existing summary
+        facility_capacity_summary()
+        self.assertEqual(
+            FacilityRelatedSummary.objects.filter(
+                s_type="FacilityCapacity", facility=facility
+            ).count(),
+            1,
+        )
+
+    def test_query_count_is_independent_of_facility_count(self):
+        self.create_facility_with_data()
+        facility_capacity_summary()
+        with CaptureQueriesContext(connection) as single_facility_queries:
+            facility_capacity_summary()
+
+        for _ in range(10):
+            self.create_facility_with_data()
+        facility_capacity_summary()
+        with CaptureQueriesContext(connection) as many_facility_queries:
+            facility_capacity_summary()
+
+        self.assertEqual(len(single_facility_queries), len(many_facility_queries))
+
+    def test_inventory_summary_changes_touch_the_facility(self):
+        facility = self.create_facility_with_data()
+        since = now()
+        self.assertEqual(facilities_touched_by_capacity_summary(since), set())
+
+        inventory_summary = FacilityInventorySummary.objects.get(facility=facility)
+        inventory_summary.quantity = 60
+        inventory_summary.save()
+        self.assertEqual(facilities_touched_by_capacity_summary(since), {facility.id})
+
+    def test_burn_rate_changes_touch_the_facility(self):
+        facility = self.create_facility_with_data()
+        since = now()
+        self.assertEqual(facilities_touched_by_capacity_summary(since), set())
+
+        FacilityInventoryBurnRate.objects.create(
+            facility=facility, item=self.item, burn_rate=5, current_stock=80
+        )
+        self.assertEqual(facilities_touched_by_capacity_summary(since), {facility.id})
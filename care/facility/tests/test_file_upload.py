@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from rest_framework import status
 from rest_framework.test import APITestCase
 
@@ -91,3 +93,59 @@ class ConsentFileUploadApiTestCase(TestUtils, APITestCase):
         self.assertEqual(all_files.status_code, status.HTTP_200_OK)
         self.assertEqual(all_files.data["count"], 1)
         self.assertEqual(all_files.data["results"][0]["name"], "Test File")
+
+    def create_consent_files(self, count):
+        return [
+            FileUpload.objects.create(
+                name=f"File {i}",
+                internal_name=f"{i}.pdf",
+                file_type=FileUpload.FileType.CONSENT_RECORD,
+                associating_id=self.consent.external_id,
+                uploaded_by=self.user,
+                upload_completed=True,
+            )
+            for i in range(count)
+        ]
+
+    def patch_signing(self):
+        return patch(
+            "care.facility.api.serializers.file_upload.get_read_signed_urls",
+            side_effect=lambda keys: {key: f"signed/{key}" for key in keys},
+        )
+
+    def test_file_list_urls_are_signed_in_one_call(self):
+        files = {str(file.external_id): file for file in self.create_consent_files(3)}
+
+        with self.patch_signing() as get_read_signed_urls:
+            response = self.client.get(
+                "/api/v1/files/",
+                {
+                    "associating_id": self.consent.external_id,
+                    "file_type": "CONSENT_RECORD",
+                },
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        get_read_signed_urls.assert_called_once()
+        self.assertEqual(len(response.data["results"]), 3)
+        for row in response.data["results"]:
+            self.assertEqual(
+                row["read_signed_url"],
+                f"signed/{files[str(row['id'])].get_object_key()}",
+            )
+
+    def test_consent_file_urls_are_signed_in_one_call(self):
+        files = {str(file.external_id): file for file in self.create_consent_files(3)}
+
+        with self.patch_signing() as get_read_signed_urls:
+            response = self.client.get(
+                f"/api/v1/consultation/{self.consultation.external_id}/consents/"
+                f"{self.consent.external_id}/"
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        get_read_signed_urls.assert_called_once()
+        self.assertEqual(len(response.data["files"]), 3)
+        for row in response.data["files"]:
+            self.assertEqual(
+                row["read_signed_url"],
+                f"signed/{files[str(row['id'])].get_object_key()}",
+            )
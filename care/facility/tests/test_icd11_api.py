@@ -1,6 +1,9 @@
+from django.test import override_settings
 from rest_framework import status
 from rest_framework.test import APITestCase
 
+from care.facility.models.icd11_diagnosis import ICD11Diagnosis
+from care.facility.static_data.icd11 import get_icd11_diagnoses_objects_by_ids
 from care.utils.tests.test_utils import TestUtils
 
 
@@ -54,3 +57,20 @@ class TestICD11Api(TestUtils, APITestCase):
     def test_get_icd11_by_invalid_id(self):
         res = self.client.get("/api/v1/icd/invalid/")
         self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_get_icd11_objects_by_ids(self):
+        first, second = ICD11Diagnosis.objects.order_by("id")[:2]
+        ids = [second.id, 0, first.id, second.id]
+
+        # looked up from redis first, then from the in-process cache
+        for _ in range(2):
+            objects = get_icd11_diagnoses_objects_by_ids(ids)
+            self.assertEqual(
+                [obj["id"] for obj in objects], [second.id, first.id, second.id]
+            )
+            self.assertEqual(objects[1]["label"], first.label)
+
+
+@override_settings(STATIC_DATA_SEARCH_BACKEND="memory")
+class TestICD11ApiInMemorySearch(TestICD11Api):
+    pass
@@ -1,3 +1,4 @@
+from django.test import override_settings
 from rest_framework import status
 from rest_framework.test import APITestCase
 
@@ -30,3 +31,8 @@ class TestMedibaseApi(TestUtils, APITestCase):
         self.assertEqual(response.data[0]["name"], "PANADOL")
         self.assertEqual(response.data[0]["generic"], "paracetamol")
         self.assertEqual(response.data[0]["company"], "GSK")
+
+
+@override_settings(STATIC_DATA_SEARCH_BACKEND="memory")
+class TestMedibaseApiInMemorySearch(TestMedibaseApi):
+    pass
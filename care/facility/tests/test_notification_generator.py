@@ -0,0 +1,53 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from care.facility.models.notification import Notification
+from care.utils.notification_handler import NotificationGenerator
+from care.utils.tests.test_utils import TestUtils
+
+
+class NotificationGeneratorTestCase(TestUtils, TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.state = cls.create_state()
+        cls.district = cls.create_district(cls.state)
+        cls.local_body = cls.create_local_body(cls.district)
+        cls.super_user = cls.create_super_user("su", cls.district)
+
+    def create_facility_with_users(self, name, user_count):
+        facility = self.create_facility(self.super_user, self.district, self.local_body)
+        self.link_user_with_facility(self.super_user, facility, self.super_user)
+        for i in range(user_count):
+            self.create_user(f"{name}_{i}", self.district, home_facility=facility)
+        return facility
+
+    def notify_patient_updated(self, facility):
+        patient = self.create_patient(self.district, facility)
+        with CaptureQueriesContext(connection) as context:
+            NotificationGenerator(
+                event=Notification.Event.PATIENT_UPDATED,
+                caused_by=self.super_user,
+                caused_object=patient,
+                facility=facility,
+            ).generate()
+        return patient, len(context.captured_queries)
+
+    def test_notifications_are_created_for_facility_users(self):
+        facility = self.create_facility_with_users("small", 3)
+        patient, _ = self.notify_patient_updated(facility)
+
+        notifications = Notification.objects.filter(
+            caused_objects__patient=str(patient.external_id)
+        )
+        self.assertEqual(notifications.count(), 3)
+        self.assertFalse(notifications.filter(intended_for=self.super_user).exists())
+
+    def test_query_count_does_not_depend_on_facility_size(self):
+        _, small_facility_queries = self.notify_patient_updated(
+            self.create_facility_with_users("small", 2)
+        )
+        _, large_facility_queries = self.notify_patient_updated(
+            self.create_facility_with_users("large", 20)
+        )
+        self.assertEqual(small_facility_queries, large_facility_queries)
@@ -1,10 +1,16 @@
 from datetime import timedelta
+from io import StringIO
 
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase
 
 from care.facility.models import PatientRegistration
+from care.facility.models.daily_round import DailyRound
+from care.facility.models.events import PatientConsultationEvent
 from care.facility.models.patient_consultation import PatientConsultation
 from care.utils.tests.test_utils import TestUtils
 
@@ -324,3 +330,144 @@ class TestDailyRoundApi(TestUtils, APITestCase):
             data,
         )
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_list_log_updates_query_count_does_not_depend_on_facility_users(self):
+        for _ in range(3):
+            self.create_log_update()
+        url = f"/api/v1/consultation/{self.consultation_with_bed.external_id}/daily_rounds/"
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        query_count = len(context.captured_queries)
+
+        for i in range(20):
+            self.create_user(f"staff_{i}", self.district, home_facility=self.facility)
+        with self.assertNumQueries(query_count):
+            self.client.get(url)
+
+    def test_list_log_updates_by_user_of_other_facility(self):
+        other_facility = self.create_facility(
+            self.super_user, self.district, self.local_body
+        )
+        user = self.create_user(
+            "other_staff", self.district, home_facility=other_facility
+        )
+        self.client.force_authenticate(user=user)
+        response = self.client.get(
+            f"/api/v1/consultation/{self.consultation_with_bed.external_id}/daily_rounds/"
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def get_timeseries(self, headers=None, **params):
+        return self.client.get(
+            f"/api/v1/consultation/{self.consultation_with_bed.external_id}/daily_rounds/timeseries/",
+            params,
+            **(headers or {}),
+        )
+
+    def create_vitals(self):
+        taken_at = timezone.now() - timedelta(hours=3)
+        for i, systolic in enumerate((110, 130, 150)):
+            response = self.create_log_update(
+                taken_at=(taken_at + timedelta(hours=i)).isoformat(),
+                bp={"systolic": systolic, "diastolic": 80},
+            )
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return taken_at
+
+    def test_timeseries(self):
+        self.create_vitals()
+        response = self.get_timeseries(fields="bp.systolic,bp.diastolic")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["timestamps"]), 3)
+        self.assertEqual(response.data["fields"]["bp.systolic"], [110, 130, 150])
+        self.assertEqual(response.data["fields"]["bp.diastolic"], [80, 80, 80])
+
+    def test_timeseries_downsampling(self):
+        taken_at = self.create_vitals()
+        response = self.get_timeseries(
+            fields="bp.systolic",
+            taken_at_after=taken_at.isoformat(),
+            bucket_size=2 * 60 * 60,
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["timestamps"]), 2)
+        self.assertEqual(
+            response.data["fields"]["bp.systolic"],
+            {"min": [110, 150], "max": [130, 150], "avg": [120, 150]},
+        )
+
+    def test_timeseries_invalid_field(self):
+        response = self.get_timeseries(fields="not_a_field")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_timeseries_etag(self):
+        self.create_vitals()
+        response = self.get_timeseries(fields="bp.systolic")
+        etag = response.headers["ETag"]
+
+        response = self.get_timeseries(
+            fields="bp.systolic", headers={"HTTP_IF_NONE_MATCH": etag}
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.create_log_update()
+        response = self.get_timeseries(
+            fields="bp.systolic", headers={"HTTP_IF_NONE_MATCH": etag}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response.headers["ETag"], etag)
+
+    def create_asset_user(self):
+        asset = self.create_asset(self.asset_location)
+        self.create_asset_bed(asset, self.bed)
+        return self.create_user(f"asset{asset.external_id}", self.district, asset=asset)
+
+    def create_automated_log_updates(self, readings):
+        return self.client.post(
+            f"/api/v1/consultation/{self.consultation_with_bed.external_id}/daily_rounds/automated/",
+            data={"readings": readings},
+            format="json",
+        )
+
+    def test_create_automated_log_updates(self):
+        call_command("load_event_types", stdout=StringIO())
+        self.client.force_authenticate(user=self.create_asset_user())
+        taken_at = timezone.now() - timedelta(minutes=10)
+        readings = [
+            {
+                "rounds_type": "AUTOMATED",
+                "taken_at": (taken_at + timedelta(minutes=i)).isoformat(),
+                "pulse": 70 + i,
+                "bp": {"systolic": 120, "diastolic": 80},
+            }
+            for i in range(5)
+        ]
+        response = self.create_automated_log_updates(readings)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["count"], 5)
+        daily_rounds = DailyRound.objects.filter(
+            consultation=self.consultation_with_bed
+        ).order_by("taken_at")
+        self.assertEqual([d.pulse for d in daily_rounds], [70, 71, 72, 73, 74])
+        self.assertTrue(
+            PatientConsultationEvent.objects.filter(
+                consultation=self.consultation_with_bed,
+                object_model="DailyRound",
+                object_id=daily_rounds[0].id,
+            ).exists()
+        )
+
+    def test_create_automated_log_updates_rejects_other_rounds_types(self):
+        self.client.force_authenticate(user=self.create_asset_user())
+        response = self.create_automated_log_updates(
+            [{"rounds_type": "NORMAL", "taken_at": timezone.now().isoformat()}]
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_create_automated_log_updates_by_user(self):
+        response = self.create_automated_log_updates(
+            [{"rounds_type": "AUTOMATED", "taken_at": timezone.now().isoformat()}]
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
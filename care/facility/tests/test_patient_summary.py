@@ -0,0 +1,128 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils.timezone import localtime, now
+from freezegun import freeze_time
+
+from care.facility.models import DistrictScopedSummary, FacilityRelatedSummary
+from care.facility.utils.summarization.district.patient_summary import (
+    district_patient_summary,
+)
+from care.facility.utils.summarization.incremental import (
+    districts_touched_by_patients,
+    facilities_touched_by_patient_summary,
+    run_summary,
+)
+from care.facility.utils.summarization.patient_summary import patient_summary
+from care.utils.tests.test_utils import OverrideCache, TestUtils
+
+
+class PatientSummaryTestCase(TestUtils, TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.state = cls.create_state()
+        cls.district = cls.create_district(cls.state)
+        cls.local_body = cls.create_local_body(cls.district)
+        cls.super_user = cls.create_super_user("su", cls.district)
+        cls.facility = cls.create_facility(cls.super_user, cls.district, cls.local_body)
+        cls.location = cls.create_asset_location(cls.facility)
+        cls.icu_bed = cls.create_bed(cls.facility, cls.location, bed_type=2)
+
+        cls.patient = cls.create_patient(
+            cls.district, cls.facility, local_body=cls.local_body
+        )
+        cls.consultation = cls.create_consultation(cls.patient, cls.facility)
+        cls.consultation.current_bed = cls.create_consultation_bed(
+            cls.consultation, cls.icu_bed
+        )
+        cls.consultation.save()
+        cls.create_patient(
+            cls.district, cls.facility, local_body=cls.local_body, is_active=False
+        )
+
+    def setUp(self) -> None:
+        pass
+
+    def test_facility_patient_summary(self):
+        patient_summary()
+
+        summary = FacilityRelatedSummary.objects.get(
+            s_type="PatientSummary", facility=self.facility
+        )
+        self.assertEqual(summary.data["total_patients_icu"], 1)
+        self.assertEqual(summary.data["total_patients_isolation"], 0)
+        self.assertEqual(summary.data["total_patients_home_quarantine"], 1)
+
+    def test_unchanged_summary_is_not_rewritten(self):
+        patient_summary()
+        modified_date = FacilityRelatedSummary.objects.get(
+            s_type="PatientSummary", facility=self.facility
+        ).modified_date
+
+        patient_summary()
+        self.assertEqual(
+            FacilityRelatedSummary.objects.get(
+                s_type="PatientSummary", facility=self.facility
+            ).modified_date,
+            modified_date,
+        )
+
+    def test_district_patient_summary(self):
+        district_patient_summary()
+
+        summary = DistrictScopedSummary.objects.get(
+            s_type="PatientSummary", district=self.district
+        )
+        local_body_summary = summary.data[str(self.local_body.id)]
+        self.assertEqual(local_body_summary["total_inactive"], 1)
+        self.assertEqual(local_body_summary["total_patients_icu"], 1)
+
+    def test_incremental_summary_recomputes_only_changed_facilities(self):
+        override = OverrideCache(self)
+        override.enable()
+        self.addCleanup(override.disable)
+        other_facility = self.create_facility(
+            self.super_user, self.district, self.local_body
+        )
+        self.create_patient(self.district, other_facility)
+        start = localtime(now()).replace(hour=12) + timedelta(days=1)
+
+        with freeze_time(start):
+            # no high-water mark yet, so everything is rebuilt
+            self.assertIsNone(run_summary("PatientSummary"))
+        with freeze_time(start + timedelta(minutes=10)):
+            self.assertEqual(run_summary("PatientSummary"), 0)
+        with freeze_time(start + timedelta(minutes=20)):
+            self.patient.save()
+            self.assertEqual(run_summary("PatientSummary"), 1)
+        with freeze_time(start + timedelta(minutes=30)):
+            self.assertIsNone(run_summary("PatientSummary", incremental=False))
+        with freeze_time(start + timedelta(days=1)):
+            # summaries are per day, a new day needs a full rebuild
+            self.assertIsNone(run_summary("PatientSummary"))
+
+    def test_consultation_changes_touch_the_facility(self):
+        since = now()
+        self.assertEqual(facilities_touched_by_patient_summary(since), set())
+
+        self.consultation.suggestion = "A"
+        self.consultation.discharge_date = now()
+        self.consultation.save(
+            update_fields=["suggestion", "discharge_date", "modified_date"]
+        )
+        self.assertEqual(
+            facilities_touched_by_patient_summary(since), {self.facility.id}
+        )
+        self.assertEqual(districts_touched_by_patients(since), {self.district.id})
+
+    def test_bed_changes_touch_the_facility(self):
+        since = now()
+        self.assertEqual(districts_touched_by_patients(since), set())
+
+        consultation_bed = self.consultation.current_bed
+        consultation_bed.end_date = now()
+        consultation_bed.save(update_fields=["end_date", "modified_date"])
+        self.assertEqual(
+            facilities_touched_by_patient_summary(since), {self.facility.id}
+        )
+        self.assertEqual(districts_touched_by_patients(since), {self.district.id})
@@ -0,0 +1,218 @@
+import gzip
+import logging
+import tempfile
+from dataclasses import dataclass, field
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import QuerySet
+from django.http import HttpRequest, QueryDict
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from rest_framework.request import Request
+
+from care.facility.models import (
+    Facility,
+    FacilityCapacity,
+    FacilityPatientStatsHistory,
+    HospitalDoctors,
+    PatientRegistration,
+    ShiftingRequest,
+)
+from care.facility.models.file_upload import FileUpload
+from care.utils.csv_export import EXPORT_CHUNK_SIZE, iter_csv_rows
+
+logger = logging.getLogger(__name__)
+
+# the progress of a job is kept for as long as a job may wait in the queue
+PROGRESS_DURATION = 24 * 60 * 60  # 1 day
+# how long the download link of a finished export is valid for
+DOWNLOAD_URL_DURATION = 60 * 60  # 1 hour
+# the progress of a job that failed, there is no file to download
+FAILED_PROGRESS = -1
+
+FACILITY_VIEWSET = "care.facility.api.viewsets.facility.FacilityViewSet"
+
+
+@dataclass(frozen=True)
+class CSVExport:
+    name: str
+    # the viewset the export is requested from, its filters scope the export
+    viewset: str
+    field_header_map: dict
+    field_serializer_map: dict
+    annotate_fields: dict = field(default_factory=dict)
+
+    def get_queryset(self, queryset: QuerySet) -> QuerySet:
+        return queryset.annotate(**self.annotate_fields).values(
+            *self.field_header_map.keys()
+        )
+
+
+EXPORTS = {
+    export.name: export
+    for export in (
+        CSVExport(
+            "patient",
+            "care.facility.api.viewsets.patient.PatientViewSet",
+            PatientRegistration.CSV_MAPPING,
+            PatientRegistration.CSV_MAKE_PRETTY,
+            PatientRegistration.CSV_ANNOTATE_FIELDS,
+        ),
+        CSVExport(
+            "shifting",
+            "care.facility.api.viewsets.shifting.ShiftingViewSet",
+            ShiftingRequest.CSV_MAPPING,
+            ShiftingRequest.CSV_MAKE_PRETTY,
+            ShiftingRequest.CSV_ANNOTATE_FIELDS,
+        ),
+        CSVExport(
+            "facility",
+            FACILITY_VIEWSET,
+            Facility.CSV_MAPPING,
+            Facility.CSV_MAKE_PRETTY,
+        ),
+        CSVExport(
+            "facility_capacity",
+            FACILITY_VIEWSET,
+            {**Facility.CSV_MAPPING, **FacilityCapacity.CSV_RELATED_MAPPING},
+            {**Facility.CSV_MAKE_PRETTY, **FacilityCapacity.CSV_MAKE_PRETTY},
+        ),
+        CSVExport(
+            "facility_doctors",
+            FACILITY_VIEWSET,
+            {**Facility.CSV_MAPPING, **HospitalDoctors.CSV_RELATED_MAPPING},
+            {**Facility.CSV_MAKE_PRETTY, **HospitalDoctors.CSV_MAKE_PRETTY},
+        ),
+        CSVExport(
+            "facility_triage",
+            FACILITY_VIEWSET,
+            {**Facility.CSV_MAPPING, **FacilityPatientStatsHistory.CSV_RELATED_MAPPING},
+            {
+                **Facility.CSV_MAKE_PRETTY,
+                **FacilityPatientStatsHistory.CSV_MAKE_PRETTY,
+            },
+        ),
+    )
+}
+
+
+def progress_key(job_id) -> str:
+    return f"export_job_{job_id}"
+
+
+def set_progress(job_id, progress: int):
+    cache.set(progress_key(job_id), progress, timeout=PROGRESS_DURATION)
+
+
+def get_progress(job_id) -> int | None:
+    return cache.get(progress_key(job_id))
+
+
+def clear_progress(job_id):
+    cache.delete(progress_key(job_id))
+
+
+def fail_export_job(job_id):
+    set_progress(job_id, FAILED_PROGRESS)
+
+
+def get_export_queryset(export: CSVExport, user, query_params: str) -> QuerySet:
+    """
+    Rebuilds the queryset of an export from the query params of the request,
+    through the permission filters and the filterset of the export's viewset.
+    """
+    http_request = HttpRequest()
+    http_request.method = "POST"
+    http_request.GET = QueryDict(query_params)
+    request = Request(http_request)
+    request.user = user
+
+    view = import_string(export.viewset)(
+        request=request, args=(), kwargs={}, format_kwarg=None, action="export"
+    )
+    return export.get_queryset(view.filter_queryset(view.get_queryset()))
+
+
+def create_export_job(user, export: CSVExport, query_params: str) -> FileUpload:
+    """
+    Creates the file the export will be uploaded to and queues the export once
+    the file is committed, the external id of the file is the id of the job.
+    """
+    from care.facility.tasks.exports import export_csv_task
+
+    export_file = FileUpload.objects.create(
+        name=f"{export.name}_export-{timezone.now():%Y-%m-%d-%H%M%S}",
+        internal_name=f"{uuid4()}.csv.gz",
+        file_type=FileUpload.FileType.EXPORT.value,
+        associating_id=str(user.external_id),
+        uploaded_by=user,
+    )
+    set_progress(export_file.external_id, 0)
+    transaction.on_commit(
+        lambda: export_csv_task.delay(
+            export_file.id, export.name, user.id, query_params
+        )
+    )
+    return export_file
+
+
+def generate_and_upload_export(
+    export_file: FileUpload, export: CSVExport, queryset: QuerySet
+):
+    """
+    Writes the export as a gzipped csv a chunk at a time and uploads it to the
+    patient bucket, the progress is updated after every chunk. Failing the job
+    is left to the caller, which knows whether it will be retried.
+    """
+    job_id = export_file.external_id
+    logger.info("Generating %s export %s", export.name, job_id)
+
+    set_progress(job_id, 1)
+    total = queryset.count()
+    with tempfile.TemporaryFile() as file:
+        with gzip.GzipFile(fileobj=file, mode="wb") as compressed:
+            # the first chunk is the header
+            chunks = iter_csv_rows(
+                queryset, export.field_header_map, export.field_serializer_map
+            )
+            for index, chunk in enumerate(chunks):
+                compressed.write(chunk.encode())
+                if index and total:
+                    set_progress(
+                        job_id, min(99, index * EXPORT_CHUNK_SIZE * 100 // total)
+                    )
+
+        file.seek(0)
+        logger.info("Uploading %s export %s", export.name, job_id)
+        export_file.put_object(
+            file,
+            ContentType="text/csv",
+            ContentEncoding="gzip",
+            ContentDisposition=f'attachment; filename="{export_file.name}.csv"',
+        )
+    export_file.upload_completed = True
+    export_file.save(update_fields=["upload_completed", "modified_date"])
+
+    clear_progress(job_id)
+    logger.info("Uploaded %s export %s, %s rows", export.name, job_id, total)
+    return export_file
+
+
+def get_export_job_status(export_file: FileUpload) -> dict:
+    """
+    Returns the status of an export job, with a signed url to download the
+    export once it has been uploaded.
+    """
+    if export_file.upload_completed:
+        return {
+            "status": "completed",
+            "progress": 100,
+            "url": export_file.read_signed_url(duration=DOWNLOAD_URL_DURATION),
+        }
+
+    progress = get_progress(export_file.external_id)
+    if progress is None or progress == FAILED_PROGRESS:
+        return {"status": "failed", "progress": None}
+    return {"status": "pending" if progress == 0 else "running", "progress": progress}
@@ -1,121 +1,183 @@
-from django.db.models import Sum
+from collections import defaultdict
+
+from django.db.models import Count, Q, Sum
 from django.utils.timezone import localtime, now
 
 from care.facility.api.serializers.facility import FacilitySerializer
 from care.facility.api.serializers.facility_capacity import FacilityCapacitySerializer
 from care.facility.models import (
+    Bed,
     Facility,
     FacilityCapacity,
     FacilityRelatedSummary,
     PatientRegistration,
 )
+from care.facility.models.facility_flag import FacilityFlag
 from care.facility.models.inventory import (
     FacilityInventoryBurnRate,
     FacilityInventoryLog,
     FacilityInventorySummary,
 )
+from care.facility.utils.summarization.utils import filter_by_ids, save_summaries
 
 
-def facility_capacity_summary():
-    capacity_objects = FacilityCapacity.objects.all()
-    capacity_summary = {}
-    current_date = localtime(now()).replace(hour=0, minute=0, second=0, microsecond=0)
+class FacilityCapacitySummaryFacilitySerializer(FacilitySerializer):
+    """
+    FacilitySerializer that reads the per facility counts and flags from
+    the context instead of querying them for every facility.
+    """
+
+    def get_bed_count(self, facility):
+        return self.context["bed_counts"].get(facility.id, 0)
+
+    def get_patient_count(self, facility):
+        return self.context["patient_counts"].get(facility.id, {}).get("live", 0)
+
+    def get_facility_flags(self, facility):
+        return self.context["facility_flags"].get(facility.id, ())
 
-    for facility_obj in Facility.objects.all():
-        # Calculate Actual Patients Discharged and Live in this Facility
-        patients_in_facility = PatientRegistration.objects.filter(
-            facility_id=facility_obj.id
-        ).select_related("state", "district", "local_body")
-        capacity_summary[facility_obj.id] = FacilitySerializer(facility_obj).data
-        capacity_summary[facility_obj.id]["features"] = list(
-            capacity_summary[facility_obj.id]["features"]
+
+def get_patient_counts(facility_ids=None):
+    return {
+        row["facility_id"]: row
+        for row in filter_by_ids(PatientRegistration.objects.all(), facility_ids)
+        .order_by()
+        .values("facility_id")
+        .annotate(
+            live=Count("id", filter=Q(is_active=True)),
+            discharged=Count("id", filter=Q(is_active=False)),
         )
-        capacity_summary[facility_obj.id]["actual_live_patients"] = (
-            patients_in_facility.filter(is_active=True).count()
+    }
+
+
+def get_bed_counts(facility_ids=None):
+    return dict(
+        filter_by_ids(Bed.objects.all(), facility_ids)
+        .order_by()
+        .values("facility_id")
+        .annotate(count=Count("id"))
+        .values_list("facility_id", "count")
+    )
+
+
+def get_facility_flags(facility_ids=None):
+    facility_flags = defaultdict(list)
+    for facility_id, flag in filter_by_ids(
+        FacilityFlag.objects.all(), facility_ids
+    ).values_list("facility_id", "flag"):
+        facility_flags[facility_id].append(flag)
+    return {facility_id: tuple(flags) for facility_id, flags in facility_flags.items()}
+
+
+def get_inventory_summary(current_date, facility_ids=None):
+    """
+    Builds the inventory section of every facility's summary in a fixed number
+    of queries, keyed by facility id and then by item id.
+    """
+    burn_rates = {
+        (facility_id, item_id): burn_rate
+        for facility_id, item_id, burn_rate in filter_by_ids(
+            FacilityInventoryBurnRate.objects.all(), facility_ids
+        ).values_list("facility_id", "item_id", "burn_rate")
+    }
+
+    todays_logs = filter_by_ids(
+        FacilityInventoryLog.objects.filter(
+            created_date__gte=current_date, probable_accident=False
+        ),
+        facility_ids,
+    ).order_by()
+    log_totals = {
+        (row["facility_id"], row["item_id"]): row
+        for row in todays_logs.values("facility_id", "item_id").annotate(
+            total_consumed=Sum("quantity_in_default_unit", filter=Q(is_incoming=False)),
+            total_added=Sum("quantity_in_default_unit", filter=Q(is_incoming=True)),
         )
-        discharge_patients = patients_in_facility.filter(is_active=False)
-        capacity_summary[facility_obj.id]["actual_discharged_patients"] = (
-            discharge_patients.count()
+    }
+    end_stocks = {
+        (facility_id, item_id): current_stock
+        for facility_id, item_id, current_stock in todays_logs.order_by(
+            "facility_id", "item_id", "-created_date"
         )
-        capacity_summary[facility_obj.id]["availability"] = []
+        .distinct("facility_id", "item_id")
+        .values_list("facility_id", "item_id", "current_stock")
+    }
+
+    inventory_summary = defaultdict(dict)
+    for summary_obj in filter_by_ids(
+        FacilityInventorySummary.objects.all(), facility_ids
+    ).select_related("item", "item__default_unit"):
+        key = (summary_obj.facility_id, summary_obj.item_id)
+        end_stock = end_stocks.get(key, summary_obj.quantity)
+        totals = log_totals.get(key, {})
+        total_consumed = totals.get("total_consumed") or 0
+        total_added = totals.get("total_added") or 0
+        inventory_summary[summary_obj.facility_id][summary_obj.item_id] = {
+            "item_name": summary_obj.item.name,
+            "stock": summary_obj.quantity,
+            "unit": summary_obj.item.default_unit.name,
+            "is_low": summary_obj.is_low,
+            "burn_rate": burn_rates.get(key),
+            "start_stock": end_stock - total_added + total_consumed,
+            "end_stock": end_stock,
+            "total_consumed": total_consumed,
+            "total_added": total_added,
+            "modified_date": summary_obj.modified_date.astimezone().isoformat(),
+        }
+    return inventory_summary
+
+
+def facility_capacity_summary(facility_ids=None):
+    current_date = localtime(now()).replace(hour=0, minute=0, second=0, microsecond=0)
 
-        temp_inventory_summary_obj = {}
-        summary_objs = FacilityInventorySummary.objects.filter(
-            facility_id=facility_obj.id
+    patient_counts = get_patient_counts(facility_ids)
+    inventory_summary = get_inventory_summary(current_date, facility_ids)
+
+    facilities = list(
+        filter_by_ids(Facility.objects.all(), facility_ids, "id").select_related(
+            "ward", "local_body", "district", "state"
         )
-        for summary_obj in summary_objs:
-            burn_rate = FacilityInventoryBurnRate.objects.filter(
-                facility_id=facility_obj.id, item_id=summary_obj.item.id
-            ).first()
-            log_query = FacilityInventoryLog.objects.filter(
-                facility_id=facility_obj.id,
-                item_id=summary_obj.item.id,
-                created_date__gte=current_date,
-                probable_accident=False,
-            )
-            end_log = log_query.order_by("-created_date").first()
-            end_stock = summary_obj.quantity
-            if end_log:
-                end_stock = end_log.current_stock
-            total_consumed = 0
-            temp1 = log_query.filter(is_incoming=False).aggregate(
-                Sum("quantity_in_default_unit")
-            )
-            if temp1:
-                total_consumed = temp1.get("quantity_in_default_unit__sum", 0) or 0
-            total_added = 0
-            temp2 = log_query.filter(is_incoming=True).aggregate(
-                Sum("quantity_in_default_unit")
-            )
-            if temp2:
-                total_added = temp2.get("quantity_in_default_unit__sum", 0) or 0
-
-            start_stock = end_stock - total_added + total_consumed
-
-            if burn_rate:
-                burn_rate = burn_rate.burn_rate
-            temp_inventory_summary_obj[summary_obj.item.id] = {
-                "item_name": summary_obj.item.name,
-                "stock": summary_obj.quantity,
-                "unit": summary_obj.item.default_unit.name,
-                "is_low": summary_obj.is_low,
-                "burn_rate": burn_rate,
-                "start_stock": start_stock,
-                "end_stock": end_stock,
-                "total_consumed": total_consumed,
-                "total_added": total_added,
-                "modified_date": summary_obj.modified_date.astimezone().isoformat(),
-            }
-        capacity_summary[facility_obj.id]["inventory"] = temp_inventory_summary_obj
-
-    for capacity_object in capacity_objects:
+    )
+    serializer_context = {
+        "bed_counts": get_bed_counts(facility_ids),
+        "patient_counts": patient_counts,
+        "facility_flags": get_facility_flags(facility_ids),
+    }
+
+    capacity_summary = {}
+    for facility_obj, facility_data in zip(
+        facilities,
+        FacilityCapacitySummaryFacilitySerializer(
+            facilities, many=True, context=serializer_context
+        ).data,
+        strict=True,
+    ):
+        # Actual Patients Discharged and Live in this Facility
+        facility_patient_counts = patient_counts.get(facility_obj.id, {})
+        facility_data["features"] = list(facility_data["features"])
+        facility_data["actual_live_patients"] = facility_patient_counts.get("live", 0)
+        facility_data["actual_discharged_patients"] = facility_patient_counts.get(
+            "discharged", 0
+        )
+        facility_data["availability"] = []
+        facility_data["inventory"] = inventory_summary.get(facility_obj.id, {})
+        capacity_summary[facility_obj.id] = facility_data
+
+    for capacity_object in filter_by_ids(FacilityCapacity.objects.all(), facility_ids):
         facility_id = capacity_object.facility_id
         if facility_id not in capacity_summary:
             # This facility is either deleted or not active
             continue
-        if "availability" not in capacity_summary[facility_id]:
-            capacity_summary[facility_id]["availability"] = []
         capacity_summary[facility_id]["availability"].append(
             FacilityCapacitySerializer(capacity_object).data
         )
 
-    for i in capacity_summary:
-        facility_summary_obj = None
-        if FacilityRelatedSummary.objects.filter(
-            s_type="FacilityCapacity",
-            facility_id=i,
-            created_date__gte=current_date,
-        ).exists():
-            facility_summary_obj = FacilityRelatedSummary.objects.get(
-                s_type="FacilityCapacity",
-                facility_id=i,
-                created_date__gte=current_date,
-            )
-        else:
-            facility_summary_obj = FacilityRelatedSummary(
-                s_type="FacilityCapacity", facility_id=i
-            )
-        facility_summary_obj.data = capacity_summary[i]
-        facility_summary_obj.save()
+    save_summaries(
+        FacilityRelatedSummary,
+        "facility",
+        "FacilityCapacity",
+        capacity_summary,
+        Q(created_date__gte=current_date),
+    )
 
     return True
@@ -0,0 +1,182 @@
+"""
+Incremental summarisation.
+
+Every summary stores a high-water mark, the time at which its last successful
+run started. Subsequent runs only recompute the facilities / districts that
+have rows modified since then. A full rebuild is done when no mark is present,
+when the day has changed since the last run (summaries are created per day)
+or when explicitly requested.
+"""
+
+import logging
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db.models import Q
+from django.utils.timezone import localtime, now
+
+from care.facility.models import (
+    Bed,
+    ConsultationBed,
+    Facility,
+    FacilityCapacity,
+    FacilityPatientStatsHistory,
+    PatientConsultation,
+    PatientRegistration,
+    PatientSample,
+)
+from care.facility.models.inventory import (
+    FacilityInventoryBurnRate,
+    FacilityInventoryLog,
+    FacilityInventorySummary,
+)
+from care.facility.utils.summarization.district.patient_summary import (
+    district_patient_summary,
+)
+from care.facility.utils.summarization.facility_capacity import (
+    facility_capacity_summary,
+)
+from care.facility.utils.summarization.patient_summary import patient_summary
+from care.facility.utils.summarization.tests_summary import tests_summary
+from care.facility.utils.summarization.triage_summary import triage_summary
+
+logger = logging.getLogger(__name__)
+
+HIGH_WATER_MARK_CACHE_KEY = "summary_high_water_mark:{summary}"
+# rows committed by transactions that were open when the last run started
+# carry a modified_date slightly older than the mark
+HIGH_WATER_MARK_OVERLAP = timedelta(minutes=2)
+
+
+def changed_since(model, since):
+    # soft deleted rows are changes too, so bypass the default manager
+    return model._base_manager.filter(modified_date__gte=since)  # noqa: SLF001
+
+
+def _ids(queryset, field):
+    return set(queryset.values_list(field, flat=True))
+
+
+def facilities_touched_by_consultations(since):
+    # discharges, suggestions and bed changes do not touch the patient
+    return _ids(changed_since(PatientConsultation, since), "facility_id") | _ids(
+        changed_since(ConsultationBed, since), "consultation__facility_id"
+    )
+
+
+def facilities_touched_by_patients(since):
+    patients = changed_since(PatientRegistration, since)
+    # a patient moving between facilities affects every facility it visited
+    return (
+        _ids(patients, "facility_id")
+        | _ids(
+            PatientConsultation.objects.filter(patient_id__in=patients.values("id")),
+            "facility_id",
+        )
+        | facilities_touched_by_consultations(since)
+    )
+
+
+def facilities_touched_by_patient_summary(since):
+    return facilities_touched_by_patients(since) | _ids(
+        changed_since(Facility, since), "id"
+    )
+
+
+def facilities_touched_by_capacity_summary(since):
+    return (
+        facilities_touched_by_patient_summary(since)
+        | _ids(changed_since(FacilityInventoryLog, since), "facility_id")
+        | _ids(changed_since(FacilityCapacity, since), "facility_id")
+        | _ids(changed_since(Bed, since), "facility_id")
+        | _ids(changed_since(FacilityInventorySummary, since), "facility_id")
+        | _ids(changed_since(FacilityInventoryBurnRate, since), "facility_id")
+    )
+
+
+def facilities_touched_by_tests_summary(since):
+    return facilities_touched_by_patient_summary(since) | _ids(
+        changed_since(PatientSample, since), "consultation__facility_id"
+    )
+
+
+def facilities_touched_by_triage_summary(since):
+    return _ids(changed_since(Facility, since), "id") | _ids(
+        changed_since(FacilityPatientStatsHistory, since), "facility_id"
+    )
+
+
+def districts_touched_by_patients(since):
+    patients = PatientRegistration._base_manager.filter(  # noqa: SLF001
+        Q(modified_date__gte=since)
+        | Q(id__in=changed_since(PatientConsultation, since).values("patient_id"))
+        | Q(
+            id__in=changed_since(ConsultationBed, since).values(
+                "consultation__patient_id"
+            )
+        )
+    )
+    return _ids(patients, "district_id") | _ids(patients, "local_body__district_id")
+
+
+# summary -> (summarize function, keyword for the ids to recompute, touched ids)
+SUMMARIES = {
+    "FacilityCapacity": (
+        facility_capacity_summary,
+        "facility_ids",
+        facilities_touched_by_capacity_summary,
+    ),
+    "PatientSummary": (
+        patient_summary,
+        "facility_ids",
+        facilities_touched_by_patient_summary,
+    ),
+    "DistrictPatientSummary": (
+        district_patient_summary,
+        "district_ids",
+        districts_touched_by_patients,
+    ),
+    "TestSummary": (
+        tests_summary,
+        "facility_ids",
+        facilities_touched_by_tests_summary,
+    ),
+    "TriageSummary": (
+        triage_summary,
+        "facility_ids",
+        facilities_touched_by_triage_summary,
+    ),
+}
+
+
+def _is_same_day(since, current_time):
+    return (
+        since.date() == current_time.date()
+        and localtime(since).date() == localtime(current_time).date()
+    )
+
+
+def run_summary(summary, incremental=True):
+    """
+    Runs the given summary, recomputing only what changed since the last run
+    when `incremental` is set. Returns the number of facilities / districts
+    that were recomputed, None for a full rebuild.
+    """
+    summarize, ids_kwarg, get_touched_ids = SUMMARIES[summary]
+    cache_key = HIGH_WATER_MARK_CACHE_KEY.format(summary=summary)
+    started_at = now()
+
+    since = cache.get(cache_key) if incremental else None
+    if since is None or not _is_same_day(since, started_at):
+        summarize()
+        recomputed = None
+    else:
+        touched_ids = get_touched_ids(since - HIGH_WATER_MARK_OVERLAP)
+        touched_ids.discard(None)
+        if touched_ids:
+            summarize(**{ids_kwarg: touched_ids})
+        recomputed = len(touched_ids)
+        logger.info("Incrementally summarized %s for %s ids", summary, recomputed)
+
+    cache.set(cache_key, started_at, timeout=None)
+    return recomputed
@@ -1,103 +1,79 @@
-from django.db.models import Q
+from collections import defaultdict
+
+from django.db.models import Count, Q
 from django.utils.timezone import now
 
 from care.facility.models import Facility, FacilityRelatedSummary, PatientRegistration
 from care.facility.models.patient_base import BedTypeChoices
+from care.facility.utils.summarization.utils import filter_by_ids, save_summaries
 
+ACTIVE_PATIENT_FILTER = Q(
+    is_active=True, last_consultation__discharge_date__isnull=True
+)
 
-def patient_summary():
-    facility_objects = Facility.objects.all()
-    patient_summary = {}
-    for facility_object in facility_objects:
-        facility_id = facility_object.id
-        if facility_id not in patient_summary:
-            patient_summary[facility_id] = {
-                "facility_name": facility_object.name,
-                "district": facility_object.district.name,
-                "facility_external_id": str(facility_object.external_id),
-            }
-
-            patients = PatientRegistration.objects.filter(
-                is_active=True,
-                last_consultation__discharge_date__isnull=True,
-                last_consultation__facility=facility_object,
-            )
-
-            # Get Total Counts
-
-            for bed_type_choice in BedTypeChoices:
-                db_value, text = bed_type_choice
-                patient_filters = {
-                    "last_consultation__" + "current_bed__bed__bed_type": db_value
-                }
-                count = patients.filter(**patient_filters).count()
-                clean_name = "total_patients_" + "_".join(text.lower().split())
-                patient_summary[facility_id][clean_name] = count
 
-            home_quarantine = Q(last_consultation__suggestion="HI")
+def get_patient_counts_by(group_by, patient_filter=None):
+    """
+    Counts active patients per bed type (in total and for today) and in home
+    quarantine, for every value of `group_by`, in a single grouped query.
 
-            total_patients_home_quarantine = patients.filter(home_quarantine).count()
-            patient_summary[facility_id]["total_patients_home_quarantine"] = (
-                total_patients_home_quarantine
-            )
+    Returns a dict of group_by value -> counts keyed by the summary field names,
+    groups without any patients get all counts as zero.
+    """
+    today_filter = Q(last_consultation__created_date__startswith=now().date())
+    home_quarantine = Q(last_consultation__suggestion="HI")
 
-            # Apply Date Filters
-
-            patients_today = patients.filter(
-                last_consultation__created_date__startswith=now().date()
-            )
+    aggregates = {}
+    for db_value, text in BedTypeChoices:
+        clean_name = "_".join(text.lower().split())
+        bed_type_filter = ACTIVE_PATIENT_FILTER & Q(
+            last_consultation__current_bed__bed__bed_type=db_value
+        )
+        aggregates[f"total_patients_{clean_name}"] = Count("id", filter=bed_type_filter)
+        aggregates[f"today_patients_{clean_name}"] = Count(
+            "id", filter=bed_type_filter & today_filter
+        )
+    aggregates["total_patients_home_quarantine"] = Count(
+        "id", filter=ACTIVE_PATIENT_FILTER & home_quarantine
+    )
+    aggregates["today_patients_home_quarantine"] = Count(
+        "id", filter=ACTIVE_PATIENT_FILTER & home_quarantine & today_filter
+    )
 
-            # Get Todays Counts
+    queryset = PatientRegistration.objects.all()
+    if patient_filter is not None:
+        queryset = queryset.filter(patient_filter)
+    patient_counts = defaultdict(lambda: dict.fromkeys(aggregates, 0))
+    for row in queryset.order_by().values(group_by).annotate(**aggregates):
+        patient_counts[row.pop(group_by)] = row
+    return patient_counts
 
-            today_patients_home_quarantine = patients_today.filter(
-                home_quarantine
-            ).count()
 
-            for bed_type_choice in BedTypeChoices:
-                db_value, text = bed_type_choice
-                patient_filters = {
-                    "last_consultation__" + "current_bed__bed__bed_type": db_value
-                }
-                count = patients_today.filter(**patient_filters).count()
-                clean_name = "today_patients_" + "_".join(text.lower().split())
-                patient_summary[facility_id][clean_name] = count
+def patient_summary(facility_ids=None):
+    patient_filter = ACTIVE_PATIENT_FILTER
+    if facility_ids is not None:
+        patient_filter &= Q(last_consultation__facility_id__in=facility_ids)
+    counts = get_patient_counts_by("last_consultation__facility", patient_filter)
+    modified_date = now().strftime("%d-%m-%Y %H:%M")
 
-            # Update Anything Extra
-            patient_summary[facility_id]["today_patients_home_quarantine"] = (
-                today_patients_home_quarantine
-            )
+    patient_summary = {}
+    for facility_object in filter_by_ids(
+        Facility.objects.all(), facility_ids, "id"
+    ).select_related("district"):
+        patient_summary[facility_object.id] = {
+            "facility_name": facility_object.name,
+            "district": facility_object.district.name,
+            "facility_external_id": str(facility_object.external_id),
+            **counts[facility_object.id],
+            "modified_date": modified_date,
+        }
 
-    for i in list(patient_summary.keys()):
-        object_filter = Q(s_type="PatientSummary") & Q(
-            created_date__startswith=now().date()
-        )
-        if (
-            FacilityRelatedSummary.objects.filter(facility_id=i)
-            .filter(object_filter)
-            .exists()
-        ):
-            facility = FacilityRelatedSummary.objects.filter(object_filter).get(
-                facility_id=i
-            )
-            facility.created_date = now()
-            facility.data.pop("modified_date")
-            if facility.data != patient_summary[i]:
-                facility.data = patient_summary[i]
-                latest_modification_date = now()
-                facility.data.update(
-                    {
-                        "modified_date": latest_modification_date.strftime(
-                            "%d-%m-%Y %H:%M"
-                        )
-                    }
-                )
-                facility.save()
-        else:
-            modified_date = now()
-            patient_summary[i].update(
-                {"modified_date": modified_date.strftime("%d-%m-%Y %H:%M")}
-            )
-            FacilityRelatedSummary(
-                s_type="PatientSummary", facility_id=i, data=patient_summary[i]
-            ).save()
+    save_summaries(
+        FacilityRelatedSummary,
+        "facility",
+        "PatientSummary",
+        patient_summary,
+        Q(created_date__startswith=now().date()),
+        skip_unchanged=True,
+    )
     return True
@@ -2,10 +2,11 @@ from django.core.exceptions import ObjectDoesNotExist
 from django.utils import timezone
 
 from care.facility.models import Facility, FacilityRelatedSummary, PatientSample
+from care.facility.utils.summarization.utils import filter_by_ids
 
 
-def tests_summary():
-    facilities = Facility.objects.all()
+def tests_summary(facility_ids=None):
+    facilities = filter_by_ids(Facility.objects.all(), facility_ids, "id")
     for facility in facilities:
         facility_total_patients_count = (
             facility.consultations.all().distinct("patient_id").count()
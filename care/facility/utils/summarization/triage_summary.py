@@ -6,10 +6,11 @@ from care.facility.models import (
     FacilityPatientStatsHistory,
     FacilityRelatedSummary,
 )
+from care.facility.utils.summarization.utils import filter_by_ids
 
 
-def triage_summary():
-    facilities = Facility.objects.all()
+def triage_summary(facility_ids=None):
+    facilities = filter_by_ids(Facility.objects.all(), facility_ids, "id")
     current_date = localtime(now()).replace(hour=0, minute=0, second=0, microsecond=0)
     for facility in facilities:
         facility_patient_data = FacilityPatientStatsHistory.objects.filter(
@@ -0,0 +1,68 @@
+from django.db import transaction
+from django.utils.timezone import now
+
+SUMMARY_BATCH_SIZE = 500
+
+
+def filter_by_ids(queryset, ids, field="facility_id"):
+    """
+    Restricts the queryset to the given ids, None means no restriction.
+    """
+    if ids is None:
+        return queryset
+    return queryset.filter(**{f"{field}__in": ids})
+
+
+def _without_modified_date(data):
+    return {k: v for k, v in (data or {}).items() if k != "modified_date"}
+
+
+def save_summaries(
+    model,
+    scope_field,
+    s_type,
+    summaries,
+    existing_filter,
+    skip_unchanged=False,
+):
+    """
+    Upserts summaries (scope id -> data) of the given s_type in bulk.
+
+    `existing_filter` selects the summaries that are to be updated in place
+    (usually the ones created today), everything else is created afresh.
+    With `skip_unchanged`, summaries whose data (ignoring "modified_date")
+    did not change are left untouched.
+    """
+    scope_attname = f"{scope_field}_id"
+    existing_summaries = {}
+    for summary_obj in (
+        model.objects.filter(existing_filter)
+        .filter(s_type=s_type, **{f"{scope_attname}__in": summaries.keys()})
+        .order_by("-created_date")
+    ):
+        existing_summaries.setdefault(getattr(summary_obj, scope_attname), summary_obj)
+
+    modified_date = now()
+    to_create = []
+    to_update = []
+    for scope_id, data in summaries.items():
+        summary_obj = existing_summaries.get(scope_id)
+        if summary_obj is None:
+            to_create.append(
+                model(s_type=s_type, data=data, **{scope_attname: scope_id})
+            )
+            continue
+        if skip_unchanged and _without_modified_date(
+            summary_obj.data
+        ) == _without_modified_date(data):
+            continue
+        summary_obj.data = data
+        summary_obj.modified_date = modified_date
+        to_update.append(summary_obj)
+
+    with transaction.atomic():
+        model.objects.bulk_create(to_create, batch_size=SUMMARY_BATCH_SIZE)
+        model.objects.bulk_update(
+            to_update, ["data", "modified_date"], batch_size=SUMMARY_BATCH_SIZE
+        )
+    return len(to_create), len(to_update)
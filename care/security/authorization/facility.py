@@ -1,9 +1,9 @@
 from care.abdm.utils.api_call import Facility
-from care.facility.models import FacilityUser
 from care.security.authorization.base import (
     AuthorizationHandler,
     PermissionDeniedError,
 )
+from care.utils.cache.cache_allowed_facilities import get_accessible_facilities
 
 
 class FacilityAccess(AuthorizationHandler):
@@ -14,7 +14,7 @@ class FacilityAccess(AuthorizationHandler):
         self.check_permission(user, facility_id)
         # Since the old method relied on a facility-user relationship, check that
         # This can be removed when the migrations have been completed
-        if not FacilityUser.objects.filter(facility_id=facility_id, user=user).exists():
+        if facility_id not in get_accessible_facilities(user):
             raise PermissionDeniedError
         return True, True
 
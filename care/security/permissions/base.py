@@ -1,7 +1,17 @@
 import enum
 from dataclasses import dataclass
 
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+
 from care.security.models import RoleAssociation, RolePermission
+from care.utils.cache.request_cache import get_request_cache
+
+PERMISSIONS_CACHE_KEY = "security:permissions:{user_id}"
+# bumped whenever the permissions of any role change
+PERMISSIONS_VERSION_CACHE_KEY = "security:permissions:version"
+PERMISSIONS_CACHE_TIMEOUT = 60 * 60 * 24
 
 
 class PermissionContext(enum.Enum):
@@ -54,27 +64,102 @@ class PermissionController:
                 cls.cache[permission.name] = permission.value
 
     @classmethod
-    def has_permission(cls, user, permission, context, context_id):
-        # TODO : Cache permissions and invalidate when they change
+    def resolve_permissions(cls, user, context, context_id) -> frozenset[str]:
+        """
+        Returns the slugs of the permissions the user has in the given
+        context, through roles associated with the user in that context and
+        through the user's role from the previous role management.
+        """
         # TODO : Fetch the user role from the previous role management implementation as well.
         #        Need to maintain some sort of mapping from previous generation to new generation of roles
         from care.security.roles.role import RoleController
 
-        mapped_role = RoleController.map_old_role_to_new(user.role)
-        permission_roles = RolePermission.objects.filter(
-            permission__slug=permission, permission__context=context
+        mapped_role = RoleController.map_old_role_to_new(user.get_user_type_display())
+        associated_roles = RoleAssociation.objects.filter(
+            context_id=context_id, context=context, user=user
         ).values("role_id")
-        if RoleAssociation.objects.filter(
-            context_id=context_id, context=context, role__in=permission_roles, user=user
-        ).exists():
-            return True
-        # Check for old cases
-        return RolePermission.objects.filter(
-            permission__slug=permission,
-            permission__context=context,
-            role__name=mapped_role.name,
-            role__context=mapped_role.context.value,
-        ).exists()
+        return frozenset(
+            RolePermission.objects.filter(
+                Q(role__in=associated_roles)
+                # Check for old cases
+                | Q(
+                    role__name=mapped_role.name,
+                    role__context=mapped_role.context.value,
+                ),
+                permission__context=context,
+            ).values_list("permission__slug", flat=True)
+        )
+
+    @classmethod
+    def get_user_permissions(cls, user, context, context_id) -> frozenset[str]:
+        """
+        Returns the permissions of the user in the given context, memoized
+        for the rest of the request and cached per user in redis
+        until the user's roles or the permissions of any role change.
+        """
+        memo = get_request_cache("security_permissions")
+        memo_key = (user.id, user.user_type, context, context_id)
+        if memo_key in memo:
+            return memo[memo_key]
+
+        cache_key = PERMISSIONS_CACHE_KEY.format(user_id=user.id)
+        cached = cache.get_many([cache_key, PERMISSIONS_VERSION_CACHE_KEY])
+        version = cached.get(PERMISSIONS_VERSION_CACHE_KEY, 0)
+        user_permissions = cached.get(cache_key)
+        # the permissions also depend on the role of the user_type
+        if (
+            user_permissions is None
+            or user_permissions["version"] != version
+            or user_permissions["user_type"] != user.user_type
+        ):
+            user_permissions = {
+                "version": version,
+                "user_type": user.user_type,
+                "contexts": {},
+            }
+
+        context_key = f"{context}:{context_id}"
+        permissions = user_permissions["contexts"].get(context_key)
+        if permissions is None:
+            permissions = cls.resolve_permissions(user, context, context_id)
+            user_permissions["contexts"][context_key] = permissions
+            cache.set(cache_key, user_permissions, PERMISSIONS_CACHE_TIMEOUT)
+
+        memo[memo_key] = permissions
+        return permissions
+
+    @classmethod
+    def has_permission(cls, user, permission, context, context_id):
+        return permission in cls.get_user_permissions(user, context, context_id)
+
+    @classmethod
+    def invalidate_user_permissions(cls, user_id):
+        """
+        Drops the cached permissions of the user once the transaction commits,
+        a concurrent request could otherwise cache the permissions as of before
+        the change again.
+        """
+        memo = get_request_cache("security_permissions")
+        for key in [key for key in memo if key[0] == user_id]:
+            del memo[key]
+        cache_key = PERMISSIONS_CACHE_KEY.format(user_id=user_id)
+        transaction.on_commit(lambda: cache.delete(cache_key))
+
+    @classmethod
+    def invalidate_permissions(cls):
+        """
+        Invalidates the cached permissions of every user once the transaction
+        commits.
+        """
+        get_request_cache("security_permissions").clear()
+        transaction.on_commit(cls.bump_permissions_version)
+
+    @classmethod
+    def bump_permissions_version(cls):
+        try:
+            cache.incr(PERMISSIONS_VERSION_CACHE_KEY)
+        except ValueError:
+            cache.set(PERMISSIONS_VERSION_CACHE_KEY, 1, timeout=None)
 
     @classmethod
     def get_permissions(cls):
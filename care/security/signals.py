@@ -0,0 +1,22 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from care.security.models import (
+    PermissionModel,
+    RoleAssociation,
+    RoleModel,
+    RolePermission,
+)
+from care.security.permissions.base import PermissionController
+
+
+@receiver([post_save, post_delete], sender=RoleAssociation)
+def invalidate_user_permissions(sender, instance, **kwargs):
+    PermissionController.invalidate_user_permissions(instance.user_id)
+
+
+@receiver([post_save, post_delete], sender=RolePermission)
+@receiver([post_save, post_delete], sender=RoleModel)
+@receiver([post_save, post_delete], sender=PermissionModel)
+def invalidate_permissions(sender, instance, **kwargs):
+    PermissionController.invalidate_permissions()
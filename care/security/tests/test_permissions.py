@@ -0,0 +1,93 @@
+from django.test import TestCase
+
+from care.security.models import (
+    PermissionModel,
+    RoleAssociation,
+    RoleModel,
+    RolePermission,
+)
+from care.security.permissions.base import PermissionController
+from care.users.models import User
+from care.utils.tests.test_utils import OverrideCache, TestUtils
+
+FACILITY = "FACILITY"
+
+
+class PermissionCacheTestCase(TestUtils, TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.state = cls.create_state()
+        cls.district = cls.create_district(cls.state)
+        cls.user = cls.create_user(
+            "staff", cls.district, user_type=User.TYPE_VALUE_MAP["Staff"]
+        )
+        cls.staff_role = RoleModel.objects.create(name="Staff", context=FACILITY)
+        cls.doctor_role = RoleModel.objects.create(name="Doctor", context=FACILITY)
+        cls.custom_role = RoleModel.objects.create(name="Custom", context=FACILITY)
+        cls.read = PermissionModel.objects.create(
+            slug="can_read_facility", name="Read", context=FACILITY
+        )
+        cls.update = PermissionModel.objects.create(
+            slug="can_update_facility", name="Update", context=FACILITY
+        )
+        RolePermission.objects.create(role=cls.staff_role, permission=cls.read)
+        RolePermission.objects.create(role=cls.staff_role, permission=cls.update)
+        RolePermission.objects.create(role=cls.doctor_role, permission=cls.read)
+
+    def setUp(self) -> None:
+        override = OverrideCache(self)
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def get_permissions(self, user=None):
+        return PermissionController.get_user_permissions(user or self.user, FACILITY, 1)
+
+    def test_permissions_are_cached(self):
+        self.assertEqual(
+            self.get_permissions(), {"can_read_facility", "can_update_facility"}
+        )
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                self.get_permissions(), {"can_read_facility", "can_update_facility"}
+            )
+
+    def test_role_association_is_invalidated_after_commit(self):
+        RolePermission.objects.create(role=self.custom_role, permission=self.update)
+        self.user.user_type = User.TYPE_VALUE_MAP["Doctor"]
+        self.assertEqual(self.get_permissions(), {"can_read_facility"})
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            RoleAssociation.objects.create(
+                user=self.user, context=FACILITY, context_id=1, role=self.custom_role
+            )
+        # a concurrent request still reads the permissions until the commit
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get_permissions(), {"can_read_facility"})
+
+        for callback in callbacks:
+            callback()
+        self.assertEqual(
+            self.get_permissions(), {"can_read_facility", "can_update_facility"}
+        )
+
+    def test_role_permission_change_is_invalidated_after_commit(self):
+        self.get_permissions()
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            RolePermission.objects.filter(
+                role=self.staff_role, permission=self.update
+            ).delete()
+        with self.assertNumQueries(0):
+            self.get_permissions()
+
+        for callback in callbacks:
+            callback()
+        self.assertEqual(self.get_permissions(), {"can_read_facility"})
+
+    def test_user_type_change_is_not_served_from_the_cache(self):
+        self.get_permissions()
+
+        self.user.user_type = User.TYPE_VALUE_MAP["Doctor"]
+        self.user.save(update_fields=["user_type"])
+        user = User.objects.get(pk=self.user.pk)
+        self.assertEqual(self.get_permissions(user), {"can_read_facility"})
@@ -1,10 +1,15 @@
 from datetime import date
+from unittest.mock import patch
 
 from rest_framework import status
 from rest_framework.test import APITestCase
 
 from care.users.models import User
-from care.utils.tests.test_utils import TestUtils
+from care.utils.cache.cache_allowed_facilities import (
+    get_accessible_facilities,
+    invalidate_accessible_facilities,
+)
+from care.utils.tests.test_utils import OverrideCache, TestUtils
 
 
 class TestFacilityUserApi(TestUtils, APITestCase):
@@ -91,3 +96,23 @@ class TestFacilityUserApi(TestUtils, APITestCase):
 
         res = self.client.get("/api/v1/users/", {"username": "stateadmin2"})
         self.assertContains(res, "stateadmin2")
+
+    def test_created_user_facilities_are_not_served_from_the_cache(self):
+        self.client.force_authenticate(self.state_admin)
+        data = self.get_user_data(
+            username="staff2", user_type=User.TYPE_VALUE_MAP["Staff"]
+        )
+        with (
+            OverrideCache(self),
+            patch(
+                "care.users.api.serializers.user.invalidate_accessible_facilities",
+                wraps=invalidate_accessible_facilities,
+            ) as invalidate,
+        ):
+            with self.captureOnCommitCallbacks(execute=True):
+                res = self.client.post(self.get_base_url(), data=data, format="json")
+            self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+
+            user = User.objects.get(username="staff2")
+            invalidate.assert_called_once_with(user.id)
+            self.assertEqual(get_accessible_facilities(user), [self.facility.id])
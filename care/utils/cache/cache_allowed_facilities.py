@@ -1,18 +1,103 @@
+from collections import defaultdict
+
 from django.core.cache import cache
+from django.db import transaction
 
 from care.facility.models.facility import FacilityUser
+from care.utils.cache.request_cache import get_request_cache
+
+# v2 entries hold the ids with their generation, v1 entries held a bare list
+# and are left for workers that have not been upgraded yet
+ACCESSIBLE_FACILITIES_CACHE_KEY = "user_facilities:v2:{user_id}"
+# generation of the user's facilities, bumped whenever they change
+ACCESSIBLE_FACILITIES_VERSION_CACHE_KEY = "user_facilities:v2:{user_id}:version"
+ACCESSIBLE_FACILITIES_CACHE_TIMEOUT = 60 * 60 * 24
 
 
 def get_accessible_facilities(user):
-    user_id = str(user.id)
-    key = "user_facilities:" + user_id
-    hit = cache.get(key)
-    if not hit:
+    """
+    Returns the ids of the facilities the user is linked to. The ids are
+    cached per user until the user's facilities change, and memoized for the
+    rest of the request.
+    """
+    memo = get_request_cache("accessible_facilities")
+    if user.id in memo:
+        return memo[user.id]
+
+    key = ACCESSIBLE_FACILITIES_CACHE_KEY.format(user_id=user.id)
+    version_key = ACCESSIBLE_FACILITIES_VERSION_CACHE_KEY.format(user_id=user.id)
+    cached = cache.get_many([key, version_key])
+    version = cached.get(version_key, 0)
+    hit = cached.get(key)
+    if hit is not None and hit["version"] == version:
+        facility_ids = hit["facility_ids"]
+    else:
         facility_ids = list(
-            FacilityUser.objects.filter(user_id=user_id).values_list(
+            FacilityUser.objects.filter(user_id=user.id).values_list(
                 "facility__id", flat=True
             )
         )
-        cache.set(key, facility_ids)
-        return facility_ids
-    return hit
+        cache.set(
+            key,
+            {"version": version, "facility_ids": facility_ids},
+            ACCESSIBLE_FACILITIES_CACHE_TIMEOUT,
+        )
+
+    memo[user.id] = facility_ids
+    return facility_ids
+
+
+def invalidate_accessible_facilities(user_id):
+    """
+    Bumps the generation of the user's facilities, so that ids cached for an
+    earlier generation are never served again, even when they are written
+    back by a request that read them before the change. The generation is
+    bumped once the transaction commits, before that concurrent requests still
+    read the facilities as of before the change.
+    """
+    get_request_cache("accessible_facilities").pop(user_id, None)
+    version_key = ACCESSIBLE_FACILITIES_VERSION_CACHE_KEY.format(user_id=user_id)
+
+    def bump_version():
+        try:
+            cache.incr(version_key)
+        except ValueError:
+            cache.set(version_key, 1, timeout=None)
+
+    transaction.on_commit(bump_version)
+
+
+def warm_accessible_facilities(facility_id):
+    """
+    Caches the facilities of every user of the facility with a single query,
+    eg. after the cache has been flushed.
+    """
+    user_ids = list(
+        FacilityUser.objects.filter(facility_id=facility_id).values_list(
+            "user_id", flat=True
+        )
+    )
+    # the generations are read before the facilities, like in
+    # get_accessible_facilities, so a concurrent change is never masked
+    version_keys = {
+        user_id: ACCESSIBLE_FACILITIES_VERSION_CACHE_KEY.format(user_id=user_id)
+        for user_id in user_ids
+    }
+    versions = cache.get_many(list(version_keys.values()))
+    facility_ids = defaultdict(list)
+    for user_id, user_facility_id in FacilityUser.objects.filter(
+        user_id__in=user_ids
+    ).values_list("user_id", "facility_id"):
+        facility_ids[user_id].append(user_facility_id)
+
+    cache.set_many(
+        {
+            ACCESSIBLE_FACILITIES_CACHE_KEY.format(user_id=user_id): {
+                "version": versions.get(version_keys[user_id], 0),
+                "facility_ids": ids,
+            }
+            for user_id, ids in facility_ids.items()
+        },
+        ACCESSIBLE_FACILITIES_CACHE_TIMEOUT,
+    )
+    return len(facility_ids)
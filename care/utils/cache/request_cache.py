@@ -0,0 +1,32 @@
+import threading
+
+from celery.signals import task_postrun, task_prerun
+from django.core.signals import request_finished, request_started
+
+_local = threading.local()
+
+
+def get_request_cache(name: str) -> dict:
+    """
+    Returns a dict that lives until the end of the current request or celery
+    task, for values that are looked up many times while handling it. Outside
+    of a request or task nothing is memoized.
+    """
+    caches = getattr(_local, "caches", None)
+    if caches is None:
+        return {}
+    return caches.setdefault(name, {})
+
+
+def start_request_cache(**kwargs):
+    _local.caches = {}
+
+
+def clear_request_cache(**kwargs):
+    _local.caches = None
+
+
+request_started.connect(start_request_cache)
+request_finished.connect(clear_request_cache)
+task_prerun.connect(start_request_cache)
+task_postrun.connect(clear_request_cache)
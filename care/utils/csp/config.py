@@ -1,6 +1,11 @@
 import enum
+import os
+import threading
 from typing import TypedDict
 
+import boto3
+from botocore.client import BaseClient
+from botocore.config import Config
 from django.conf import settings
 
 
@@ -61,3 +66,44 @@ def get_client_config(bucket_type: BucketType, external=False):
         return get_patient_bucket_config(external=external)
     msg = "Invalid Bucket Type"
     raise ValueError(msg)
+
+
+# connections kept open per client, shared by all the threads of the process
+S3_MAX_POOL_CONNECTIONS = 50
+
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+    connect_timeout=5,
+    read_timeout=60,
+    retries={"max_attempts": 3, "mode": "standard"},
+    tcp_keepalive=True,
+)
+
+_clients: dict[tuple, BaseClient] = {}
+_clients_lock = threading.Lock()
+
+# connections can not be shared with the parent process, forked celery workers
+# build their own clients
+os.register_at_fork(after_in_child=_clients.clear)
+
+
+def get_client(
+    bucket_type: BucketType, external=False
+) -> tuple[BaseClient, BucketName]:
+    """
+    Returns the s3 client of a bucket and the name of the bucket, the client is
+    built once per process and reused so that its connection pool is kept.
+    boto3 clients are thread safe, building them is not.
+    """
+    config, bucket_name = get_client_config(bucket_type, external=external)
+    key = (bucket_type, external, *config.values())
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                client = boto3.session.Session().client(
+                    "s3", config=S3_CLIENT_CONFIG, **config
+                )
+                _clients[key] = client
+    return client, bucket_name
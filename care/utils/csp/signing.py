@@ -0,0 +1,84 @@
+import time
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+
+from care.utils.csp.config import BucketType, get_client
+
+# urls are only valid for the bucket and endpoint they were signed for
+SIGNED_URL_CACHE_KEY = (
+    "signed_url:{bucket_type}:{bucket}:{endpoint}:{duration}:{window}:{key}"
+)
+
+
+def get_read_signed_urls(
+    keys: Iterable[str], duration: int = 60 * 60, bucket_type=BucketType.PATIENT
+) -> dict[str, str]:
+    """
+    Returns signed download urls of the given object keys, signing all the
+    keys that are not cached in one pass with the shared client.
+
+    Within a window of FILE_UPLOAD_SIGNED_URL_CACHE_WINDOW seconds the same
+    url is returned for a key, so that browsers can reuse cached downloads.
+    The urls are signed for the rest of the window on top of the duration,
+    so they are valid for at least the duration whenever they are returned.
+    """
+    keys = set(keys)
+    if not keys:
+        return {}
+
+    window_size = settings.FILE_UPLOAD_SIGNED_URL_CACHE_WINDOW
+    now = int(time.time())
+    if window_size > 0:
+        window, elapsed = divmod(now, window_size)
+        remaining = window_size - elapsed
+    else:
+        window, remaining = now, 0
+
+    s3, bucket_name = get_client(bucket_type, external=True)
+    cache_keys = {
+        SIGNED_URL_CACHE_KEY.format(
+            bucket_type=bucket_type.value,
+            bucket=bucket_name,
+            endpoint=s3.meta.endpoint_url,
+            duration=duration,
+            window=window,
+            key=key,
+        ): key
+        for key in keys
+    }
+    urls = {}
+    if remaining:
+        urls = {
+            cache_keys[cache_key]: url
+            for cache_key, url in cache.get_many(cache_keys).items()
+        }
+
+    missing = keys - urls.keys()
+    if missing:
+        signed = {
+            key: s3.generate_presigned_url(
+                "get_object",
+                Params={"Bucket": bucket_name, "Key": key},
+                ExpiresIn=duration + remaining,  # seconds
+            )
+            for key in missing
+        }
+        if remaining:
+            cache.set_many(
+                {
+                    cache_key: signed[key]
+                    for cache_key, key in cache_keys.items()
+                    if key in signed
+                },
+                timeout=remaining,
+            )
+        urls.update(signed)
+    return urls
+
+
+def get_read_signed_url(
+    key: str, duration: int = 60 * 60, bucket_type=BucketType.PATIENT
+) -> str:
+    return get_read_signed_urls([key], duration, bucket_type)[key]
@@ -0,0 +1,9 @@
+import newrelic.agent
+
+
+def record_metric(name: str, value: float = 1) -> None:
+    """
+    Records a custom metric (reported as Custom/<name>) with the New Relic
+    agent, this is a no-op when the process is not run under the agent.
+    """
+    newrelic.agent.record_custom_metric(f"Custom/{name}", value)
@@ -1,6 +1,7 @@
 import re
 from collections.abc import Iterable
 from fractions import Fraction
+from functools import cached_property
 
 import jsonschema
 from django.core import validators
@@ -22,8 +23,13 @@ class JSONFieldSchemaValidator:
         self.schema = schema
         self.schema_validator_class = jsonschema.Draft7Validator
 
+    @cached_property
+    def schema_validator(self) -> jsonschema.protocols.Validator:
+        # built on first use and reused for every value validated against the schema
+        return self.schema_validator_class(self.schema)
+
     def __call__(self, value):
-        errors = self.schema_validator_class(self.schema).iter_errors(value)
+        errors = self.schema_validator.iter_errors(value)
 
         django_errors = []
         self._extract_errors(errors, django_errors)
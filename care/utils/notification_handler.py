@@ -1,13 +1,15 @@
 import json
 import logging
+from collections import defaultdict
+from urllib.parse import urlparse
 
 from celery import shared_task
 from django.apps import apps
 from django.conf import settings
-from pywebpush import WebPushException, webpush
+from django.db.models import Q
 
 from care.facility.models.daily_round import DailyRound
-from care.facility.models.facility import Facility, FacilityUser
+from care.facility.models.facility import Facility
 from care.facility.models.notification import Notification
 from care.facility.models.patient import PatientNotes, PatientRegistration
 from care.facility.models.patient_consultation import PatientConsultation
@@ -18,9 +20,13 @@ from care.facility.models.patient_investigation import (
 from care.facility.models.shifting import ShiftingRequest
 from care.users.models import User
 from care.utils.sms.send_sms import send_sms
+from care.utils.webpush import deliver_webpushes, get_subscription_info
 
 logger = logging.getLogger(__name__)
 
+NOTIFICATION_BATCH_SIZE = 500
+WEBPUSH_BATCH_SIZE = 100
+
 
 class NotificationCreationError(Exception):
     pass
@@ -38,6 +44,25 @@ def send_webpush(**kwargs):
     NotificationGenerator.send_webpush_user(None, user, message)
 
 
+@shared_task
+def send_webpush_batch(messages):
+    """
+    Sends web pushes for a list of (user id, message) pairs, to the users'
+    current subscriptions.
+    """
+    users = User.objects.only("pf_endpoint", "pf_p256dh", "pf_auth").in_bulk(
+        [user_id for user_id, _ in messages]
+    )
+    pushes = []
+    for user_id, message in messages:
+        if (user := users.get(user_id)) and (
+            subscription_info := get_subscription_info(user)
+        ):
+            pushes.append((subscription_info, message))
+    if pushes:
+        deliver_webpushes(pushes)
+
+
 def get_model_class(model_name):
     if model_name == "User":
         return apps.get_model(f"users.{model_name}")
@@ -304,64 +329,66 @@ class NotificationGenerator:
         return True
 
     def generate_system_users(self):
-        users = []
-        extra_users = self.extra_users
-        caused_user = self.caused_by
-        facility_users = FacilityUser.objects.filter(facility_id=self.facility.id)
-        if self.event != Notification.Event.MESSAGE:
-            facility_users.exclude(
-                user__user_type__in=(
-                    User.TYPE_VALUE_MAP["Staff"],
-                    User.TYPE_VALUE_MAP["StaffReadOnly"],
-                )
+        """
+        Returns the id and web push subscription of the users of the facility
+        and the extra users, except the user that caused the notification.
+        """
+        return list(
+            User.objects.filter(
+                Q(facilityuser__facility_id=self.facility.id)
+                | Q(id__in=self.extra_users)
             )
-        for facility_user in facility_users:
-            if facility_user.user.id != caused_user.id:
-                users.append(facility_user.user)
-        for user_id in extra_users:
-            user_obj = User.objects.get(id=user_id)
-            if user_obj.id != caused_user.id:
-                users.append(user_obj)
-        return users
-
-    def generate_message_for_user(self, user, message, medium):
-        notification = Notification()
-        notification.intended_for = user
-        notification.caused_objects = self.caused_objects
-        notification.message = message
-        notification.medium_sent = medium
-        notification.event = self.event
-        notification.event_type = self.event_type
-        notification.caused_by = self.caused_by
-        notification.save()
-        return notification
+            .exclude(id=self.caused_by.id)
+            .order_by("id")
+            .distinct()
+            .values("id", "pf_endpoint", "pf_p256dh", "pf_auth")
+        )
 
-    def send_webpush_user(self, user, message):
-        try:
-            if user.pf_endpoint and user.pf_p256dh and user.pf_auth:
-                webpush(
-                    subscription_info={
-                        "endpoint": user.pf_endpoint,
-                        "keys": {"p256dh": user.pf_p256dh, "auth": user.pf_auth},
-                    },
-                    data=message,
-                    vapid_private_key=settings.VAPID_PRIVATE_KEY,
-                    vapid_claims={
-                        "sub": "mailto:info@ohc.network",
-                    },
+    def generate_messages_for_users(self, users, message, medium):
+        return Notification.objects.bulk_create(
+            [
+                Notification(
+                    intended_for_id=user["id"],
+                    caused_objects=self.caused_objects,
+                    message=message,
+                    medium_sent=medium,
+                    event=self.event,
+                    event_type=self.event_type,
+                    caused_by=self.caused_by,
                 )
-        except WebPushException as ex:
-            logger.info("Web Push Failed with Exception: %s", repr(ex))
-            if ex.response and ex.response.json():
-                extra = ex.response.json()
-                logger.info(
-                    "Remote service replied with a %s:%s, %s",
-                    extra.code,
-                    extra.errno,
-                    extra.message,
+                for user in users
+            ],
+            batch_size=NOTIFICATION_BATCH_SIZE,
+        )
+
+    def send_webpushes(self, users, notifications):
+        """
+        Queues the web pushes of the notifications for the users that have a
+        push subscription, in batches per push service so that a slow push
+        service only delays its own subscribers.
+        """
+        messages_by_service = defaultdict(list)
+        for user, notification in zip(users, notifications, strict=True):
+            if user["pf_endpoint"] and user["pf_p256dh"] and user["pf_auth"]:
+                messages_by_service[urlparse(user["pf_endpoint"]).netloc].append(
+                    (
+                        user["id"],
+                        json.dumps(
+                            {
+                                "external_id": str(notification.external_id),
+                                "message": notification.message,
+                                "type": Notification.Event(notification.event).name,
+                            }
+                        ),
+                    )
                 )
-        except Exception as e:
-            logger.info("Error When Doing WebPush: %s", e)
+        for messages in messages_by_service.values():
+            for i in range(0, len(messages), WEBPUSH_BATCH_SIZE):
+                send_webpush_batch.delay(messages[i : i + WEBPUSH_BATCH_SIZE])
+
+    def send_webpush_user(self, user, message):
+        if subscription_info := get_subscription_info(user):
+            deliver_webpushes([(subscription_info, message)])
 
     def generate(self):
         if not self.worker_initiated:
@@ -379,20 +406,9 @@ class NotificationGenerator:
             elif medium == Notification.Medium.SYSTEM.value:
                 if not self.message:
                     self.message = self.generate_system_message()
-                for user in self.generate_system_users():
-                    notification_obj = self.generate_message_for_user(
-                        user, self.message, Notification.Medium.SYSTEM.value
-                    )
-                    if not self.defer_notifications:
-                        self.send_webpush_user(
-                            user,
-                            json.dumps(
-                                {
-                                    "external_id": str(notification_obj.external_id),
-                                    "message": self.message,
-                                    "type": Notification.Event(
-                                        notification_obj.event
-                                    ).name,
-                                }
-                            ),
-                        )
+                users = self.generate_system_users()
+                notifications = self.generate_messages_for_users(
+                    users, self.message, Notification.Medium.SYSTEM.value
+                )
+                if not self.defer_notifications:
+                    self.send_webpushes(users, notifications)
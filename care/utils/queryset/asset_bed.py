@@ -1,47 +1,21 @@
 from care.facility.models import Asset, AssetBed, Bed
-from care.users.models import User
-from care.utils.cache.cache_allowed_facilities import get_accessible_facilities
+from care.utils.queryset.scope import ScopePaths, get_user_scope
+
+ASSET_BED_SCOPE = ScopePaths(facilities=("bed__facility",))
+BED_SCOPE = ScopePaths(facilities=("facility",))
+ASSET_SCOPE = ScopePaths(facilities=("current_location__facility",))
 
 
 def get_asset_bed_queryset(user, queryset=None):
     queryset = AssetBed.objects.all() if queryset is None else queryset
-    if user.is_superuser:
-        pass
-    elif user.user_type >= User.TYPE_VALUE_MAP["StateLabAdmin"]:
-        queryset = queryset.filter(bed__facility__state=user.state)
-    elif user.user_type >= User.TYPE_VALUE_MAP["DistrictLabAdmin"]:
-        queryset = queryset.filter(bed__facility__district=user.district)
-    else:
-        allowed_facilities = get_accessible_facilities(user)
-        queryset = queryset.filter(bed__facility__id__in=allowed_facilities)
-    return queryset
+    return get_user_scope(user).filter(queryset, ASSET_BED_SCOPE)
 
 
 def get_bed_queryset(user, queryset=None):
     queryset = Bed.objects.all() if queryset is None else queryset
-    if user.is_superuser:
-        pass
-    elif user.user_type >= User.TYPE_VALUE_MAP["StateLabAdmin"]:
-        queryset = queryset.filter(facility__state=user.state)
-    elif user.user_type >= User.TYPE_VALUE_MAP["DistrictLabAdmin"]:
-        queryset = queryset.filter(facility__district=user.district)
-    else:
-        allowed_facilities = get_accessible_facilities(user)
-        queryset = queryset.filter(facility__id__in=allowed_facilities)
-    return queryset
+    return get_user_scope(user).filter(queryset, BED_SCOPE)
 
 
 def get_asset_queryset(user, queryset=None):
     queryset = Asset.objects.all() if queryset is None else queryset
-    if user.is_superuser:
-        pass
-    elif user.user_type >= User.TYPE_VALUE_MAP["StateLabAdmin"]:
-        queryset = queryset.filter(current_location__facility__state=user.state)
-    elif user.user_type >= User.TYPE_VALUE_MAP["DistrictLabAdmin"]:
-        queryset = queryset.filter(current_location__facility__district=user.district)
-    else:
-        allowed_facilities = get_accessible_facilities(user)
-        queryset = queryset.filter(
-            current_location__facility__id__in=allowed_facilities
-        )
-    return queryset
+    return get_user_scope(user).filter(queryset, ASSET_SCOPE)
@@ -0,0 +1,95 @@
+import enum
+from dataclasses import dataclass
+
+from django.db.models import Q
+
+from care.facility.models.facility import FacilityUser
+from care.users.models import User
+from care.utils.cache.request_cache import get_request_cache
+
+
+class ScopeType(enum.Enum):
+    ALL = "all"
+    STATE = "state"
+    DISTRICT = "district"
+    FACILITIES = "facilities"
+
+
+@dataclass(frozen=True)
+class ScopePaths:
+    """
+    Declares how a model reaches the facilities it belongs to, eg.
+    ("facility", "patient__facility") for a consultation. An empty path is the
+    facility itself. State and district are reached through the facility,
+    unless the model declares a path of its own for them.
+    """
+
+    facilities: tuple[str, ...]
+    states: tuple[str, ...] | None = None
+    districts: tuple[str, ...] | None = None
+
+
+def _lookup(path, field):
+    return f"{path}__{field}" if path else field
+
+
+class UserScope:
+    """
+    The part of the country a user can see, resolved once per request and
+    turned into filters for any model that declares its ScopePaths.
+
+    Users linked to facilities are scoped with a subquery over FacilityUser,
+    so that the database can join on the facility ids instead of receiving
+    every id the user has access to as a literal.
+    """
+
+    def __init__(self, user):
+        self.user_id = user.id
+        if user.is_superuser:
+            self.type = ScopeType.ALL
+        elif user.user_type >= User.TYPE_VALUE_MAP["StateLabAdmin"]:
+            self.type = ScopeType.STATE
+            self.state_id = user.state_id
+        elif user.user_type >= User.TYPE_VALUE_MAP["DistrictLabAdmin"]:
+            self.type = ScopeType.DISTRICT
+            self.district_id = user.district_id
+        else:
+            self.type = ScopeType.FACILITIES
+
+    def facility_ids(self):
+        return FacilityUser.objects.filter(user_id=self.user_id).values("facility_id")
+
+    def q(self, paths: ScopePaths) -> Q:
+        q_filters = Q()
+        if self.type == ScopeType.STATE:
+            for path in paths.states or [_lookup(p, "state") for p in paths.facilities]:
+                q_filters |= Q(**{path: self.state_id})
+        elif self.type == ScopeType.DISTRICT:
+            for path in paths.districts or [
+                _lookup(p, "district") for p in paths.facilities
+            ]:
+                q_filters |= Q(**{path: self.district_id})
+        elif self.type == ScopeType.FACILITIES:
+            facility_ids = self.facility_ids()
+            for path in paths.facilities:
+                q_filters |= Q(**{_lookup(path or "id", "in"): facility_ids})
+        return q_filters
+
+    def filter(self, queryset, paths: ScopePaths, extra: Q | None = None):
+        """
+        Filters the queryset to the user's scope. The extra filters widen the
+        scope of users linked to facilities, eg. to what is assigned to them.
+        """
+        if self.type == ScopeType.ALL:
+            return queryset
+        q_filters = self.q(paths)
+        if self.type == ScopeType.FACILITIES and extra is not None:
+            q_filters |= extra
+        return queryset.filter(q_filters)
+
+
+def get_user_scope(user) -> UserScope:
+    scopes = get_request_cache("user_scopes")
+    if user.id not in scopes:
+        scopes[user.id] = UserScope(user)
+    return scopes[user.id]
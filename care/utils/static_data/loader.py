@@ -0,0 +1,170 @@
+import hashlib
+import logging
+import time
+from collections.abc import Callable, Iterable
+
+from django.conf import settings
+from redis.exceptions import ResponseError
+from redis_om.model.migrations.migrator import schema_hash_key
+
+from care.utils.metrics import record_metric
+from care.utils.static_data.models.base import (
+    STATIC_DATA_FINGERPRINT_KEY,
+    STATIC_DATA_VERSION_KEY,
+    STATIC_DATA_VERSIONS_KEY,
+    VersionedRedisModel,
+)
+
+logger = logging.getLogger(__name__)
+
+DELETE_BATCH_SIZE = 5000
+
+
+def new_version(model: type[VersionedRedisModel]) -> str:
+    """
+    Registers and returns a new version of the model's data to load into.
+    """
+    version = f"v{time.time_ns()}"
+    model.db().sadd(model.static_data_key(STATIC_DATA_VERSIONS_KEY), version)
+    return version
+
+
+def bulk_load(
+    model: type[VersionedRedisModel],
+    rows: Iterable[dict],
+    version: str,
+    batch_size: int | None = None,
+) -> int:
+    """
+    Writes the rows as redis hashes of the given model under the given
+    version, batching the HSETs in pipelines of `batch_size` commands. Each
+    row must contain the primary key of the model.
+
+    The rows are written as is, without building (and validating) a model
+    instance per row. Returns the number of rows written.
+    """
+    batch_size = batch_size or settings.STATIC_DATA_LOAD_BATCH_SIZE
+    pk_field = model._meta.primary_key.name  # noqa: SLF001
+    pipeline = model.db().pipeline(transaction=False)
+
+    started_at = time.perf_counter()
+    count = 0
+    for row in rows:
+        pipeline.hset(
+            model.make_versioned_primary_key(version, row[pk_field]), mapping=row
+        )
+        count += 1
+        if count % batch_size == 0:
+            pipeline.execute()
+    pipeline.execute()
+
+    elapsed = time.perf_counter() - started_at
+    logger.info(
+        "Loaded %s %s rows in %.2fs (%.0f rows/sec)",
+        count,
+        model.__name__,
+        elapsed,
+        count / elapsed if elapsed else count,
+    )
+    return count
+
+
+def _delete_keys(conn, pattern, exclude=()):
+    batch = []
+    for key in conn.scan_iter(match=pattern, count=DELETE_BATCH_SIZE):
+        if key in exclude:
+            continue
+        batch.append(key)
+        if len(batch) >= DELETE_BATCH_SIZE:
+            conn.unlink(*batch)
+            batch = []
+    if batch:
+        conn.unlink(*batch)
+
+
+def activate_version(model: type[VersionedRedisModel], version: str):
+    """
+    Points the search alias and the active version of the model to the given
+    (fully loaded) version, then garbage collects every version but this one
+    and the one it replaced.
+    """
+    conn = model.db()
+    index_name = model.Meta.index_name
+    if index_name in conn.execute_command("FT._LIST"):
+        # an index created before versioning, the alias replaces it
+        conn.execute_command("FT.DROPINDEX", index_name)
+    conn.execute_command(
+        "FT.ALIASUPDATE", index_name, model.versioned_index_name(version)
+    )
+    # keeps the redis_om Migrator from recreating the index over the alias
+    conn.set(
+        schema_hash_key(index_name),
+        hashlib.sha1(model.redisearch_schema().encode()).hexdigest(),  # noqa: S324
+    )
+
+    previous_version = conn.getset(
+        model.static_data_key(STATIC_DATA_VERSION_KEY), version
+    )
+    model.get_active_version(refresh=True)
+    logger.info("%s version %s activated", model.__name__, version)
+
+    if previous_version is None:
+        _delete_keys(
+            conn,
+            model.make_versioned_key(None, "*"),
+            exclude={schema_hash_key(index_name)},
+        )
+    collect_garbage(model, keep={version, previous_version})
+
+
+def collect_garbage(model: type[VersionedRedisModel], keep: set[str]):
+    """
+    Drops the index and deletes the data of all versions of the model not in
+    `keep`, including versions whose load failed before being activated.
+    """
+    conn = model.db()
+    versions_key = model.static_data_key(STATIC_DATA_VERSIONS_KEY)
+    for version in conn.smembers(versions_key) - keep:
+        try:
+            conn.execute_command("FT.DROPINDEX", model.versioned_index_name(version))
+        except ResponseError:
+            logger.debug("Index for %s %s not found", model.__name__, version)
+        _delete_keys(conn, model.make_versioned_key(version, "*"))
+        conn.srem(versions_key, version)
+        logger.info("%s version %s garbage collected", model.__name__, version)
+
+
+def reload_dataset(
+    model: type[VersionedRedisModel],
+    load: Callable[[str, int | None], None],
+    fingerprint: str,
+    batch_size: int | None = None,
+    force: bool = False,
+) -> bool:
+    """
+    Loads the model's data into a new version and activates it, unless the
+    fingerprint of the source data matches the one of the active version.
+    Returns whether the data was reloaded.
+    """
+    conn = model.db()
+    fingerprint_key = model.static_data_key(STATIC_DATA_FINGERPRINT_KEY)
+    if (
+        not force
+        and model.get_active_version(refresh=True) is not None
+        and conn.get(fingerprint_key) == fingerprint
+    ):
+        logger.info("%s is unchanged, skipping reload", model.__name__)
+        record_metric(f"StaticData/{model.__name__}/Skipped")
+        return False
+
+    started_at = time.perf_counter()
+    version = new_version(model)
+    load(version, batch_size)
+    activate_version(model, version)
+    conn.set(fingerprint_key, fingerprint)
+
+    record_metric(f"StaticData/{model.__name__}/Reloaded")
+    record_metric(
+        f"StaticData/{model.__name__}/Duration", time.perf_counter() - started_at
+    )
+    return True
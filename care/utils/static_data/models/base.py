@@ -1,9 +1,19 @@
+import time
 from abc import ABC
 
 from django.conf import settings
 from redis_om import HashModel, get_redis_connection
 from redis_om.model.migrations.migrator import schema_hash_key
 
+STATIC_DATA_VERSION_KEY = "care_static_data:version:{model}"
+STATIC_DATA_VERSIONS_KEY = "care_static_data:versions:{model}"
+STATIC_DATA_FINGERPRINT_KEY = "care_static_data:fingerprint:{model}"
+# the previous version is only garbage collected on the next reload, so
+# readers can safely hold on to the active version for a while
+STATIC_DATA_VERSION_CACHE_TTL = 60
+
+_active_versions = {}
+
 
 class BaseRedisModel(HashModel, ABC):
     class Meta:
@@ -11,6 +21,71 @@ class BaseRedisModel(HashModel, ABC):
         global_key_prefix = "care_static_data"
 
 
+class VersionedRedisModel(BaseRedisModel, ABC):
+    """
+    Redis model whose data is loaded under a versioned key prefix with a
+    versioned index. Searches go through an index alias named after the
+    model's (unversioned) index and lookups by primary key resolve the
+    active version, so a reload can build a new version in the background
+    and switch to it atomically.
+    """
+
+    @classmethod
+    def get_active_version(cls, refresh=False) -> str | None:
+        """
+        Returns the version of the data that is currently being served, None
+        if the data was never loaded through a versioned reload.
+        """
+        version, expires_at = _active_versions.get(cls.__name__, (None, 0.0))
+        if refresh or expires_at < time.monotonic():
+            version = cls.db().get(cls.static_data_key(STATIC_DATA_VERSION_KEY))
+            _active_versions[cls.__name__] = (
+                version,
+                time.monotonic() + STATIC_DATA_VERSION_CACHE_TTL,
+            )
+        return version
+
+    @classmethod
+    def static_data_key(cls, template: str) -> str:
+        return template.format(model=cls._meta.model_key_prefix)
+
+    @classmethod
+    def make_versioned_key(cls, version: str | None, part: str) -> str:
+        global_prefix = cls._meta.global_key_prefix.strip(":")
+        model_prefix = cls._meta.model_key_prefix.strip(":")
+        if version is None:
+            return f"{global_prefix}:{model_prefix}:{part}"
+        return f"{global_prefix}:{version}:{model_prefix}:{part}"
+
+    @classmethod
+    def make_primary_key(cls, pk) -> str:
+        return cls.make_versioned_key(
+            cls.get_active_version(), cls._meta.primary_key_pattern.format(pk=pk)
+        )
+
+    @classmethod
+    def make_versioned_primary_key(cls, version: str, pk) -> str:
+        return cls.make_versioned_key(
+            version, cls._meta.primary_key_pattern.format(pk=pk)
+        )
+
+    @classmethod
+    def versioned_index_name(cls, version: str) -> str:
+        return cls.make_versioned_key(version, "index")
+
+    @classmethod
+    def create_versioned_index(cls, version: str):
+        """
+        Creates the index of the given version, it has to exist before the
+        data is loaded so that documents are indexed as they are written.
+        """
+        schema = " ".join(cls.schema_for_fields())
+        cls.db().execute_command(
+            f"FT.CREATE {cls.versioned_index_name(version)} "
+            f"ON HASH PREFIX 1 {cls.make_versioned_key(version, '')} SCHEMA {schema}"
+        )
+
+
 def index_exists(model: HashModel = None):
     """
     Checks the existence of a redisearch index.
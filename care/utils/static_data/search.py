@@ -0,0 +1,239 @@
+"""
+In-memory full text search over static datasets.
+
+An alternative to searching the RediSearch indexes, built once per worker
+process from the same rows that are loaded into redis. It answers the prefix
+queries of `query_builder`: the last (up to) four words of the query are
+prefixes that all have to match a token of the document.
+
+Tokens are kept in a sorted vocabulary so that a prefix resolves to a
+contiguous range of token ids, and postings (the documents containing a
+token) are arrays of document ids. Documents are numbered shortest first,
+so scanning postings in order yields the most specific matches first.
+"""
+
+import heapq
+import logging
+import re
+import time
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from itertools import islice
+from threading import Lock
+
+from redis.exceptions import RedisError
+
+from care.utils.metrics import record_metric
+from care.utils.static_data.models.base import VersionedRedisModel
+
+logger = logging.getLogger(__name__)
+
+# RediSearch's default separators, escaped characters are part of the token
+TOKEN_PATTERN = re.compile(r"(?:\\.|[^\s,.<>{}\[\]\"':;!@#$%^&*()\-+=~\\])+")
+ESCAPE_PATTERN = re.compile(r"\\(.)")
+# RediSearch's default stopwords, these are not indexed
+STOPWORDS = frozenset(
+    "a is the an and are as at be but by for if in into it no not of on or such "
+    "that their then there these they this to was will with".split()
+)
+# postings of prefixes up to this length are precomputed, as they span a
+# large part of the vocabulary
+SHORT_PREFIX_LENGTH = 2
+
+# (text, tags, object) of a document
+Document = tuple[str, dict[str, object], dict]
+
+
+def tokenize(text: str) -> list[str]:
+    tokens = (
+        ESCAPE_PATTERN.sub(r"\1", token).lower()
+        for token in TOKEN_PATTERN.findall(text)
+    )
+    return [token for token in tokens if token not in STOPWORDS]
+
+
+def get_query_terms(query: str) -> list[str]:
+    """
+    Returns the prefix terms `query_builder` would search for.
+    """
+    return [word.lower() for word in query.strip().rsplit(maxsplit=3)]
+
+
+def _tag_value(value) -> str:
+    return str(value).strip().lower()
+
+
+class InMemorySearchIndex:
+    def __init__(self, documents: Iterable[Document], version: str | None = None):
+        self.version = version
+
+        documents = sorted(documents, key=lambda document: len(document[0]))
+        self.objects = [document[2] for document in documents]
+
+        doc_tokens = [set(tokenize(document[0])) for document in documents]
+        self.vocabulary = sorted(set().union(*doc_tokens))
+        token_ids = {token: i for i, token in enumerate(self.vocabulary)}
+
+        self.postings = [array("I") for _ in self.vocabulary]
+        self.doc_tokens = []
+        short_prefix_postings = defaultdict(set)
+        for doc_id, tokens in enumerate(doc_tokens):
+            ids = array("I", sorted(token_ids[token] for token in tokens))
+            self.doc_tokens.append(ids)
+            for token_id in ids:
+                self.postings[token_id].append(doc_id)
+            for token in tokens:
+                for length in range(1, SHORT_PREFIX_LENGTH + 1):
+                    short_prefix_postings[token[:length]].add(doc_id)
+        self.short_prefix_postings = {
+            prefix: array("I", sorted(doc_ids))
+            for prefix, doc_ids in short_prefix_postings.items()
+        }
+
+        self.tags = defaultdict(lambda: defaultdict(lambda: array("I")))
+        for doc_id, document in enumerate(documents):
+            for field, value in document[1].items():
+                self.tags[field][_tag_value(value)].append(doc_id)
+
+    def __len__(self):
+        return len(self.objects)
+
+    def _token_range(self, prefix: str) -> tuple[int, int]:
+        lo = bisect_left(self.vocabulary, prefix)
+        hi = bisect_left(self.vocabulary, prefix + "\U0010ffff", lo)
+        return lo, hi
+
+    def _prefix_postings(self, prefix: str, token_range: tuple[int, int]):
+        if len(prefix) <= SHORT_PREFIX_LENGTH:
+            return self.short_prefix_postings.get(prefix, ())
+        lo, hi = token_range
+        if hi - lo == 1:
+            return self.postings[lo]
+        return sorted(set().union(*self.postings[lo:hi]))
+
+    def _tag_matches(self, field: str, value):
+        return self.tags.get(field, {}).get(_tag_value(value), ())
+
+    def search(
+        self,
+        query: str | None = None,
+        filters: dict | None = None,
+        tag_matches: dict | None = None,
+        limit: int = 20,
+    ) -> list[dict]:
+        """
+        Returns the objects of up to `limit` documents with tags equal to all
+        `filters` that either match the query or have a tag equal to one of
+        `tag_matches`. Tag matches come first, then documents matching more
+        of the query terms as whole tokens, then shorter documents.
+        """
+        filter_postings = [
+            self._tag_matches(field, value) for field, value in (filters or {}).items()
+        ]
+
+        def is_filtered(doc_id):
+            for doc_ids in filter_postings:
+                i = bisect_left(doc_ids, doc_id)
+                if i == len(doc_ids) or doc_ids[i] != doc_id:
+                    return False
+            return True
+
+        terms = [
+            (term, self._token_range(term)) for term in get_query_terms(query or "")
+        ]
+        if not terms:
+            candidates = (
+                min(filter_postings, key=len) if filter_postings else range(len(self))
+            )
+            return [
+                self.objects[doc_id]
+                for doc_id in islice(filter(is_filtered, candidates), limit)
+            ]
+
+        results = []
+        for field, value in (tag_matches or {}).items():
+            results.extend(
+                doc_id
+                for doc_id in self._tag_matches(field, value)
+                if is_filtered(doc_id) and doc_id not in results
+            )
+        results = results[:limit]
+
+        # the number of terms that can match a whole token
+        max_exact = sum(
+            1 for term, (lo, hi) in terms if lo < hi and self.vocabulary[lo] == term
+        )
+        # scan the documents of the rarest term, checking the others per document
+        scanned_term, scanned_range = min(
+            terms, key=lambda term: self._postings_size(*term)
+        )
+        ranked, top_ranked = [], 0
+        for doc_id in self._prefix_postings(scanned_term, scanned_range):
+            if top_ranked + len(results) >= limit:
+                # documents are scanned in order, nothing else can rank higher
+                break
+            if not is_filtered(doc_id) or doc_id in results:
+                continue
+            tokens = self.doc_tokens[doc_id]
+            exact = 0
+            for term, (lo, hi) in terms:
+                i = bisect_left(tokens, lo)
+                if i == len(tokens) or tokens[i] >= hi:
+                    break
+                if tokens[i] == lo and self.vocabulary[lo] == term:
+                    exact += 1
+            else:
+                ranked.append((-exact, doc_id))
+                top_ranked += exact == max_exact
+        results.extend(
+            doc_id for _, doc_id in heapq.nsmallest(limit - len(results), ranked)
+        )
+        return [self.objects[doc_id] for doc_id in results]
+
+    def _postings_size(self, term: str, token_range: tuple[int, int]) -> int:
+        if len(term) <= SHORT_PREFIX_LENGTH:
+            return len(self.short_prefix_postings.get(term, ()))
+        lo, hi = token_range
+        return sum(len(postings) for postings in self.postings[lo:hi])
+
+
+_indexes: dict[str, InMemorySearchIndex] = {}
+_indexes_lock = Lock()
+
+
+def get_search_index(
+    model: type[VersionedRedisModel],
+    get_documents: Callable[[], Iterable[Document]],
+) -> InMemorySearchIndex:
+    """
+    Returns the in-memory index of the model's dataset, (re)building it when
+    the worker has none yet or the active version of the model changed.
+    The current index keeps being served while redis is unreachable.
+    """
+    index = _indexes.get(model.__name__)
+    try:
+        version = model.get_active_version()
+    except RedisError:
+        if index is not None:
+            return index
+        version = None
+
+    if index is not None and index.version == version:
+        return index
+    with _indexes_lock:
+        index = _indexes.get(model.__name__)
+        if index is None or index.version != version:
+            started_at = time.perf_counter()
+            index = InMemorySearchIndex(get_documents(), version)
+            _indexes[model.__name__] = index
+            elapsed = time.perf_counter() - started_at
+            logger.info(
+                "Built in-memory search index of %s %s rows in %.2fs",
+                len(index),
+                model.__name__,
+                elapsed,
+            )
+            record_metric(f"StaticData/{model.__name__}/SearchIndexBuild", elapsed)
+    return index
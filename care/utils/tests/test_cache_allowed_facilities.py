@@ -0,0 +1,67 @@
+from django.test import TestCase
+
+from care.facility.models import FacilityUser
+from care.utils.cache.cache_allowed_facilities import (
+    get_accessible_facilities,
+    warm_accessible_facilities,
+)
+from care.utils.tests.test_utils import OverrideCache, TestUtils
+
+
+class AccessibleFacilitiesCacheTestCase(TestUtils, TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.state = cls.create_state()
+        cls.district = cls.create_district(cls.state)
+        cls.local_body = cls.create_local_body(cls.district)
+        cls.super_user = cls.create_super_user("su", cls.district)
+        cls.facility = cls.create_facility(cls.super_user, cls.district, cls.local_body)
+        cls.other_facility = cls.create_facility(
+            cls.super_user, cls.district, cls.local_body
+        )
+        cls.user = cls.create_user("staff", cls.district)
+        cls.link_user_with_facility(cls.user, cls.facility, cls.super_user)
+
+    def setUp(self) -> None:
+        override = OverrideCache(self)
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def test_facilities_are_cached(self):
+        self.assertEqual(get_accessible_facilities(self.user), [self.facility.id])
+        with self.assertNumQueries(0):
+            self.assertEqual(get_accessible_facilities(self.user), [self.facility.id])
+
+    def test_cache_is_invalidated_when_facilities_change(self):
+        get_accessible_facilities(self.user)
+
+        self.link_user_with_facility(self.user, self.other_facility, self.super_user)
+        self.assertCountEqual(
+            get_accessible_facilities(self.user),
+            [self.facility.id, self.other_facility.id],
+        )
+
+        FacilityUser.objects.filter(user=self.user, facility=self.facility).delete()
+        self.assertEqual(get_accessible_facilities(self.user), [self.other_facility.id])
+
+    def test_cache_is_invalidated_after_commit(self):
+        get_accessible_facilities(self.user)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            FacilityUser.objects.filter(user=self.user, facility=self.facility).delete()
+        # a concurrent request still reads the facilities until the commit, and
+        # what it caches is dropped by the commit
+        self.assertEqual(get_accessible_facilities(self.user), [self.facility.id])
+
+        for callback in callbacks:
+            callback()
+        self.assertEqual(get_accessible_facilities(self.user), [])
+
+    def test_warm_accessible_facilities(self):
+        self.assertEqual(warm_accessible_facilities(self.facility.id), 2)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_accessible_facilities(self.user), [self.facility.id])
+            self.assertCountEqual(
+                get_accessible_facilities(self.super_user),
+                [self.facility.id, self.other_facility.id],
+            )
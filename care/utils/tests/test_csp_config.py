@@ -0,0 +1,47 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.test import SimpleTestCase, override_settings
+
+from care.utils.csp.config import BucketType, get_client
+
+
+@override_settings(
+    FILE_UPLOAD_BUCKET="patient-bucket",
+    FILE_UPLOAD_BUCKET_ENDPOINT="http://localhost:4566",
+    FILE_UPLOAD_BUCKET_EXTERNAL_ENDPOINT="http://external.localhost:4566",
+    FACILITY_S3_BUCKET="facility-bucket",
+    FACILITY_S3_BUCKET_ENDPOINT="http://localhost:4566",
+    FACILITY_S3_BUCKET_EXTERNAL_ENDPOINT="http://localhost:4566",
+)
+class S3ClientTests(SimpleTestCase):
+    def test_client_is_reused(self):
+        client, bucket_name = get_client(BucketType.PATIENT)
+        self.assertEqual(bucket_name, "patient-bucket")
+        self.assertIs(get_client(BucketType.PATIENT)[0], client)
+
+    def test_clients_per_bucket_and_endpoint(self):
+        internal, _ = get_client(BucketType.PATIENT)
+        external, _ = get_client(BucketType.PATIENT, external=True)
+        facility, bucket_name = get_client(BucketType.FACILITY)
+
+        self.assertIsNot(internal, external)
+        self.assertIsNot(internal, facility)
+        self.assertEqual(bucket_name, "facility-bucket")
+        self.assertEqual(external.meta.endpoint_url, "http://external.localhost:4566")
+
+    def test_client_is_built_once_across_threads(self):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            clients = list(
+                executor.map(
+                    lambda _: get_client(BucketType.FACILITY, external=True)[0],
+                    range(32),
+                )
+            )
+        self.assertEqual(len({id(client) for client in clients}), 1)
+
+    def test_client_changes_with_settings(self):
+        client, _ = get_client(BucketType.PATIENT)
+        with override_settings(FILE_UPLOAD_BUCKET_ENDPOINT="http://minio:9000"):
+            other, _ = get_client(BucketType.PATIENT)
+        self.assertIsNot(client, other)
+        self.assertEqual(other.meta.endpoint_url, "http://minio:9000")
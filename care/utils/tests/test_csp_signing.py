@@ -0,0 +1,70 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+from care.utils.csp.config import BucketType, get_client
+from care.utils.csp.signing import get_read_signed_url, get_read_signed_urls
+from care.utils.tests.test_utils import OverrideCache
+
+
+@override_settings(
+    FILE_UPLOAD_BUCKET="patient-bucket",
+    FILE_UPLOAD_BUCKET_ENDPOINT="http://localhost:4566",
+    FILE_UPLOAD_BUCKET_EXTERNAL_ENDPOINT="http://localhost:4566",
+    FILE_UPLOAD_KEY="key",
+    FILE_UPLOAD_SECRET="secret",
+    FILE_UPLOAD_SIGNED_URL_CACHE_WINDOW=600,
+)
+class ReadSignedURLTests(SimpleTestCase):
+    def setUp(self):
+        override = OverrideCache(self)
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def sign(self, keys):
+        s3, _ = get_client(BucketType.PATIENT, external=True)
+        with patch.object(
+            s3, "generate_presigned_url", wraps=s3.generate_presigned_url
+        ) as generate_presigned_url:
+            urls = get_read_signed_urls(keys)
+        return urls, generate_presigned_url.call_count
+
+    def test_urls_are_signed_in_one_pass(self):
+        keys = [f"PATIENT/{i}.pdf" for i in range(5)]
+        urls, signed = self.sign(keys)
+        self.assertEqual(signed, 5)
+        self.assertEqual(urls.keys(), set(keys))
+        for key, url in urls.items():
+            self.assertIn("patient-bucket", url)
+            self.assertIn(key, url)
+
+    def test_urls_are_reused_within_the_window(self):
+        urls, _ = self.sign(["PATIENT/1.pdf", "PATIENT/2.pdf"])
+        cached_urls, signed = self.sign(
+            ["PATIENT/1.pdf", "PATIENT/2.pdf", "PATIENT/3.pdf"]
+        )
+        self.assertEqual(signed, 1)
+        self.assertEqual(cached_urls["PATIENT/1.pdf"], urls["PATIENT/1.pdf"])
+        self.assertEqual(get_read_signed_url("PATIENT/2.pdf"), urls["PATIENT/2.pdf"])
+
+    @override_settings(FILE_UPLOAD_SIGNED_URL_CACHE_WINDOW=0)
+    def test_urls_are_not_cached_without_a_window(self):
+        self.sign(["PATIENT/1.pdf"])
+        _, signed = self.sign(["PATIENT/1.pdf"])
+        self.assertEqual(signed, 1)
+
+    def test_urls_are_not_reused_for_another_bucket(self):
+        self.sign(["PATIENT/1.pdf"])
+        with override_settings(FILE_UPLOAD_BUCKET="other-bucket"):
+            urls, signed = self.sign(["PATIENT/1.pdf"])
+        self.assertEqual(signed, 1)
+        self.assertIn("other-bucket", urls["PATIENT/1.pdf"])
+
+    def test_urls_are_not_reused_for_another_endpoint(self):
+        self.sign(["PATIENT/1.pdf"])
+        with override_settings(
+            FILE_UPLOAD_BUCKET_EXTERNAL_ENDPOINT="http://127.0.0.1:4566"
+        ):
+            urls, signed = self.sign(["PATIENT/1.pdf"])
+        self.assertEqual(signed, 1)
+        self.assertIn("127.0.0.1:4566", urls["PATIENT/1.pdf"])
@@ -0,0 +1,80 @@
+import csv
+import io
+
+from django.test import TestCase
+from rest_framework.test import APITestCase
+
+from care.facility.models import Facility
+from care.facility.models.facility import REVERSE_FACILITY_TYPES
+from care.utils.csv_export import CSV_BOM, ChoiceLookup, iter_csv_rows
+from care.utils.tests.test_utils import TestUtils
+
+
+class ChoiceLookupTestCase(TestCase):
+    def test_lookup_without_default_is_strict(self):
+        lookup = ChoiceLookup({1: "One"})
+        self.assertEqual(lookup(1), "One")
+        self.assertEqual(lookup.serialize_column([1, 1]), ["One", "One"])
+        with self.assertRaises(KeyError):
+            lookup.serialize_column([2])
+
+    def test_lookup_with_default(self):
+        lookup = ChoiceLookup({1: "One"}, default="-")
+        self.assertEqual(lookup.serialize_column([1, 2]), ["One", "-"])
+
+
+class CSVExportTestCase(TestUtils, APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.state = cls.create_state()
+        cls.district = cls.create_district(cls.state)
+        cls.local_body = cls.create_local_body(cls.district)
+        cls.super_user = cls.create_super_user("su", cls.district)
+        cls.facilities = [
+            cls.create_facility(
+                cls.super_user, cls.district, cls.local_body, name=f"Facility {i}"
+            )
+            for i in range(5)
+        ]
+
+    def read_csv(self, chunks):
+        content = "".join(chunks)
+        self.assertTrue(content.startswith(CSV_BOM))
+        return list(csv.reader(io.StringIO(content.removeprefix(CSV_BOM))))
+
+    def test_export_is_streamed_in_chunks(self):
+        queryset = Facility.objects.order_by("id").values(*Facility.CSV_MAPPING.keys())
+        chunks = list(
+            iter_csv_rows(
+                queryset,
+                field_header_map=Facility.CSV_MAPPING,
+                field_serializer_map=Facility.CSV_MAKE_PRETTY,
+                chunk_size=2,
+            )
+        )
+        # header and three chunks of rows
+        self.assertEqual(len(chunks), 4)
+
+        rows = self.read_csv(chunks)
+        self.assertEqual(rows[0], list(Facility.CSV_MAPPING.values()))
+        self.assertEqual(
+            [row[0] for row in rows[1:]], [f"Facility {i}" for i in range(5)]
+        )
+        self.assertEqual(
+            rows[1][1], REVERSE_FACILITY_TYPES[self.facilities[0].facility_type]
+        )
+
+    def test_empty_values_are_blank(self):
+        queryset = Facility.objects.filter(id=self.facilities[0].id).values(
+            "name", "ward__name"
+        )
+        rows = self.read_csv(iter_csv_rows(queryset))
+        self.assertEqual(rows[1], ["Facility 0", ""])
+
+    def test_facility_list_export(self):
+        self.client.force_authenticate(self.super_user)
+        response = self.client.get("/api/v1/facility/?csv")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        rows = self.read_csv(chunk.decode() for chunk in response.streaming_content)
+        self.assertEqual(len(rows), 6)
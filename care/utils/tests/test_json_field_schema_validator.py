@@ -0,0 +1,29 @@
+from unittest.mock import patch
+
+from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase
+
+from care.facility.models.json_schema.daily_round import BLOOD_PRESSURE
+from care.utils.models.validators import JSONFieldSchemaValidator
+
+
+class JSONFieldSchemaValidatorTests(SimpleTestCase):
+    def test_schema_validator_is_built_once(self):
+        validator = JSONFieldSchemaValidator(BLOOD_PRESSURE)
+        with patch.object(
+            validator, "schema_validator_class", wraps=validator.schema_validator_class
+        ) as schema_validator_class:
+            for _ in range(3):
+                validator({"systolic": 120, "diastolic": 80})
+        schema_validator_class.assert_called_once_with(BLOOD_PRESSURE)
+
+    def test_invalid_value(self):
+        validator = JSONFieldSchemaValidator(BLOOD_PRESSURE)
+        validator({"systolic": 120, "diastolic": 80})
+        with self.assertRaises(ValidationError):
+            validator({"systolic": 500, "diastolic": 80})
+
+    def test_deconstruct_is_unchanged_after_use(self):
+        validator = JSONFieldSchemaValidator(BLOOD_PRESSURE)
+        validator({"systolic": 120, "diastolic": 80})
+        self.assertEqual(validator, JSONFieldSchemaValidator(BLOOD_PRESSURE))
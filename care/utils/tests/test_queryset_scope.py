@@ -0,0 +1,102 @@
+from django.db import connection
+from django.test import TestCase
+
+from care.users.models import User
+from care.utils.queryset.asset_bed import (
+    get_asset_bed_queryset,
+    get_asset_queryset,
+    get_bed_queryset,
+)
+from care.utils.queryset.asset_location import get_asset_location_queryset
+from care.utils.queryset.consultation import get_consultation_queryset
+from care.utils.queryset.facility import get_facility_queryset
+from care.utils.queryset.shifting import get_shifting_queryset
+from care.utils.tests.test_utils import TestUtils
+
+
+class QuerysetScopeTestCase(TestUtils, TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.state = cls.create_state()
+        cls.district = cls.create_district(cls.state)
+        cls.local_body = cls.create_local_body(cls.district)
+        cls.other_district = cls.create_district(cls.state)
+        cls.other_local_body = cls.create_local_body(cls.other_district)
+        cls.super_user = cls.create_super_user("su", cls.district)
+
+        cls.facility = cls.create_facility(cls.super_user, cls.district, cls.local_body)
+        cls.other_facility = cls.create_facility(
+            cls.super_user, cls.other_district, cls.other_local_body
+        )
+        cls.beds = {}
+        cls.consultations = {}
+        for facility in (cls.facility, cls.other_facility):
+            location = cls.create_asset_location(facility)
+            cls.beds[facility.id] = cls.create_bed(facility, location)
+            cls.create_asset_bed(cls.create_asset(location), cls.beds[facility.id])
+            patient = cls.create_patient(facility.district, facility)
+            cls.consultations[facility.id] = cls.create_consultation(patient, facility)
+
+        cls.nurse = cls.create_user("nurse", cls.district, home_facility=cls.facility)
+        cls.district_admin = cls.create_user(
+            "district_admin",
+            cls.other_district,
+            user_type=User.TYPE_VALUE_MAP["DistrictAdmin"],
+        )
+        cls.state_admin = cls.create_user(
+            "state_admin",
+            cls.district,
+            user_type=User.TYPE_VALUE_MAP["StateAdmin"],
+        )
+
+    def get_scoped_querysets(self, user):
+        return [
+            get_facility_queryset(user),
+            get_bed_queryset(user),
+            get_asset_bed_queryset(user),
+            get_asset_queryset(user),
+            get_asset_location_queryset(user),
+            get_consultation_queryset(user),
+            get_shifting_queryset(user),
+        ]
+
+    def test_beds_are_scoped_to_the_user(self):
+        self.assertCountEqual(
+            get_bed_queryset(self.nurse), [self.beds[self.facility.id]]
+        )
+        self.assertCountEqual(
+            get_bed_queryset(self.district_admin), [self.beds[self.other_facility.id]]
+        )
+        self.assertCountEqual(get_bed_queryset(self.state_admin), self.beds.values())
+        self.assertCountEqual(get_bed_queryset(self.super_user), self.beds.values())
+
+    def test_consultations_are_scoped_to_the_user(self):
+        self.assertCountEqual(
+            get_consultation_queryset(self.nurse),
+            [self.consultations[self.facility.id]],
+        )
+        self.assertCountEqual(
+            get_consultation_queryset(self.district_admin),
+            [self.consultations[self.other_facility.id]],
+        )
+        self.assertCountEqual(
+            get_consultation_queryset(self.state_admin), self.consultations.values()
+        )
+
+    def test_facility_scope_is_a_subquery(self):
+        for queryset in (
+            get_facility_queryset(self.nurse),
+            get_consultation_queryset(self.nurse),
+            get_shifting_queryset(self.nurse),
+        ):
+            with self.subTest(model=queryset.model.__name__):
+                self.assertIn("facility_facilityuser", str(queryset.query))
+
+    def test_scoped_querysets_do_not_scan_tables(self):
+        for user in (self.nurse, self.district_admin, self.state_admin):
+            for queryset in self.get_scoped_querysets(user):
+                with self.subTest(user=user.username, model=queryset.model.__name__):
+                    with connection.cursor() as cursor:
+                        # a sequential scan is only planned when no index fits
+                        cursor.execute("SET LOCAL enable_seqscan = off")
+                    self.assertNotIn("Seq Scan", queryset.explain())
@@ -0,0 +1,61 @@
+import base64
+import os
+
+import requests_mock
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+from django.test import TestCase
+
+from care.utils.tests.test_utils import TestUtils
+from care.utils.webpush import (
+    EXPIRED,
+    FAILED,
+    SENT,
+    deliver_webpushes,
+    get_subscription_info,
+)
+
+
+def b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+class WebPushTestCase(TestUtils, TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.state = cls.create_state()
+        cls.district = cls.create_district(cls.state)
+        cls.users = []
+        for name in ("active", "expired", "failing"):
+            public_key = ec.generate_private_key(ec.SECP256R1()).public_key()
+            cls.users.append(
+                cls.create_user(
+                    name,
+                    cls.district,
+                    pf_endpoint=f"https://push.example.com/{name}",
+                    pf_p256dh=b64encode(
+                        public_key.public_bytes(
+                            Encoding.X962, PublicFormat.UncompressedPoint
+                        )
+                    ),
+                    pf_auth=b64encode(os.urandom(16)),
+                )
+            )
+
+    @requests_mock.Mocker()
+    def test_deliver_webpushes(self, mock_push_service):
+        mock_push_service.post("https://push.example.com/active", status_code=201)
+        mock_push_service.post("https://push.example.com/expired", status_code=410)
+        mock_push_service.post("https://push.example.com/failing", status_code=500)
+
+        counts = deliver_webpushes(
+            [(get_subscription_info(user), "message") for user in self.users]
+        )
+
+        self.assertEqual(counts, {SENT: 1, EXPIRED: 1, FAILED: 1})
+        active, expired, failing = self.users
+        for user in self.users:
+            user.refresh_from_db()
+        self.assertIsNotNone(get_subscription_info(active))
+        self.assertIsNone(get_subscription_info(expired))
+        self.assertIsNotNone(get_subscription_info(failing))
@@ -0,0 +1,109 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+
+import requests
+from django.conf import settings
+from py_vapid import Vapid
+from pywebpush import WebPushException, webpush
+from requests.adapters import HTTPAdapter
+
+from care.users.models import User
+from care.utils.metrics import record_metric
+
+logger = logging.getLogger(__name__)
+
+VAPID_SUBJECT = "mailto:info@ohc.network"
+# the push service no longer knows the subscription, it will never be valid again
+EXPIRED_SUBSCRIPTION_STATUSES = (404, 410)
+
+SENT = "sent"
+EXPIRED = "expired"
+FAILED = "failed"
+
+
+@cache
+def get_vapid() -> Vapid:
+    return Vapid.from_string(private_key=settings.VAPID_PRIVATE_KEY)
+
+
+@cache
+def get_session() -> requests.Session:
+    """
+    Returns the session shared by the deliveries of this process, so that
+    connections to the push services are reused across pushes and batches.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=settings.WEBPUSH_CONCURRENCY,
+        pool_maxsize=settings.WEBPUSH_CONCURRENCY,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_subscription_info(user: User) -> dict | None:
+    if user.pf_endpoint and user.pf_p256dh and user.pf_auth:
+        return {
+            "endpoint": user.pf_endpoint,
+            "keys": {"p256dh": user.pf_p256dh, "auth": user.pf_auth},
+        }
+    return None
+
+
+def deliver_webpush(subscription_info: dict, message: str) -> str:
+    """
+    Sends a web push, returns whether it was sent, failed or the subscription
+    has expired.
+    """
+    try:
+        webpush(
+            subscription_info=subscription_info,
+            data=message,
+            vapid_private_key=get_vapid(),
+            # webpush fills in the audience of the endpoint, so a fresh dict
+            vapid_claims={"sub": VAPID_SUBJECT},
+            timeout=settings.WEBPUSH_TIMEOUT,
+            requests_session=get_session(),
+        )
+    except WebPushException as ex:
+        status_code = getattr(ex.response, "status_code", None)
+        if status_code in EXPIRED_SUBSCRIPTION_STATUSES:
+            return EXPIRED
+        logger.info("Web Push Failed with Exception: %s", repr(ex))
+        return FAILED
+    except Exception as e:
+        logger.info("Error When Doing WebPush: %s", e)
+        return FAILED
+    return SENT
+
+
+def deliver_webpushes(pushes: list[tuple[dict, str]]) -> dict[str, int]:
+    """
+    Sends the (subscription info, message) pushes concurrently, with at most
+    WEBPUSH_CONCURRENCY requests in flight, and clears the subscriptions that
+    have expired from their users. Returns the number of pushes per outcome.
+    """
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=settings.WEBPUSH_CONCURRENCY) as executor:
+        results = list(executor.map(lambda push: deliver_webpush(*push), pushes))
+
+    expired_endpoints = {
+        subscription_info["endpoint"]
+        for (subscription_info, _), result in zip(pushes, results, strict=True)
+        if result == EXPIRED
+    }
+    if expired_endpoints:
+        User.objects.filter(pf_endpoint__in=expired_endpoints).update(
+            pf_endpoint=None, pf_p256dh=None, pf_auth=None
+        )
+
+    counts = {outcome: results.count(outcome) for outcome in (SENT, EXPIRED, FAILED)}
+    record_metric("WebPush/BatchDuration", time.perf_counter() - started_at)
+    record_metric("WebPush/BatchSize", len(pushes))
+    record_metric("WebPush/Sent", counts[SENT])
+    record_metric("WebPush/Expired", counts[EXPIRED])
+    record_metric("WebPush/Failed", counts[FAILED])
+    return counts
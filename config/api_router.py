@@ -33,6 +33,7 @@ from care.facility.api.viewsets.events import (
     EventTypeViewSet,
     PatientConsultationEventViewSet,
 )
+from care.facility.api.viewsets.export_job import ExportJobViewSet
 from care.facility.api.viewsets.facility import (
     AllFacilityViewSet,
     FacilityHubsViewSet,
@@ -122,6 +123,7 @@ router.register("local_body", LocalBodyViewSet, basename="local-body")
 router.register("ward", WardViewSet, basename="ward")
 
 router.register("files", FileUploadViewSet, basename="files")
+router.register("export_jobs", ExportJobViewSet, basename="export-jobs")
 
 router.register("ambulance", AmbulanceViewSet, basename="ambulance")
 
@@ -462,6 +462,14 @@ HEALTHY_DJANGO = [
 # Audit logs
 # ------------------------------------------------------------------------------
 AUDIT_LOG_ENABLED = env.bool("AUDIT_LOG_ENABLED", default=False)
+# care.audit_log.sinks.LoggerSink logs the changes as AUDIT_LOG:: lines,
+# care.audit_log.sinks.FileSink appends them as JSON lines to AUDIT_LOG_FILE
+AUDIT_LOG_SINK = env("AUDIT_LOG_SINK", default="care.audit_log.sinks.LoggerSink")
+AUDIT_LOG_FILE = env("AUDIT_LOG_FILE", default=str(BASE_DIR / "audit_log.jsonl"))
+# changes are written in a batch per request by a background thread, batches
+# are dropped while AUDIT_LOG_QUEUE_SIZE batches are waiting to be written
+AUDIT_LOG_ASYNC = env.bool("AUDIT_LOG_ASYNC", default=True)
+AUDIT_LOG_QUEUE_SIZE = env.int("AUDIT_LOG_QUEUE_SIZE", default=1000)
 AUDIT_LOG = {
     "globals": {
         "exclude": {
@@ -508,6 +516,13 @@ ICD_SCRAPER_CHILD_CONCEPTS_URL = (
     "https://icd.who.int/browse11/l-m/en/JsonGetChildrenConcepts"
 )
 
+# Static Data
+# ------------------------------------------------------------------------------
+# rows fetched per cursor round trip and written per redis pipeline
+STATIC_DATA_LOAD_BATCH_SIZE = env.int("STATIC_DATA_LOAD_BATCH_SIZE", default=5000)
+# "redis" searches the RediSearch indexes, "memory" an index built in each worker
+STATIC_DATA_SEARCH_BACKEND = env("STATIC_DATA_SEARCH_BACKEND", default="redis")
+
 # Rate Limiting
 # ------------------------------------------------------------------------------
 DISABLE_RATELIMIT = env.bool("DISABLE_RATELIMIT", default=False)
@@ -529,6 +544,9 @@ VAPID_PUBLIC_KEY = env(
 VAPID_PRIVATE_KEY = env(
     "VAPID_PRIVATE_KEY", default="7mf3OFreFsgFF4jd8A71ZGdVaj8kpJdOto4cFbfAS-s"
 )
+# concurrent requests and request timeout (in seconds) of web push deliveries
+WEBPUSH_CONCURRENCY = env.int("WEBPUSH_CONCURRENCY", default=10)
+WEBPUSH_TIMEOUT = env.float("WEBPUSH_TIMEOUT", default=10)
 SEND_SMS_NOTIFICATION = False
 NOTIFICATION_RETENTION_DAYS = env.int("NOTIFICATION_RETENTION_DAYS", default=30)
 
@@ -560,6 +578,10 @@ FILE_UPLOAD_BUCKET_EXTERNAL_ENDPOINT = env(
         BUCKET_EXTERNAL_ENDPOINT if BUCKET_ENDPOINT else FILE_UPLOAD_BUCKET_ENDPOINT
     ),
 )
+# signed download urls are reused for this many seconds, 0 signs every request
+FILE_UPLOAD_SIGNED_URL_CACHE_WINDOW = env.int(
+    "FILE_UPLOAD_SIGNED_URL_CACHE_WINDOW", default=10 * 60
+)
 
 ALLOWED_MIME_TYPES = env.list(
     "ALLOWED_MIME_TYPES",
@@ -650,6 +672,8 @@ TASK_SUMMARIZE_PATIENT = env.bool("TASK_SUMMARIZE_PATIENT", default=True)
 TASK_SUMMARIZE_DISTRICT_PATIENT = env.bool(
     "TASK_SUMMARIZE_DISTRICT_PATIENT", default=True
 )
+# Only recompute summaries of facilities / districts that changed since the last run
+TASK_SUMMARIZE_INCREMENTAL = env.bool("TASK_SUMMARIZE_INCREMENTAL", default=True)
 
 # Timeout for middleware request (in seconds)
 MIDDLEWARE_REQUEST_TIMEOUT = env.int("MIDDLEWARE_REQUEST_TIMEOUT", 20)